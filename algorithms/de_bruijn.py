@@ -0,0 +1,377 @@
+# =============================================================================
+# Created By  : Dominique Zeise
+# GitHub      : https://github.com/CharliesCodes
+# Created Date: 2026/10/18
+# Version     : 1.0
+# © Copyright : 2026 Dominique Zeise
+# =============================================================================
+"""
+De Bruijn Graph Assembly
+
+
+This module assembles reads without aligning them.
+Every k-mer of the reads is stored as a 2 bit packed
+integer (k <= 31) and counted. Each k-mer is an edge from its
+first k - 1 bases to its last k - 1 bases, so reads become
+paths through the graph of all (k - 1)-mers.
+Paths without branches (unitigs) are compacted into contigs.
+Reads may come from both strands: every k-mer is counted
+together with its reverse complement (canonical k-mers), and
+the graph holds both orientations.
+Optionally a count-min sketch (kmer_sketch) keeps rare k-mers
+out of the exact table, so reads with many errors need less memory.
+Batches are merged into the table only once they are as big
+as the table, so the counting time grows like n log n with
+the total read length.
+"""
+# =============================================================================
+
+import tracemalloc
+
+import numpy as np
+
+try:
+    import sequence_encoding as se
+except ImportError:
+    print(
+        "Sequence Encoding not found!\nPlease copy file 'sequence_encoding.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import kmer_sketch as ks
+except ImportError:
+    print(
+        "K-mer Sketch not found!\nPlease copy file 'kmer_sketch.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+
+KMER_SIZE = 21
+# k-mers seen less often are dropped (sequencing errors)
+MIN_COUNT = 2
+# reads per numpy step of count_kmers
+BATCH_SIZE = 4096
+# count a k-mer and its reverse complement together (both strands)
+CANONICAL = True
+COMPLEMENT = str.maketrans("ACGT", "TGCA")
+# (shift, mask) swapping neighboring blocks of 2, 4, ... 32 bits
+REVERSE_MASKS = [
+    (np.uint64(shift), np.uint64(mask))
+    for shift, mask in (
+        (2, 0x3333333333333333),
+        (4, 0x0F0F0F0F0F0F0F0F),
+        (8, 0x00FF00FF00FF00FF),
+        (16, 0x0000FFFF0000FFFF),
+        (32, 0x00000000FFFFFFFF),
+    )
+]
+
+
+def kmer_ids(codes, k):
+    """packs every k-mer of a DNA code array into one integer,
+    2 bits per base. K-mers with other characters are dropped.
+
+    Args:
+        codes (numpy array): codes of the read
+        k (int): k-mer length (max 31)
+
+    Returns:
+        numpy array: uint64 k-mer ids
+    """
+    count = max(len(codes) - k + 1, 0)
+    ids = np.zeros(count, dtype="uint64")
+    for j in range(k):
+        ids = (ids << np.uint64(2)) | (codes[j : j + count] & 3)
+    invalid = np.concatenate(([0], np.cumsum(codes >= 4)))
+    return ids[invalid[k : k + count] == invalid[:count]]
+
+
+def reverse_complement_ids(kmers, k):
+    """k-mer ids of the reverse complements - the 2 bit bases
+    are reversed by swapping ever bigger blocks of bits
+
+    Args:
+        kmers (numpy array): uint64 k-mer ids
+        k (int): k-mer length
+
+    Returns:
+        numpy array: uint64 k-mer ids
+    """
+    # complement: A <-> T, C <-> G is 3 - code = inverted bits
+    reverse = ~kmers
+    for shift, mask in REVERSE_MASKS:
+        reverse = ((reverse >> shift) & mask) | ((reverse & mask) << shift)
+    # the unused high bits are now the low bits
+    return reverse >> np.uint64(64 - 2 * k)
+
+
+def merge_counts(runs):
+    """adds up the counts of several counted k-mer runs
+
+    Args:
+        runs (list): (k-mer ids, counts) tuples
+
+    Returns:
+        tuple: (sorted unique k-mer ids, counts)
+    """
+    all_kmers = np.concatenate([kmers for kmers, _ in runs])
+    all_counts = np.concatenate([counts for _, counts in runs])
+    if not len(all_kmers):
+        return all_kmers, all_counts
+    order = np.argsort(all_kmers, kind="stable")
+    all_kmers, all_counts = all_kmers[order], all_counts[order]
+    is_new = np.concatenate(([True], all_kmers[1:] != all_kmers[:-1]))
+    starts = np.flatnonzero(is_new)
+    return all_kmers[starts], np.add.reduceat(all_counts, starts)
+
+
+def count_kmers(
+    reads,
+    k=KMER_SIZE,
+    batch_size=BATCH_SIZE,
+    sketch=None,
+    min_count=1,
+    canonical=CANONICAL,
+):
+    """counts all k-mers of the reads batch by batch and
+    measures the peak memory of the counting. With a sketch,
+    every k-mer is counted there first - only k-mers reaching
+    min_count in the sketch are stored in the exact table. A
+    k-mer entering the table starts with its sketch count, so
+    its earlier occurrences are not lost.
+
+    Args:
+        reads (iterable): strings or encoded reads (without sentinel)
+        k (int, optional): k-mer length. Defaults to KMER_SIZE.
+        batch_size (int, optional): reads per numpy step.
+        Defaults to BATCH_SIZE.
+        sketch (numpy matrix, optional): count-min sketch, see
+        kmer_sketch. Defaults to None (exact counts only).
+        min_count (int, optional): sketch count of a stored k-mer.
+        Defaults to 1.
+        canonical (bool, optional): count the smaller id of a k-mer
+        and its reverse complement. Defaults to CANONICAL.
+
+    Returns:
+        kmers (numpy array): sorted unique k-mer ids (uint64)
+        counts (numpy array): count of each k-mer - with a sketch
+        an estimate (never smaller than the true count)
+        peak_memory (int): peak bytes allocated while counting
+    """
+    if not 0 < k <= 31:
+        raise ValueError(f"k-mer length {k} does not fit into 64 bits")
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    kmers = np.zeros(0, dtype="uint64")
+    counts = np.zeros(0, dtype="int64")
+    # counted batches not merged into the table yet
+    pending, pending_size = [], 0
+    reads = iter(reads)
+    while True:
+        batch = [se.as_codes(read) for _, read in zip(range(batch_size), reads)]
+        if not batch:
+            break
+        # the sentinel between the reads drops k-mers spanning two reads
+        separator = np.array([se.SENTINEL_CODE], dtype="uint8")
+        codes = np.concatenate([part for read in batch for part in (read, separator)])
+        ids = kmer_ids(codes, k)
+        if canonical:
+            ids = np.minimum(ids, reverse_complement_ids(ids, k))
+        new_kmers, new_counts = np.unique(ids, return_counts=True)
+        if sketch is not None:
+            passed_before = ks.estimate(sketch, new_kmers) >= min_count
+            ks.add_kmers(sketch, np.repeat(new_kmers, new_counts))
+            estimates = ks.estimate(sketch, new_kmers).astype("int64")
+            solid = estimates >= min_count
+            # k-mers passing now for the first time bring their sketch count
+            new_counts = np.where(passed_before, new_counts, estimates)
+            new_kmers, new_counts = new_kmers[solid], new_counts[solid]
+        pending.append((new_kmers, new_counts))
+        pending_size += len(new_kmers)
+        # merging only when the batches are as big as the table keeps
+        # the number of merges per k-mer logarithmic
+        if pending_size >= len(kmers):
+            kmers, counts = merge_counts([(kmers, counts)] + pending)
+            pending, pending_size = [], 0
+    if pending:
+        kmers, counts = merge_counts([(kmers, counts)] + pending)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    if not was_tracing:
+        tracemalloc.stop()
+    return kmers, counts, peak_memory
+
+
+def find_successors(kmers, k):
+    """links every k-mer to the next k-mer of its unitig.
+    Edge a -> b continues a unitig, if it is the only edge
+    leaving the end node of a and the only edge entering it.
+
+    Args:
+        kmers (numpy array): sorted unique k-mer ids
+        k (int): k-mer length
+
+    Returns:
+        numpy array: index of the next k-mer per k-mer, -1 at
+        the end of a unitig
+    """
+    node_mask = np.uint64((1 << (2 * (k - 1))) - 1)
+    # k-mers are sorted, so k-mers with the same start node are neighbors
+    start_nodes = kmers >> np.uint64(2)
+    end_nodes = kmers & node_mask
+    first = np.searchsorted(start_nodes, end_nodes, side="left")
+    out_degree = np.searchsorted(start_nodes, end_nodes, side="right") - first
+    sorted_ends = np.sort(end_nodes)
+    in_degree = np.searchsorted(sorted_ends, end_nodes, side="right")
+    in_degree -= np.searchsorted(sorted_ends, end_nodes, side="left")
+    successors = np.where((out_degree == 1) & (in_degree == 1), first, -1)
+    # a k-mer following itself (e.g. AAAA) is a unitig of its own
+    successors[successors == np.arange(len(kmers))] = -1
+    return successors
+
+
+def compact_unitigs(kmers, successors, k):
+    """walks along the successors and joins the k-mers of
+    every unitig to one contig
+
+    Args:
+        kmers (numpy array): sorted unique k-mer ids
+        successors (numpy array): see find_successors
+        k (int): k-mer length
+
+    Returns:
+        list: contigs, longest first
+    """
+    has_predecessor = np.zeros(len(kmers), dtype=bool)
+    has_predecessor[successors[successors >= 0]] = True
+    # last base of every k-mer
+    last_bases = se.decode((kmers & np.uint64(3)).astype("uint8"))
+    successors = successors.tolist()
+    visited = np.zeros(len(kmers), dtype=bool)
+    contigs = []
+    # unitig starts first, then the remaining cycles
+    starts = np.concatenate(
+        (np.flatnonzero(~has_predecessor), np.flatnonzero(has_predecessor))
+    )
+    for start in starts.tolist():
+        if visited[start]:
+            continue
+        path = [start]
+        visited[start] = True
+        current = successors[start]
+        while current != -1 and not visited[current]:
+            visited[current] = True
+            path.append(current)
+            current = successors[current]
+        contig = decode_kmer(int(kmers[start]), k)
+        contigs.append(contig + "".join(last_bases[i] for i in path[1:]))
+    contigs.sort(key=len, reverse=True)
+    return contigs
+
+
+def decode_kmer(kmer, k):
+    """turns a packed k-mer id back into a string
+
+    Args:
+        kmer (int): k-mer id
+        k (int): k-mer length
+
+    Returns:
+        str: k-mer
+    """
+    shifts = 2 * np.arange(k - 1, -1, -1, dtype="uint64")
+    return se.decode(((np.uint64(kmer) >> shifts) & np.uint64(3)).astype("uint8"))
+
+
+def remove_reverse_complements(contigs):
+    """keeps only the first orientation of every contig
+
+    Args:
+        contigs (list): contigs
+
+    Returns:
+        list: contigs without the reverse complements of earlier ones
+    """
+    kept, seen = [], set()
+    for contig in contigs:
+        if contig[::-1].translate(COMPLEMENT) not in seen:
+            seen.add(contig)
+            kept.append(contig)
+    return kept
+
+
+def assemble(
+    reads, k=KMER_SIZE, min_count=MIN_COUNT, sketch_memory=None, canonical=CANONICAL
+):
+    """assembles the reads into contigs
+
+    Args:
+        reads (iterable): strings or encoded reads (without sentinel)
+        k (int, optional): k-mer length. Defaults to KMER_SIZE.
+        min_count (int, optional): k-mers seen less often are
+        dropped. Defaults to MIN_COUNT.
+        sketch_memory (int, optional): bytes of a count-min sketch
+        filtering rare k-mers before the exact counting - k-mers
+        reaching min_count in the sketch are kept. Collisions only
+        let too many k-mers pass (false positives), no real k-mer
+        is lost. Defaults to None (no sketch).
+        canonical (bool, optional): reads from both strands - every
+        contig is returned in one orientation only. Defaults to CANONICAL.
+
+    Returns:
+        contigs (list): contigs, longest first
+        stats (dict): peak_memory (bytes) of the k-mer counting,
+        false_positive_rate of the sketch (None without sketch)
+    """
+    sketch = None
+    if sketch_memory is not None:
+        sketch = ks.create_sketch(sketch_memory)
+    kmers, counts, peak_memory = count_kmers(
+        reads, k, sketch=sketch, min_count=min_count, canonical=canonical
+    )
+    # the sketch already kept only k-mers reaching min_count
+    if sketch is None:
+        kmers = kmers[counts >= min_count]
+    if canonical:
+        # the graph needs both orientations of every k-mer
+        kmers = np.union1d(kmers, reverse_complement_ids(kmers, k))
+    successors = find_successors(kmers, k)
+    stats = {
+        "peak_memory": peak_memory,
+        "false_positive_rate": (
+            None if sketch is None else ks.false_positive_rate(sketch, min_count)
+        ),
+    }
+    contigs = compact_unitigs(kmers, successors, k)
+    if canonical:
+        contigs = remove_reverse_complements(contigs)
+    return contigs, stats
+
+
+def output(stats):
+    """prints the statistics of the k-mer counting
+
+    Args:
+        stats (dict): see assemble
+    """
+    print(f"Peak memory of the k-mer counting: {stats['peak_memory'] / 1024:.1f} KiB")
+    if stats["false_positive_rate"] is not None:
+        print(f"False positive rate of the sketch: {stats['false_positive_rate']:.4f}")
+
+
+def main(reads=None, k=KMER_SIZE, min_count=MIN_COUNT, sketch_memory=None):
+    # change sequences below for your needs!
+    if reads is None:
+        rng = np.random.default_rng(1)
+        origin = "".join(rng.choice(list("ACGT"), 1000))
+        starts = rng.integers(0, len(origin) - 100, 200)
+        reads = [origin[start : start + 100] for start in starts]
+    contigs, stats = assemble(reads, k, min_count, sketch_memory)
+    output(stats)
+    print(f"{len(contigs)} contigs, longest {len(contigs[0]) if contigs else 0}")
+    for contig in contigs[:5]:
+        print(contig)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,13 +14,48 @@ de novo transcriptome without a reference genome.
 Dependencies: Free-Shift Alignment Module"""
 # =============================================================================
 
-import random
+import numpy as np
 
 try:
-    import free_shift_alignment as fsa
+    import sequence_encoding as se
 except ImportError:
     print(
-        "Free-Shift Alignment not found!\nPlease copy file 'free_shift_alignment.py' into the same directory!\nVisit my GitHub page to download it."
+        "Sequence Encoding not found!\nPlease copy file 'sequence_encoding.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import greedy_assembly as ga
+except ImportError:
+    print(
+        "Greedy Assembly not found!\nPlease copy file 'greedy_assembly.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import de_bruijn as db
+except ImportError:
+    print(
+        "De Bruijn Graph not found!\nPlease copy file 'de_bruijn.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import string_graph as sg
+except ImportError:
+    print(
+        "String Graph not found!\nPlease copy file 'string_graph.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import sequence_io as sio
+except ImportError:
+    print(
+        "Sequence IO not found!\nPlease copy file 'sequence_io.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import read_simulator as rs
+except ImportError:
+    print(
+        "Read Simulator not found!\nPlease copy file 'read_simulator.py' into the same directory!\nVisit my GitHub page to download it."
     )
 
 
@@ -30,89 +65,73 @@ SUBSEQ_NUM = 200
 ASSEMBLY_MAXLEN = 100
 
 
-def create_seqparts():
+def create_seqparts(rng=None):
     """This func generates random sets of sequenceparts
     and wraps them into one big, sorted list
 
+    Args:
+        rng (numpy Generator or int, optional): random generator or
+        seed. Defaults to None (new unseeded generator).
+
     Returns:
         [list]: len decreasing sorted list of substrings with random parts from origin
     """
-    seqparts = []
-    for _ in range(SUBSEQ_NUM):
-        rand = random.randint(MINLEN, MAXLEN)
-        subseq = "".join(random.choice(["A", "T", "C", "G"]) for x in range(rand))
-        seqparts.append(subseq)
+    rng = np.random.default_rng(rng)
+    seqparts = rs.random_sequences(SUBSEQ_NUM, MINLEN, MAXLEN, rng)
+    seqparts = [se.decode(codes) for codes in seqparts]
     # sorting not needed - just for the sake of clarity
     seqparts.sort(key=len)
     return seqparts
 
 
-def get_unique_seqparts(seqparts):
-    """This func generates a list of unique sequences
-
-    Args:
-        seqparts (list): strings of unordered, ununique sequence parts
-
-    Returns:
-        list: unique sequence parts - order: size decreasing
-    """
-    seqparts = list(set(seqparts))
-
-    seqparts.sort(key=len, reverse=True)
-    unique_seqparts = []
-    # remove all sequences that are part of any other sequence
-    for substring in seqparts:
-        if not any(substring in string for string in unique_seqparts):
-            unique_seqparts.append(substring)
-    return unique_seqparts
-
-
-def mapping(seqparts):
-    """assembles the best fitting sequence into
-    one big sequence. Requires Free-Shift-Alignment
-    to find best fit. Starting with biggest Sequencepart,
-    it itterates over all other parts (size decreasing order).
-    Stores scores for fit in tuple and merges highest fitting
-    sequence. Repeating the procedure untill seqparts list is
-    empty or the ASSEMBLY_MAXLEN limit is reached
+def mapping(seqparts, workers=1, max_len=ASSEMBLY_MAXLEN):
+    """assembles the sequence parts with the greedy
+    assembly, see greedy_assembly
 
     Args:
-        seqparts (list): strings with random generated sequences
+        seqparts (list): strings or encoded sequences
         Order: decreasing length
+        workers (int, optional): processes aligning the parts.
+        Defaults to 1.
+        max_len (int, optional): stop length of the assembled
+        sequence. Defaults to ASSEMBLY_MAXLEN.
 
     Returns:
         str: Assembled Sequence
     """
-    seqparts = ["," + seq for seq in seqparts]
-    # set longest (first) list element as main sequence and remove it from list
-    main_seq = seqparts.pop(0)
     # assembly start sequence
-    print("Startsequence:", main_seq)
-    while seqparts and (len(main_seq) <= ASSEMBLY_MAXLEN):
-        fragments = []
-        for parts_index, seq2 in enumerate(seqparts):
-            # use imported smith-waterman algorithm without output function
-            sim_tup, main_seq_new = fsa.main(main_seq, seq2, True)
-            if 0.9 * len(seq2) >= sim_tup[0] > 0.2 * len(seq2):
-                fragments.append((sim_tup[0], main_seq_new, parts_index))
-        if fragments:
-            sorted_frags = sorted(fragments, key=lambda tup: tup[0], reverse=True)
-            main_seq = sorted_frags[0][1]
-            main_seq = "," + main_seq
-        try:
-            del seqparts[sorted_frags[0][2]]
-        except:
-            print("An exception occurred! No fitting part found")
-
-    return main_seq
-
-
-def main():
-    seqparts = create_seqparts()
-    seqparts = get_unique_seqparts(seqparts)
-    assembly_sequence = mapping(seqparts)
-    print("\nAssemblierte Sequenz")
-    print(assembly_sequence)
+    print("Startsequence:", se.with_sentinel(se.as_string(seqparts[0])))
+    return ga.assemble(seqparts, max_len, workers)
+
+
+def main(
+    path=None, max_len=ASSEMBLY_MAXLEN, mode="greedy", sketch_memory=None, seed=None
+):
+    # path: FASTA/ FASTQ file (plain or gzip) with the reads
+    # mode: "greedy" (alignments), "de bruijn" or "string graph"
+    # sketch_memory: bytes of the k-mer sketch of the "de bruijn" mode
+    # seed: seed of the random demo data (None -> new data every run)
+    if path is None:
+        seqparts = create_seqparts(seed)
+        # short random parts -> short k-mers, every k-mer counts
+        k, min_count = MINLEN, 1
+    else:
+        seqparts = sio.read_sequences(path)
+        k, min_count = db.KMER_SIZE, db.MIN_COUNT
+    if mode == "de bruijn":
+        contigs, stats = db.assemble(seqparts, k, min_count, sketch_memory)
+        db.output(stats)
+    elif mode == "string graph":
+        contigs = sg.assemble(seqparts, min(k, sg.KMER_SIZE))
+    else:
+        seqparts = ga.get_unique_seqparts(seqparts)
+        assembly_sequence = mapping(seqparts, max_len=max_len)
+        print("\nAssemblierte Sequenz")
+        print(assembly_sequence)
+        return
+    print("\nContigs")
+    for contig in contigs:
+        print(contig)
 
 
 if __name__ == "__main__":
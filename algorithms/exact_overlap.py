@@ -0,0 +1,112 @@
+# =============================================================================
+# Created By  : Dominique Zeise
+# GitHub      : https://github.com/CharliesCodes
+# Created Date: 2026/10/18
+# Version     : 1.0
+# © Copyright : 2026 Dominique Zeise
+# =============================================================================
+"""
+Exact Overlap
+
+
+This module finds error free suffix/ prefix overlaps of two
+sequences with the prefix function of the Knuth-Morris-Pratt
+algorithm - linear time instead of a whole scorematrix.
+Sequences without a common k-mer can not have a good overlap
+at all, so the assembly algorithms only align the remaining pairs.
+"""
+# =============================================================================
+
+MIN_OVERLAP = 5
+KMER_SIZE = 3
+
+
+def prefix_function(seq):
+    """calculates the prefix function (KMP failure function).
+    Value i is the length of the longest proper prefix of
+    seq[: i + 1], which is also its suffix.
+
+    Args:
+        seq (str): sequence
+
+    Returns:
+        list: prefix function values
+    """
+    values = [0] * len(seq)
+    for i in range(1, len(seq)):
+        k = values[i - 1]
+        while k > 0 and seq[i] != seq[k]:
+            k = values[k - 1]
+        if seq[i] == seq[k]:
+            k += 1
+        values[i] = k
+    return values
+
+
+def suffix_prefix_overlap(seq1, seq2):
+    """length of the longest suffix of seq1,
+    which is also a prefix of seq2
+
+    Args:
+        seq1 (str): sequence with the suffix
+        seq2 (str): sequence with the prefix
+
+    Returns:
+        int: overlap length
+    """
+    # longer suffixes than seq2 can not be its prefix
+    length = min(len(seq1), len(seq2))
+    if not length:
+        return 0
+    # the separator stops overlaps from running across both parts
+    return prefix_function(seq2[:length] + "\0" + seq1[len(seq1) - length :])[-1]
+
+
+def find_exact_overlap(seq1, seq2, min_overlap=MIN_OVERLAP):
+    """finds the longest error free overlap of both sequences -
+    seq2 behind seq1 or seq2 in front of seq1
+
+    Args:
+        seq1 (str): main sequence (without sentinel)
+        seq2 (str): sequence part (without sentinel)
+        min_overlap (int, optional): shorter overlaps are ignored.
+        Defaults to MIN_OVERLAP.
+
+    Returns:
+        tuple: (overlap_len, offset) - offset is the start of seq2
+        relative to seq1 (negative -> in front), None without overlap
+    """
+    behind = suffix_prefix_overlap(seq1, seq2)
+    in_front = suffix_prefix_overlap(seq2, seq1)
+    if max(behind, in_front) < min_overlap:
+        return None
+    if behind >= in_front:
+        return behind, len(seq1) - behind
+    return in_front, in_front - len(seq2)
+
+
+def kmer_set(seq, k=KMER_SIZE):
+    """collects all k-mers of a sequence
+
+    Args:
+        seq (str): sequence
+        k (int, optional): k-mer length. Defaults to KMER_SIZE.
+
+    Returns:
+        set: k-mers
+    """
+    return {seq[i : i + k] for i in range(len(seq) - k + 1)}
+
+
+def shares_kmer(kmers, seq, k=KMER_SIZE):
+    """checks if seq contains any of the given k-mers
+
+    Args:
+        kmers (set): k-mers of the other sequence
+        seq (str): sequence
+        k (int, optional): k-mer length. Defaults to KMER_SIZE.
+
+    Returns:
+        bool: True if at least one k-mer is shared
+    """
+    return any(seq[i : i + k] in kmers for i in range(len(seq) - k + 1))
@@ -17,9 +17,70 @@ It ignores overlaps (prefixes/ suffixes).
 
 import numpy as np
 
+try:
+    import sequence_encoding as se
+except ImportError:
+    print(
+        "Sequence Encoding not found!\nPlease copy file 'sequence_encoding.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import substitution_matrices as sm
+except ImportError:
+    print(
+        "Substitution Matrices not found!\nPlease copy file 'substitution_matrices.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
 MATCH = 1
 MISMATCH = -10
 GAP = -10
+# diagonals on each side of the overlap traceback band
+OVERLAP_BANDWIDTH = 8
+
+# traceback directions (2 bit codes)
+STOP = 0
+DIA = 1
+UP = 2
+LEFT = 3
+
+
+def get_substitution_matrix(substitution_matrix=None):
+    """returns the given substitution matrix or creates
+    one from the MATCH/ MISMATCH constants
+
+    Args:
+        substitution_matrix (numpy matrix, optional): (alphabet, alphabet)
+        scores, see substitution_matrices module. Defaults to None.
+
+    Returns:
+        numpy matrix: substitution matrix
+    """
+    if substitution_matrix is None:
+        return sm.create_matrix(MATCH, MISMATCH)
+    return substitution_matrix
+
+
+def get_score_dtype(ls1, ls2, substitution_matrix=None):
+    """chooses the smallest integer type, which can hold
+    every score of two sequences with the given lengths
+
+    Args:
+        ls1 (int): len first sequence to alignt
+        ls2 (int): len second sequence to alignt
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        str: numpy dtype name
+    """
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    max_substitution = int(np.abs(substitution_matrix).max())
+    # factor 2 -> room for the gap offsets of the row fill
+    max_score = 2 * max(max_substitution, abs(GAP)) * (ls1 + ls2)
+    for dtype in ("int16", "int32"):
+        if max_score <= np.iinfo(dtype).max:
+            return dtype
+    return "int64"
 
 
 def calculate_scorematrix(score_matrix, ls1, ls2, seq1, seq2):
@@ -74,59 +135,442 @@ def get_max_from_border(score_matrix):
     return result
 
 
-def traceback(score_matrix, seq1, seq2, max_border_coords):
+def fill_rows(seq1, seq2, substitution_matrix=None):
+    """fills the scorematrix row by row and keeps only
+    the current row in memory. Gaps inside a row are resolved
+    with a cumulative maximum, so every row is one numpy operation.
+
+    Args:
+        seq1 (str): first sequence to alignt (leading sentinel)
+        seq2 (str): second sequence to alignt (leading sentinel)
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Yields:
+        tuple: (y, row) row index and row of the scorematrix
+    """
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    dtype = get_score_dtype(len(seq1), len(seq2), substitution_matrix)
+    # one score row per residue -> substitution scores of a row are one gather
+    profile = sm.query_profile(substitution_matrix, seq1).astype(dtype)
+    codes2 = se.as_codes(seq2)
+    gap_offsets = np.arange(len(seq1), dtype=dtype) * GAP
+    row = np.zeros(len(seq1), dtype=dtype)
+    yield 0, row
+    for y in range(1, len(seq2)):
+        match_values = profile[codes2[y], 1:]
+        candidates = np.zeros_like(row)
+        candidates[1:] = np.maximum(row[:-1] + match_values, row[1:] + GAP)
+        # cell = max(candidate, left cell + GAP) for the whole row
+        row = np.maximum.accumulate(candidates - gap_offsets) + gap_offsets
+        yield y, row
+
+
+def calculate_score(seq1, seq2, substitution_matrix=None):
+    """score only alignment for screening and ranking.
+    Keeps the current row and the last column instead
+    of the whole scorematrix.
+
+    Args:
+        seq1 (str): first sequence to alignt
+        seq2 (str): second sequence to alignt
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        tuple: (score, (y, x)) highest border score and its
+        coordinates - same choice as get_max_from_border
+    """
+    last_column = np.zeros(len(seq2), dtype="int64")
+    for y, row in fill_rows(seq1, seq2, substitution_matrix):
+        last_column[y] = row[-1]
+    return get_max_from_last_lines(row, last_column)
+
+
+def get_max_from_last_lines(last_row, last_column):
+    """find highest score and its coordinates in the
+    last row and column - same choice as get_max_from_border
+
+    Args:
+        last_row (numpy array): last row of the scorematrix
+        last_column (numpy array): last column of the scorematrix
+
+    Returns:
+        tuple: (score, (y, x)) highest border score and its coordinates
+    """
+    y = len(last_column) - 1
+    x = len(last_row) - 1
+    if np.max(last_column) >= np.max(last_row):
+        max_score = int(np.max(last_column))
+        max_border_coords = (int(np.argmax(last_column)), x)
+    else:
+        max_score = int(np.max(last_row))
+        max_border_coords = (y, int(np.argmax(last_row)))
+    return max_score, max_border_coords
+
+
+def get_direction(pointer_matrix, y, x):
+    """reads the 2 bit direction code of one cell
+
+    Args:
+        pointer_matrix (numpy matrix): packed direction codes
+        y (int): row of the cell
+        x (int): column of the cell
+
+    Returns:
+        int: direction code
+    """
+    return (int(pointer_matrix[y][x >> 2]) >> ((x & 3) * 2)) & 3
+
+
+def calculate_pointermatrix(ls1, ls2, seq1, seq2, substitution_matrix=None):
+    """fills the scorematrix row by row and stores only the
+    traceback direction of every cell - 2 bits per cell.
+    The direction is the neighbor the cell value came from
+    (order on ties: dia, up, left).
+
+    Args:
+        ls1 (int): len first sequence to alignt
+        ls2 (int): len second sequence to alignt
+        seq1 (str): first sequence to alignt
+        seq2 (str): second sequence to alignt
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        pointer_matrix (numpy matrix): packed direction codes
+        max_score (int): highest border score
+        max_border_coords (tuple): (y, x) Coordinates of max score
+    """
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    profile = sm.query_profile(substitution_matrix, seq1)
+    codes2 = se.as_codes(seq2)
+    pointer_matrix = np.zeros((ls2, -(-ls1 // 4)), dtype="uint8")
+    last_column = np.zeros(ls2, dtype="int64")
+    for y, row in fill_rows(seq1, seq2, substitution_matrix):
+        if y > 0:
+            dia = previous[:-1] + profile[codes2[y], 1:]
+            directions = np.where(
+                row[1:] == dia, DIA, np.where(row[1:] == previous[1:] + GAP, UP, LEFT)
+            )
+            pointer_matrix[y] = se.pack_2bit(np.concatenate(([STOP], directions)))
+        last_column[y] = row[-1]
+        previous = row
+    max_score, max_border_coords = get_max_from_last_lines(row, last_column)
+    return pointer_matrix, max_score, max_border_coords
+
+
+def calculate_scorematrix_overlap_band(
+    seq1, seq2, max_border_coords, bandwidth, substitution_matrix=None
+):
+    """creates the scorematrix above and left of the max border
+    cell, only inside a band of diagonals around the diagonal of
+    that cell. Row y of the band matrix holds the cells
+    x = y + lowest_diagonal + j. Cells outside the band get a
+    very low score, so no path leaves the band.
+
+    Args:
+        seq1 (str): first sequence to alignt
+        seq2 (str): second sequence to alignt
+        max_border_coords (tuple): (y, x) Coordinates of max score
+        bandwidth (int): diagonals added on each side of the band
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        band_matrix (numpy matrix): scorematrix inside the band
+        lowest_diagonal (int): diagonal (x - y) of the first band column
+    """
+    last_y, last_x = max_border_coords
+    lowest_diagonal = last_x - last_y - bandwidth
+    width = 2 * bandwidth + 1
+    outside = np.iinfo("int32").min // 2
+
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    profile = sm.query_profile(substitution_matrix, seq1)
+    codes2 = se.as_codes(seq2)
+    columns = np.arange(width)
+    gap_offsets = columns * GAP
+    band_matrix = np.full((last_y + 1, width), outside, dtype="int32")
+    x = lowest_diagonal + columns
+    # free shift -> first row and column are 0
+    band_matrix[0][(x >= 0) & (x <= last_x)] = 0
+
+    for y in range(1, last_y + 1):
+        x = y + lowest_diagonal + columns
+        previous = band_matrix[y - 1].astype("int64")
+        match_values = profile[codes2[y], np.clip(x, 0, last_x)]
+        # dia -> same band column, up -> next band column
+        candidates = previous + match_values
+        candidates[:-1] = np.maximum(candidates[:-1], previous[1:] + GAP)
+        candidates[x < 0] = outside
+        candidates[x == 0] = 0
+        # cell = max(candidate, left cell + GAP) for the whole band row
+        row = np.maximum.accumulate(candidates - gap_offsets) + gap_offsets
+        row[(x < 0) | (x > last_x)] = outside
+        band_matrix[y] = np.maximum(row, outside)
+    return band_matrix, lowest_diagonal
+
+
+def calculate_score_banded(
+    seq1, seq2, lowest_diagonal, width, substitution_matrix=None
+):
+    """score only free-shift alignment inside a band of
+    diagonals - used to verify a read at a candidate position
+    of a reference. Keeps only the current band row.
+
+    Args:
+        seq1 (str): reference window (leading sentinel)
+        seq2 (str): read (leading sentinel)
+        lowest_diagonal (int): diagonal (x - y) of the first band column
+        width (int): number of diagonals in the band
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        tuple: (score, x) highest score of the last row
+        and its column
+    """
+    ls1 = len(seq1)
+    outside = np.iinfo("int32").min // 2
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    profile = sm.query_profile(substitution_matrix, seq1)
+    codes2 = se.as_codes(seq2)
+    columns = np.arange(width)
+    gap_offsets = columns * GAP
+    x = lowest_diagonal + columns
+    row = np.where((x >= 0) & (x < ls1), 0, outside)
+
+    for y in range(1, len(codes2)):
+        x = y + lowest_diagonal + columns
+        match_values = profile[codes2[y], np.clip(x, 0, ls1 - 1)]
+        # dia -> same band column, up -> next band column
+        candidates = row + match_values
+        candidates[:-1] = np.maximum(candidates[:-1], row[1:] + GAP)
+        candidates[x < 0] = outside
+        candidates[x == 0] = 0
+        # cell = max(candidate, left cell + GAP) for the whole band row
+        row = np.maximum.accumulate(candidates - gap_offsets) + gap_offsets
+        row[(x < 0) | (x >= ls1)] = outside
+        row = np.maximum(row, outside)
+    # equal scores (e.g. mismatch vs. gap) -> cell nearest to the band middle
+    best = np.flatnonzero(row == row.max())
+    j = int(best[np.argmin(np.abs(2 * best - (width - 1)))])
+    return int(row[j]), len(codes2) - 1 + lowest_diagonal + j
+
+
+def traceback_overlap(
+    band_matrix,
+    lowest_diagonal,
+    seq1,
+    seq2,
+    max_border_coords,
+    substitution_matrix=None,
+):
+    """traceback from the max border cell to the first row or
+    column inside the band. Same decisions as traceback,
+    but only counts instead of building the sequences.
+
+    Args:
+        band_matrix (numpy matrix): scorematrix inside the band
+        lowest_diagonal (int): diagonal (x - y) of the first band column
+        seq1 (str): first sequence to alignt
+        seq2 (str): second sequence to alignt
+        max_border_coords (tuple): (y, x) Coordinates of max score
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        overlap_len (int): aligned positions of the overlap
+        matches (int): matching positions - same count as
+        calc_similarity of the assembly alignment
+        offset (int): start of seq2 relative to seq1
+        (negative -> seq2 starts in front of seq1)
+        touches_edge (bool): path runs along the band edge
+    """
+    width = band_matrix.shape[1]
+    outside = np.iinfo("int32").min // 2
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    codes1, codes2 = se.as_codes(seq1), se.as_codes(seq2)
+
+    def score(y, x):
+        j = x - y - lowest_diagonal
+        return int(band_matrix[y][j]) if 0 <= j < width else outside
+
+    y, x = max_border_coords
+    overlap_len, matches = 0, 0
+    touches_edge = False
+    while x > 0 and y > 0:
+        overlap_len += 1
+        if x - y - lowest_diagonal in (0, width - 1):
+            touches_edge = True
+        match_value = substitution_matrix[codes2[y], codes1[x]]
+        if score(y, x) == score(y - 1, x - 1) + match_value:
+            # only diagonal steps pair two characters
+            if seq1[x] == seq2[y]:
+                matches += 1
+            x -= 1
+            y -= 1
+        elif score(y, x) == score(y - 1, x) + GAP:
+            y -= 1
+        else:
+            x -= 1
+    # first row or column reached -> start of seq2 relative to seq1
+    return overlap_len, matches, x - y, touches_edge
+
+
+def calculate_overlap(
+    seq1, seq2, substitution_matrix=None, bandwidth=OVERLAP_BANDWIDTH
+):
+    """overlap engine for the assembly algorithms. Fills the
+    scorematrix keeping only the last row and column, then
+    recalculates a narrow band around the diagonal of the max
+    border cell for the traceback. The band gets wider as long
+    as the path runs along its edge. No strings are built.
+
+    Args:
+        seq1 (str): first sequence to alignt (leading sentinel)
+        seq2 (str): second sequence to alignt (leading sentinel)
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+        bandwidth (int, optional): diagonals on each side of the
+        band. Defaults to OVERLAP_BANDWIDTH.
+
+    Returns:
+        overlap_len (int): aligned positions of the overlap
+        score (int): highest border score
+        offset (int): start of seq2 relative to seq1
+        matches (int): matching positions of the overlap
+    """
+    seq1, seq2 = se.as_string(seq1), se.as_string(seq2)
+    score, max_border_coords = calculate_score(seq1, seq2, substitution_matrix)
+    last_y, last_x = max_border_coords
+    while True:
+        band_matrix, lowest_diagonal = calculate_scorematrix_overlap_band(
+            seq1, seq2, max_border_coords, bandwidth, substitution_matrix
+        )
+        overlap_len, matches, offset, touches_edge = traceback_overlap(
+            band_matrix,
+            lowest_diagonal,
+            seq1,
+            seq2,
+            max_border_coords,
+            substitution_matrix,
+        )
+        covers_matrix = lowest_diagonal <= -last_y and (
+            lowest_diagonal + 2 * bandwidth >= last_x
+        )
+        if not touches_edge or covers_matrix:
+            return overlap_len, score, offset, matches
+        bandwidth *= 2
+
+
+def traceback(score_matrix, seq1, seq2, max_border_coords, substitution_matrix=None):
     """traceback from coordinates of highest score in
     last row or last column to upper left corner.
-    Finds best scoring path via greedy-algorithm.
+    Every step goes to the neighbor the cell value came
+    from (order on ties: dia, up, left).
 
     Args:
         score_matrix numpy matrix: scorematrix
         seq1 (str): first sequence to alignt
         seq2 (str): second sequence to alignt
         max_border_coords (tuple): (y, x) Coordinates of max score
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
 
     Returns:
         seq1_new (str): redesigned first sequence
         seq2_new (str): redesigned second sequence
     """
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    codes1, codes2 = se.as_codes(seq1), se.as_codes(seq2)
     seq1_new, seq2_new = [], []
     y, x = max_border_coords
-    seq1_new.append(seq1[x])
-    seq2_new.append(seq2[y])
 
     while x > 0 and y > 0:
-        dia = score_matrix[y - 1][x - 1]
-        up = score_matrix[y - 1][x]
-        left = score_matrix[y][x - 1]
-        max_points = max(dia, up, left)
-
+        match_value = substitution_matrix[codes2[y], codes1[x]]
         # dia
-        if dia == max_points:
-            seq1_new.append(seq1[x - 1])
-            seq2_new.append(seq2[y - 1])
+        if score_matrix[y][x] == score_matrix[y - 1][x - 1] + match_value:
+            seq1_new.append(seq1[x])
+            seq2_new.append(seq2[y])
             x -= 1
             y -= 1
         # up
-        elif up == max_points:
+        elif score_matrix[y][x] == score_matrix[y - 1][x] + GAP:
             seq1_new.append("_")
-            seq2_new.append(seq2[y - 1])
+            seq2_new.append(seq2[y])
             y += -1
         # left
         else:
             seq2_new.append("_")
-            seq1_new.append(seq1[x - 1])
+            seq1_new.append(seq1[x])
             x += -1
 
     # left border
     while y > 0:
         seq1_new.append("_")
-        seq2_new.append(seq2[y - 1])
+        seq2_new.append(seq2[y])
         y += -1
     # top border
     while x > 0:
         seq2_new.append("_")
-        seq1_new.append(seq1[x - 1])
+        seq1_new.append(seq1[x])
         x += -1
+    # leading sentinels
+    seq1_new.append(seq1[0])
+    seq2_new.append(seq2[0])
+    return seq1_new, seq2_new
+
+
+def traceback_pointers(pointer_matrix, seq1, seq2, max_border_coords):
+    """traceback from coordinates of highest score in
+    last row or last column to upper left corner
+    by following the stored directions
+
+    Args:
+        pointer_matrix (numpy matrix): packed direction codes
+        seq1 (str): first sequence to alignt
+        seq2 (str): second sequence to alignt
+        max_border_coords (tuple): (y, x) Coordinates of max score
+
+    Returns:
+        seq1_new (str): redesigned first sequence
+        seq2_new (str): redesigned second sequence
+    """
+    seq1, seq2 = se.as_string(seq1), se.as_string(seq2)
+    seq1_new, seq2_new = [], []
+    y, x = max_border_coords
+
+    while x > 0 and y > 0:
+        direction = get_direction(pointer_matrix, y, x)
+        if direction == DIA:
+            seq1_new.append(seq1[x])
+            seq2_new.append(seq2[y])
+            x -= 1
+            y -= 1
+        elif direction == UP:
+            seq1_new.append("_")
+            seq2_new.append(seq2[y])
+            y -= 1
+        else:
+            seq2_new.append("_")
+            seq1_new.append(seq1[x])
+            x -= 1
+
+    # left border
+    while y > 0:
+        seq1_new.append("_")
+        seq2_new.append(seq2[y])
+        y -= 1
+    # top border
+    while x > 0:
+        seq2_new.append("_")
+        seq1_new.append(seq1[x])
+        x -= 1
+    # leading sentinels
+    seq1_new.append(seq1[0])
+    seq2_new.append(seq2[0])
     return seq1_new, seq2_new
 
 
@@ -166,16 +610,39 @@ def merge_sequences(seq1_new, seq2_new):
     Returns:
         seq1_new (str): merged main sequence
     """
-    seq1_new = list(seq1_new)
-    for x in range(len(seq1_new)):
-        if seq1_new[x] == "_":
-            seq1_new[x] = seq2_new[x]
-        if seq1_new[x] == ",":
-            del seq1_new[x]
-    seq1_new = "".join(seq1_new)
+    # gaps of the main sequence are filled from the other one, sentinels dropped
+    seq1_new = "".join(
+        char2 if char1 == "_" else char1
+        for char1, char2 in zip(seq1_new, seq2_new)
+        if char1 != ","
+    )
     return seq1_new
 
 
+def align(seq1, seq2, substitution_matrix=None):
+    """aligns two sequences without printing anything
+
+    Args:
+        seq1 (str): first sequence to alignt (leading sentinel)
+        seq2 (str): second sequence to alignt (leading sentinel)
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        seq1_new (str): redesigned first sequence (with sentinel)
+        seq2_new (str): redesigned second sequence (with sentinel)
+    """
+    ls1 = len(seq1)
+    ls2 = len(seq2)
+    pointer_matrix, _, max_border_coords = calculate_pointermatrix(
+        ls1, ls2, seq1, seq2, substitution_matrix
+    )
+    seq1_new, seq2_new = traceback_pointers(
+        pointer_matrix, seq1, seq2, max_border_coords
+    )
+    return add_overlap(ls1, ls2, seq1, seq2, seq1_new, seq2_new, max_border_coords)
+
+
 def output(seq1_new, seq2_new):
     """generates and prints an alignment output string
     which shows matches (|) and mismatches (*)
@@ -212,20 +679,18 @@ def calc_similarity(alignment_output):
     return (abs_count, rel_count)
 
 
-def main(seq1="", seq2="", assembly=False):
+def main(seq1="", seq2="", assembly=False, substitution_matrix=None):
     # change sequences below for your needs!
+    # substitution_matrix: e.g. sm.BLOSUM62 for proteins
+    # encoded sequences come without sentinels
+    if se.is_encoded(seq1):
+        seq1 = se.as_string(se.with_sentinel(seq1))
+    if se.is_encoded(seq2):
+        seq2 = se.as_string(se.with_sentinel(seq2))
     if not (seq1 or seq2):
         seq1 = ",ATTAC"
         seq2 = ",ATT"
-    ls1 = len(seq1)
-    ls2 = len(seq2)
-    score_matrix = np.zeros((ls2, ls1), dtype="int16")
-    score_matrix = calculate_scorematrix(score_matrix, ls1, ls2, seq1, seq2)
-    max_border_coords = get_max_from_border(score_matrix)
-    seq1_new, seq2_new = traceback(score_matrix, seq1, seq2, max_border_coords)
-    seq1_new, seq2_new = add_overlap(
-        ls1, ls2, seq1, seq2, seq1_new, seq2_new, max_border_coords
-    )
+    seq1_new, seq2_new = align(seq1, seq2, substitution_matrix)
     # remove Commas
     seq1_new = seq1_new.replace(",", "")
     seq2_new = seq2_new.replace(",", "")
@@ -0,0 +1,356 @@
+# =============================================================================
+# Created By  : Dominique Zeise
+# GitHub      : https://github.com/CharliesCodes
+# Created Date: 2026/10/18
+# Version     : 1.0
+# © Copyright : 2026 Dominique Zeise
+# =============================================================================
+"""
+Greedy Assembly
+
+
+This module holds the greedy overlap assembly shared by the
+de novo and the mapping assembly. Starting with the longest
+part, the part with the most matches at one end of the
+assembled sequence is merged until no part fits anymore.
+Only the ends are aligned, and only ends that changed are
+aligned again.
+
+Dependencies: Free-Shift Alignment Module"""
+# =============================================================================
+
+import contextlib
+import functools
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    import free_shift_alignment as fsa
+except ImportError:
+    print(
+        "Free-Shift Alignment not found!\nPlease copy file 'free_shift_alignment.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import sequence_encoding as se
+except ImportError:
+    print(
+        "Sequence Encoding not found!\nPlease copy file 'sequence_encoding.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import myers_bit_vector as mbv
+except ImportError:
+    print(
+        "Myers Bit-Vector not found!\nPlease copy file 'myers_bit_vector.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import exact_overlap as eo
+except ImportError:
+    print(
+        "Exact Overlap not found!\nPlease copy file 'exact_overlap.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import suffix_automaton as sa
+except ImportError:
+    print(
+        "Suffix Automaton not found!\nPlease copy file 'suffix_automaton.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+
+# overlap results kept by end_overlap
+OVERLAP_CACHE_SIZE = 65536
+# extra positions of the end windows for gaps
+WINDOW_MARGIN = 4
+# parts are only aligned against ends sharing a k-mer - max length,
+# otherwise a third of the shortest part (min: eo.KMER_SIZE)
+INDEX_KMER_SIZE = 16
+# fewer candidates of one end are aligned without the process pool
+PARALLEL_MIN_CANDIDATES = 64
+# sequence parts of a pool worker, set once by init_worker
+WORKER_SEQPARTS = []
+
+
+def get_unique_seqparts(seqparts):
+    """This func generates a list of unique sequences
+
+    Args:
+        seqparts (list): strings or encoded sequences of unordered,
+        ununique sequence parts
+
+    Returns:
+        list: unique sequence parts - order: size decreasing
+    """
+    seqparts = list(set(se.as_string(seq) for seq in seqparts))
+
+    seqparts.sort(key=len, reverse=True)
+    # remove all sequences that are part of any other sequence
+    contained = sa.find_contained(seqparts)
+    unique_seqparts = [
+        seq for seq, is_contained in zip(seqparts, contained) if not is_contained
+    ]
+    return unique_seqparts
+
+
+@functools.lru_cache(maxsize=OVERLAP_CACHE_SIZE)
+def end_overlap(window, part, at_end):
+    """matches of the best overlap between a part and one end
+    of the assembled sequence. An error free overlap needs no
+    alignment, if no longer overlap with an error can score
+    higher - otherwise it is a lower bound for the alignment.
+    Results are cached - ends which did not change since the
+    last merge are not aligned again.
+
+    Args:
+        window (str): first or last positions of the
+        assembled sequence (leading sentinel)
+        part (str): sequence part (leading sentinel)
+        at_end (bool): True -> window is the end, the part may
+        only continue it. False -> window is the start,
+        the part may only come in front of it
+
+    Returns:
+        tuple: (matches, exact) matches of the overlap (0 for the
+        other direction), exact -> merge at the error free overlap
+    """
+    if at_end:
+        exact_overlap = eo.suffix_prefix_overlap(window[1:], part[1:])
+    else:
+        exact_overlap = eo.suffix_prefix_overlap(part[1:], window[1:])
+    if exact_overlap < eo.MIN_OVERLAP:
+        exact_overlap = 0
+    # every longer overlap has an error -> scores at most this
+    longest = min(len(window), len(part)) - 1
+    best_with_error = (longest - 1) * fsa.MATCH + max(fsa.MISMATCH, fsa.GAP)
+    if exact_overlap and exact_overlap * fsa.MATCH >= best_with_error:
+        return exact_overlap, True
+    # skip parts that can not beat the error free overlap
+    # or reach the similarity threshold
+    min_matches = max(exact_overlap, 0.2 * len(part))
+    if mbv.can_exceed_matches(window, part, min_matches):
+        _, _, offset, matches = fsa.calculate_overlap(window, part)
+        direction_fits = (offset >= 0) if at_end else (offset <= 0)
+        if direction_fits and matches > exact_overlap:
+            return matches, False
+    return exact_overlap, exact_overlap > 0
+
+
+def init_worker(seqparts):
+    """stores the sequence parts in a pool worker, so tasks
+    only need the part indices
+
+    Args:
+        seqparts (list): sequence parts (leading sentinel)
+    """
+    WORKER_SEQPARTS[:] = seqparts
+
+
+def score_chunk(window, parts_indices, at_end):
+    """pool task - aligns a chunk of parts against one end
+
+    Args:
+        window (str): first or last positions of the
+        assembled sequence (leading sentinel)
+        parts_indices (list): indices of the parts
+        at_end (bool): see end_overlap
+
+    Returns:
+        list: matches per part, same order as parts_indices
+    """
+    return [
+        end_overlap(window, WORKER_SEQPARTS[parts_index], at_end)[0]
+        for parts_index in parts_indices
+    ]
+
+
+def update_end_matches(
+    end_matches,
+    main_seq,
+    window,
+    seqparts,
+    kmer_index,
+    kmer_size,
+    remaining,
+    at_end,
+    executor=None,
+    workers=1,
+):
+    """aligns all remaining parts, which share a k-mer
+    with the window, against one end of the assembled sequence.
+    Many candidates are split into one chunk per worker of the
+    process pool - the window is sent once per chunk.
+
+    Args:
+        end_matches (numpy array): matches per part, updated in place
+        main_seq (str): assembled sequence (leading sentinel)
+        window (str): first or last positions of the
+        assembled sequence (leading sentinel)
+        seqparts (list): sequence parts (leading sentinel)
+        kmer_index (dict): k-mer -> indices of the parts containing it
+        kmer_size (int): k-mer length of the index
+        remaining (numpy array): bool mask of unmerged parts
+        at_end (bool): see end_overlap
+        executor (ProcessPoolExecutor, optional): pool with
+        init_worker as initializer. Defaults to None (no pool).
+        workers (int, optional): workers of the pool. Defaults to 1.
+    """
+    end_matches[:] = 0
+    candidates = set()
+    for kmer in eo.kmer_set(window[1:], kmer_size):
+        candidates.update(kmer_index.get(kmer, ()))
+    to_align = []
+    for parts_index in sorted(candidates):
+        if not remaining[parts_index]:
+            continue
+        part = seqparts[parts_index]
+        # parts inside the assembled sequence match completely
+        if part[1:] in main_seq:
+            end_matches[parts_index] = len(part) - 1
+        else:
+            to_align.append(parts_index)
+
+    if executor is None or len(to_align) < PARALLEL_MIN_CANDIDATES:
+        for parts_index in to_align:
+            end_matches[parts_index], _ = end_overlap(
+                window, seqparts[parts_index], at_end
+            )
+        return
+    chunk_size = -(-len(to_align) // workers)
+    chunks = [
+        to_align[i : i + chunk_size] for i in range(0, len(to_align), chunk_size)
+    ]
+    # map keeps the order of the chunks -> same result as without pool
+    results = executor.map(
+        score_chunk, [window] * len(chunks), chunks, [at_end] * len(chunks)
+    )
+    for chunk, chunk_matches in zip(chunks, results):
+        end_matches[chunk] = chunk_matches
+
+
+def merge_part(main_seq, window, part, at_end):
+    """merges a part into the end it was scored for - at the
+    error free overlap, if end_overlap chose it. Otherwise the
+    part is aligned against the window only, if it continues
+    that end - or else it is merged with the whole sequence.
+
+    Args:
+        main_seq (str): assembled sequence (leading sentinel)
+        window (str): first or last positions of the
+        assembled sequence (leading sentinel)
+        part (str): sequence part (leading sentinel)
+        at_end (bool): see end_overlap
+
+    Returns:
+        str: assembled sequence with the part (leading sentinel)
+    """
+    exact_overlap, exact = end_overlap(window, part, at_end)
+    if exact and at_end:
+        return main_seq + part[1 + exact_overlap :]
+    if exact:
+        return part[: len(part) - exact_overlap] + main_seq[1:]
+    _, _, offset, _ = fsa.calculate_overlap(window, part)
+    if at_end and offset >= 0:
+        _, merged = fsa.main(window, part, True)
+        return main_seq[: len(main_seq) - len(window) + 1] + merged
+    # the part has to end inside the start window
+    if not at_end and offset <= 0 and offset + len(part) <= len(window):
+        _, merged = fsa.main(window, part, True)
+        return se.SENTINEL + merged + main_seq[len(window) :]
+    _, merged = fsa.main(main_seq, part, True)
+    return se.with_sentinel(merged)
+
+
+def assemble(seqparts, max_len, workers=1):
+    """assembles the best fitting sequence into
+    one big sequence. Requires Free-Shift-Alignment
+    to find best fit. Starting with biggest Sequencepart,
+    it compares all other parts with both ends of the
+    assembled sequence and merges the part with the most
+    matches. Only ends that changed are aligned again.
+    Repeating the procedure untill seqparts list is
+    empty or the max_len limit is reached
+
+    Args:
+        seqparts (list): strings or encoded sequences
+        Order: decreasing length
+        max_len (int): stop length of the assembled sequence
+        workers (int, optional): processes aligning the parts.
+        Defaults to 1.
+
+    Returns:
+        str: Assembled Sequence
+    """
+    seqparts = [se.with_sentinel(se.as_string(seq)) for seq in seqparts]
+    # set longest (first) list element as main sequence and remove it from list
+    main_seq = seqparts.pop(0)
+    # ends long enough for the longest part (+ some gaps)
+    window_len = max((len(seq) for seq in seqparts), default=0) + WINDOW_MARGIN
+    shortest = min((len(seq) - 1 for seq in seqparts), default=0)
+    kmer_size = min(INDEX_KMER_SIZE, max(eo.KMER_SIZE, shortest // 3))
+    kmer_index = {}
+    for parts_index, seq in enumerate(seqparts):
+        for kmer in eo.kmer_set(seq[1:], kmer_size):
+            kmer_index.setdefault(kmer, []).append(parts_index)
+
+    part_lens = np.array([len(seq) for seq in seqparts])
+    remaining = np.ones(len(seqparts), dtype=bool)
+    head_matches = np.zeros(len(seqparts), dtype="int64")
+    tail_matches = np.zeros(len(seqparts), dtype="int64")
+    head = tail = None
+    pool = contextlib.nullcontext()
+    if workers > 1:
+        pool = ProcessPoolExecutor(
+            workers, initializer=init_worker, initargs=(seqparts,)
+        )
+    # the pool is shut down even if an alignment fails
+    with pool as executor:
+        while remaining.any() and (len(main_seq) <= max_len):
+            new_head = main_seq[: window_len + 1]
+            new_tail = se.SENTINEL + main_seq[1:][-window_len:]
+            if new_head != head:
+                head = new_head
+                update_end_matches(
+                    head_matches,
+                    main_seq,
+                    head,
+                    seqparts,
+                    kmer_index,
+                    kmer_size,
+                    remaining,
+                    False,
+                    executor,
+                    workers,
+                )
+            if new_tail != tail:
+                tail = new_tail
+                update_end_matches(
+                    tail_matches,
+                    main_seq,
+                    tail,
+                    seqparts,
+                    kmer_index,
+                    kmer_size,
+                    remaining,
+                    True,
+                    executor,
+                    workers,
+                )
+            matches = np.maximum(head_matches, tail_matches)
+            fitting = (
+                remaining & (0.9 * part_lens >= matches) & (matches > 0.2 * part_lens)
+            )
+            if not fitting.any():
+                print("An exception occurred! No fitting part found")
+                break
+            # most matches, first part on equal matches
+            parts_index = int(np.argmax(np.where(fitting, matches, -1)))
+            remaining[parts_index] = False
+            # merge at the end with more matches, then put it back in place
+            if tail_matches[parts_index] >= head_matches[parts_index]:
+                main_seq = merge_part(main_seq, tail, seqparts[parts_index], True)
+            else:
+                main_seq = merge_part(main_seq, head, seqparts[parts_index], False)
+    return main_seq
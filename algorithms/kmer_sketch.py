@@ -0,0 +1,147 @@
+# =============================================================================
+# Created By  : Dominique Zeise
+# GitHub      : https://github.com/CharliesCodes
+# Created Date: 2026/10/18
+# Version     : 1.0
+# © Copyright : 2026 Dominique Zeise
+# =============================================================================
+"""
+K-mer Sketch
+Count-Min Sketch
+
+
+This module counts k-mers approximately in a fixed amount
+of memory. Every k-mer is hashed into one counter of each row,
+its count is the smallest of these counters. Collisions can
+only increase a count, never decrease it - so no frequent
+k-mer is lost, but some rare k-mers look frequent (false
+positives). More memory -> wider rows -> fewer collisions.
+The assembly uses it to keep singleton (error) k-mers out of
+the exact k-mer table.
+"""
+# =============================================================================
+
+import numpy as np
+
+
+# bytes of all counters
+MEMORY = 64 * 1024**2
+# counters per k-mer (rows)
+DEPTH = 4
+# counters saturate at 255
+COUNTER_MAX = np.iinfo("uint8").max
+# odd multipliers, one per row
+SEEDS = (
+    0x9E3779B97F4A7C15,
+    0xC2B2AE3D27D4EB4F,
+    0x165667B19E3779F9,
+    0xD6E8FEB86659FD93,
+    0xFF51AFD7ED558CCD,
+    0xC4CEB9FE1A85EC53,
+    0x27D4EB2F165667C5,
+    0x94D049BB133111EB,
+)
+
+
+def create_sketch(memory=MEMORY, depth=DEPTH):
+    """creates an empty count-min sketch
+
+    Args:
+        memory (int, optional): bytes of all counters. Defaults to MEMORY.
+        depth (int, optional): rows (hash functions). Defaults to DEPTH.
+
+    Raises:
+        ValueError: too many rows or too little memory
+
+    Returns:
+        numpy matrix: (depth, width) uint8 counters
+    """
+    if not 0 < depth <= len(SEEDS):
+        raise ValueError(f"depth has to be between 1 and {len(SEEDS)}")
+    width = memory // depth
+    if width < 1:
+        raise ValueError(f"{memory} bytes are too little for {depth} rows")
+    return np.zeros((depth, width), dtype="uint8")
+
+
+def hash_row(kmers, row, width):
+    """counter of every k-mer in one row (multiply-shift hashing)
+
+    Args:
+        kmers (numpy array): uint64 k-mer ids
+        row (int): row index
+        width (int): counters per row
+
+    Returns:
+        numpy array: counter indices
+    """
+    hashes = kmers * np.uint64(SEEDS[row])
+    hashes ^= hashes >> np.uint64(32)
+    return hashes % np.uint64(width)
+
+
+def add_kmers(sketch, kmers):
+    """counts k-mers into the sketch
+
+    Args:
+        sketch (numpy matrix): see create_sketch
+        kmers (numpy array): uint64 k-mer ids, repeats allowed
+    """
+    depth, width = sketch.shape
+    for row in range(depth):
+        cells, counts = np.unique(hash_row(kmers, row, width), return_counts=True)
+        updated = sketch[row, cells] + np.minimum(counts, COUNTER_MAX)
+        sketch[row, cells] = np.minimum(updated, COUNTER_MAX)
+
+
+def estimate(sketch, kmers):
+    """approximate counts - never smaller than the true counts
+
+    Args:
+        sketch (numpy matrix): see create_sketch
+        kmers (numpy array): uint64 k-mer ids
+
+    Returns:
+        numpy array: count per k-mer
+    """
+    depth, width = sketch.shape
+    counts = np.full(len(kmers), COUNTER_MAX, dtype="uint8")
+    for row in range(depth):
+        counts = np.minimum(counts, sketch[row, hash_row(kmers, row, width)])
+    return counts
+
+
+def false_positive_rate(sketch, min_count):
+    """chance that a k-mer seen once reaches min_count - all of
+    its counters need min_count - 1 counts of other k-mers
+
+    Args:
+        sketch (numpy matrix): see create_sketch
+        min_count (int): count of a kept k-mer
+
+    Returns:
+        float: estimated false positive rate
+    """
+    if min_count <= 1:
+        return 0.0
+    return float(np.prod((sketch >= min_count - 1).mean(axis=1)))
+
+
+def main():
+    # change sequences below for your needs!
+    rng = np.random.default_rng(1)
+    kmers = rng.integers(0, 2**62, 100000, dtype="uint64")
+    # every k-mer once, the first 1000 ten times
+    kmers = np.concatenate([kmers] + [kmers[:1000]] * 9)
+    for memory in (64 * 1024, 1024**2):
+        sketch = create_sketch(memory)
+        add_kmers(sketch, kmers)
+        counts = estimate(sketch, np.unique(kmers))
+        print(
+            f"{memory // 1024} KiB: {(counts >= 2).sum()} k-mers counted twice or more,"
+            f" false positive rate {false_positive_rate(sketch, 2):.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
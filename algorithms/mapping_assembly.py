@@ -11,26 +11,81 @@
 This module uses dynamic programming to restore an
 origin-sequence from sequenceparts.
 
+With a reference sequence, the parts can be mapped
+against it instead (reference guided assembly).
+
 Dependencies: Free-Shift Alignment Module"""
 # =============================================================================
 
-import random
+import numpy as np
 
 try:
-    import free_shift_alignment as fsa
     import needleman_wunsch as nw
 except ImportError:
     print(
-        "Free-Shift Alignment not found!\nPlease copy file 'free_shift_alignment.py' into the same directory!\nVisit my GitHub page to download it."
+        "Needleman-Wunsch not found!\nPlease copy file 'needleman_wunsch.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import sequence_encoding as se
+except ImportError:
+    print(
+        "Sequence Encoding not found!\nPlease copy file 'sequence_encoding.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import greedy_assembly as ga
+except ImportError:
+    print(
+        "Greedy Assembly not found!\nPlease copy file 'greedy_assembly.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import minimizer_index as mi
+except ImportError:
+    print(
+        "Minimizer Index not found!\nPlease copy file 'minimizer_index.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import sequence_io as sio
+except ImportError:
+    print(
+        "Sequence IO not found!\nPlease copy file 'sequence_io.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import pileup
+except ImportError:
+    print(
+        "Pileup not found!\nPlease copy file 'pileup.py' into the same directory!\nVisit my GitHub page to download it."
     )
 
+try:
+    import read_simulator as rs
+except ImportError:
+    print(
+        "Read Simulator not found!\nPlease copy file 'read_simulator.py' into the same directory!\nVisit my GitHub page to download it."
+    )
 
-def generate_origin(origin_len=100):
-    origin = "".join(random.choice(["A", "T", "C", "G"]) for x in range(origin_len))
+
+def generate_origin(origin_len=100, rng=None):
+    """This func generates a random original sequence
+
+    Args:
+        origin_len (int, optional): len of the sequence. Defaults to 100.
+        rng (numpy Generator or int, optional): random generator or
+        seed. Defaults to None (new unseeded generator).
+
+    Returns:
+        tuple: (origin, origin_len)
+    """
+    rng = np.random.default_rng(rng)
+    origin = se.decode(rs.random_sequence(origin_len, rng))
     return origin, origin_len
 
 
-def cut_origin_to_seqparts(origin, MINLEN, MAXLEN, SET_NUM=20):
+def cut_origin_to_seqparts(origin, MINLEN, MAXLEN, SET_NUM=20, rng=None):
     """This func generates random sets of sequenceparts from origin
     and wraps them into one big, sorted list
 
@@ -39,93 +94,141 @@ def cut_origin_to_seqparts(origin, MINLEN, MAXLEN, SET_NUM=20):
         MINLEN (int): min len for sequenceparts
         MAXLEN (int): max len for sequenceparts
         SET_NUM (int, optional): number of sets from original. Defaults to 10.
+        rng (numpy Generator or int, optional): random generator or
+        seed. Defaults to None (new unseeded generator).
 
     Returns:
         [list]: len decreasing sorted  list of substrings with random parts from origin
     """
-    seqparts = []
-    for _ in range(SET_NUM):
-        x = 0
-        while x < len(origin):
-            rand = random.randint(MINLEN, MAXLEN)
-            if (len(origin) - x) <= MINLEN:
-                seqparts.append(origin[x::])
-            else:
-                seqparts.append(origin[x : x + rand])
-            x += rand
+    rng = np.random.default_rng(rng)
+    starts, ends = rs.tile(len(origin), MINLEN, MAXLEN, SET_NUM, rng)
+    seqparts = [origin[start:end] for start, end in zip(starts.tolist(), ends.tolist())]
     # sorting not needed - just for the sake of clarity
     seqparts.sort(key=len)
     return seqparts
 
 
-def get_unique_seqparts(seqparts):
-    """This func generates a list of unique sequences
+def mapping(seqparts, origin_len, workers=1):
+    """assembles the sequence parts with the greedy
+    assembly, see greedy_assembly
+
+    Args:
+        seqparts (list): strings or encoded sequences
+        Order: decreasing length
+        origin_len (int): used as loop-breaker
+        (stop length for mapped sequences size)
+        workers (int, optional): processes aligning the parts.
+        Defaults to 1.
+
+    Returns:
+        str: Assembled Sequence
+    """
+    return ga.assemble(seqparts, origin_len, workers)
+
+
+def mutate_origin(origin, rate=0.01, rng=None):
+    """This func replaces random bases of origin - a
+    reference of a slightly different individual
 
     Args:
-        seqparts (list): strings of unordered, ununique sequence parts
+        origin (str): original sequence
+        rate (float, optional): share of replaced bases. Defaults to 0.01.
+        rng (numpy Generator or int, optional): random generator or
+        seed. Defaults to None (new unseeded generator).
 
     Returns:
-        list: unique sequence parts - order: size decreasing
+        str: mutated sequence
     """
-    seqparts = list(set(seqparts))
-    seqparts.sort(key=len, reverse=True)
-    unique_seqparts = []
-    # remove all sequences that are part of any other sequence
-    for substring in seqparts:
-        if not any(substring in string for string in unique_seqparts):
-            unique_seqparts.append(substring)
-    return unique_seqparts
-
-
-def mapping(seqparts, origin_len):
-    """assembles the best fitting sequence into
-    one big sequence. Requires Free-Shift-Alignment
-    to find best fit. Starting with biggest Sequencepart,
-    it itterates over all other parts (size decreasing order).
-    Stores scores for fit in tuple and merges highest fitting
-    sequence. Repeating the procedure untill seqparts list is
-    empty or the origin_len limit is reached
+    rng = np.random.default_rng(rng)
+    codes = se.encode(origin)
+    positions = rng.choice(len(codes), round(rate * len(codes)), replace=False)
+    # a replaced base never stays the same
+    codes[positions] = (codes[positions] + rng.integers(1, 4, len(positions))) % 4
+    return se.decode(codes)
+
+
+def reference_mapping(seqparts, reference, index=None, batch_size=None):
+    """assembles the sequence parts guided by a reference.
+    Every part is mapped with the minimizer index and counted
+    into a pileup batch by batch, the assembly is the majority
+    base of every position. Positions not covered by any part
+    are taken from the reference.
 
     Args:
-        seqparts (list): strings with random generated sequences
-        Order: decreasing length
-        origin_len (int): used as loop-breaker
-        (stop length for mapped sequences size)
+        seqparts (iterable): strings or encoded sequences
+        reference (str): reference sequence (without sentinel)
+        index (dict, optional): minimizer index of the reference,
+        see minimizer_index. Defaults to None (built here).
+        batch_size (int, optional): parts mapped per batch.
+        Defaults to None (mi.BATCH_SIZE).
 
     Returns:
         str: Assembled Sequence
     """
-    seqparts = ["," + seq for seq in seqparts]
-    # set longest (first) list element as main sequence and remove it from list
-    main_seq = seqparts.pop(0)
-    while seqparts and (len(main_seq) <= origin_len):
-        fragments = []
-        for parts_index, seq2 in enumerate(seqparts):
-            # use imported smith-waterman algorithm without output function
-            sim_tup, main_seq_new = fsa.main(main_seq, seq2, True)
-            if 0.9 * len(seq2) >= sim_tup[0] > 0.2 * len(seq2):
-                fragments.append((sim_tup[0], main_seq_new, parts_index))
-        if fragments:
-            sorted_frags = sorted(fragments, key=lambda tup: tup[0], reverse=True)
-            main_seq = sorted_frags[0][1]
-            main_seq = "," + main_seq
-        try:
-            del seqparts[sorted_frags[0][2]]
-        except:
-            print("An exception occurred! No fitting part found")
-    return main_seq
-
-
-def main():
-    origin, origin_len = generate_origin()
-    MINLEN = round(0.05 * origin_len)
-    MAXLEN = round(0.20 * origin_len)
-    SET_NUM = 10
-    seqparts = cut_origin_to_seqparts(origin, MINLEN, MAXLEN, SET_NUM)
-    seqparts = get_unique_seqparts(seqparts)
-    assembly_sequence = mapping(seqparts, origin_len)
-    origin = "," + origin + ","
-    assembly_sequence = assembly_sequence + ","
+    if batch_size is None:
+        batch_size = mi.BATCH_SIZE
+    if index is None:
+        index = mi.build_index(reference)
+    else:
+        mi.check_index(index, reference, index["k"], index["w"])
+    # the part itself is the name of its mapping
+    reads = ((seq, seq) for seq in map(se.as_string, seqparts))
+    counts = pileup.create_pileup(len(reference))
+    unmapped = 0
+    for batch in mi.map_reads(reads, reference, index, batch_size):
+        mapped = []
+        for part, mapping in batch:
+            if mapping is None:
+                continue
+            start, end, _, strand = mapping
+            # reverse strand -> the reverse complement is counted
+            if strand == "-":
+                part = mi.reverse_complement(part)
+            mapped.append((start, end, part))
+        unmapped += len(batch) - len(mapped)
+        if mapped:
+            starts, ends, parts = zip(*mapped)
+            pileup.add_mapped_reads(counts, reference, starts, ends, parts)
+    if unmapped:
+        print(f"{unmapped} parts could not be mapped")
+    assembly_sequence, coverage = pileup.consensus(counts, reference)
+    pileup.output(pileup.coverage_stats(counts, coverage))
+    return se.SENTINEL + assembly_sequence
+
+
+def main(reference_guided=False, path=None, reference_path=None, seed=None):
+    # path: FASTA/ FASTQ file (plain or gzip) with the reads,
+    # reference_path: FASTA file, its first record is the reference
+    # seed: seed of the random demo data (None -> new data every run)
+    if path is not None:
+        seqparts = sio.read_sequences(path)
+        if reference_guided:
+            _, reference = next(sio.read_records(reference_path))
+            assembly_sequence = reference_mapping(seqparts, reference)
+        else:
+            seqparts = ga.get_unique_seqparts(seqparts)
+            # no origin -> every part may be used
+            assembly_sequence = mapping(seqparts, sum(map(len, seqparts)))
+        print("\nAssemblierte Sequenz")
+        print(assembly_sequence)
+        return
+    rng = np.random.default_rng(seed)
+    if not reference_guided:
+        origin, origin_len = generate_origin(rng=rng)
+        MINLEN = round(0.05 * origin_len)
+        MAXLEN = round(0.20 * origin_len)
+        SET_NUM = 10
+        seqparts = cut_origin_to_seqparts(origin, MINLEN, MAXLEN, SET_NUM, rng)
+        seqparts = ga.get_unique_seqparts(seqparts)
+        assembly_sequence = mapping(seqparts, origin_len)
+    else:
+        # reads of an individual, mapped against the reference of its species
+        origin, origin_len = generate_origin(1000, rng)
+        reference = mutate_origin(origin, rng=rng)
+        seqparts = cut_origin_to_seqparts(origin, 50, 150, 5, rng)
+        assembly_sequence = reference_mapping(seqparts, reference)
+    origin = se.with_sentinel(origin, trailing=True)
+    assembly_sequence = assembly_sequence + se.SENTINEL
     print("Ursprungssequenz")
     print("Assemblierte Sequenz\n")
     nw.main(origin, assembly_sequence)
@@ -0,0 +1,397 @@
+# =============================================================================
+# Created By  : Dominique Zeise
+# GitHub      : https://github.com/CharliesCodes
+# Created Date: 2026/10/18
+# Version     : 1.0
+# © Copyright : 2026 Dominique Zeise
+# =============================================================================
+"""
+Minimizer Index
+Read Mapping (minimap like)
+
+
+This module maps reads against a reference sequence.
+Of every w neighboring k-mers only the one with the smallest
+hash (the minimizer) is stored - two sequences sharing a
+stretch of w + k - 1 bases always share its minimizer, but the
+index gets about w / 2 times smaller than a full k-mer index.
+The index is built once and can be saved to a file for later runs.
+Minimizer hits of a read are grouped by diagonal, the best
+groups are verified with a banded free-shift alignment.
+Reads are mapped with both strands, the reverse complement
+of a read can map as well.
+"""
+# =============================================================================
+
+import zlib
+
+import numpy as np
+
+try:
+    import sequence_encoding as se
+except ImportError:
+    print(
+        "Sequence Encoding not found!\nPlease copy file 'sequence_encoding.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import free_shift_alignment as fsa
+except ImportError:
+    print(
+        "Free-Shift Alignment not found!\nPlease copy file 'free_shift_alignment.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+
+KMER_SIZE = 15
+WINDOW_SIZE = 10
+# minimizers occurring more often are skipped (repeats)
+MAX_OCCURRENCES = 64
+# hits of one locus, needed to verify it
+MIN_SEEDS = 2
+# verified loci per read
+MAX_CANDIDATES = 3
+# diagonals on each side of a locus (indels of the read)
+BANDWIDTH = 8
+# reads per batch of map_reads
+BATCH_SIZE = 1024
+# alignment score per read base of a mapped read
+MIN_SCORE_FRACTION = 0.5
+# complement of every base, other characters (e.g. N) stay
+COMPLEMENT = str.maketrans("ACGTacgt", "TGCAtgca")
+
+
+def reverse_complement(read):
+    """reverse complement of a DNA sequence
+
+    Args:
+        read (str): sequence
+
+    Returns:
+        str: reverse complement
+    """
+    return read.translate(COMPLEMENT)[::-1]
+
+
+def hash_kmers(ids):
+    """scrambles k-mer ids, so minimizers are not biased
+    towards poly-A stretches (invertible 64 bit mix)
+
+    Args:
+        ids (numpy array): 2 bit k-mer ids
+
+    Returns:
+        numpy array: uint64 hashes
+    """
+    hashes = ids.astype("uint64")
+    hashes ^= hashes >> np.uint64(31)
+    hashes *= np.uint64(0x9E3779B97F4A7C15)
+    hashes ^= hashes >> np.uint64(29)
+    return hashes
+
+
+def kmer_hashes(codes, k):
+    """hashes every k-mer of a DNA code array. K-mers with
+    other characters than ACGT get the highest hash and are
+    never chosen as minimizer.
+
+    Args:
+        codes (numpy array): codes of the sequence
+        k (int): k-mer length (max 31)
+
+    Returns:
+        numpy array: hash of the k-mer at every start position
+    """
+    count = max(len(codes) - k + 1, 0)
+    ids = np.zeros(count, dtype="int64")
+    for j in range(k):
+        ids = ids * 4 + (codes[j : j + count] & 3)
+    # invalid characters inside the k-mer window
+    invalid = np.concatenate(([0], np.cumsum(codes >= 4)))
+    hashes = hash_kmers(ids)
+    hashes[invalid[k : k + count] - invalid[:count] > 0] = np.iinfo("uint64").max
+    return hashes
+
+
+def find_minimizers(codes, k=KMER_SIZE, w=WINDOW_SIZE):
+    """finds the minimizer of every window of w neighboring k-mers
+
+    Args:
+        codes (numpy array): codes of the sequence
+        k (int, optional): k-mer length. Defaults to KMER_SIZE.
+        w (int, optional): k-mers per window. Defaults to WINDOW_SIZE.
+
+    Returns:
+        tuple: (hashes, positions) of the minimizers, each position once
+    """
+    hashes = kmer_hashes(codes, k)
+    if not len(hashes):
+        return hashes, np.zeros(0, dtype="int64")
+    w = min(w, len(hashes))
+    windows = np.lib.stride_tricks.sliding_window_view(hashes, w)
+    positions = np.unique(np.argmin(windows, axis=1) + np.arange(len(windows)))
+    positions = positions[hashes[positions] != np.iinfo("uint64").max]
+    return hashes[positions], positions
+
+
+def build_index(reference, k=KMER_SIZE, w=WINDOW_SIZE):
+    """stores the positions of all minimizers of the reference,
+    sorted by hash - all positions of one minimizer are neighbors
+
+    Args:
+        reference (str): reference sequence (without sentinel)
+        k (int, optional): k-mer length. Defaults to KMER_SIZE.
+        w (int, optional): k-mers per window. Defaults to WINDOW_SIZE.
+
+    Returns:
+        dict: index with the arrays hashes, positions and k, w,
+        length and checksum of the reference
+    """
+    hashes, positions = find_minimizers(se.encode(reference), k, w)
+    order = np.argsort(hashes, kind="stable")
+    return {
+        "hashes": hashes[order],
+        "positions": positions[order],
+        "k": k,
+        "w": w,
+        "length": len(reference),
+        "checksum": zlib.crc32(reference.encode("ascii")),
+    }
+
+
+def check_index(index, reference, k=KMER_SIZE, w=WINDOW_SIZE):
+    """makes sure the index was built for this reference and
+    these parameters - a stale index maps reads to wrong places
+
+    Args:
+        index (dict): see build_index
+        reference (str): reference sequence (without sentinel)
+        k (int, optional): k-mer length. Defaults to KMER_SIZE.
+        w (int, optional): k-mers per window. Defaults to WINDOW_SIZE.
+
+    Raises:
+        ValueError: index does not belong to the reference or parameters
+    """
+    expected = {
+        "k": k,
+        "w": w,
+        "length": len(reference),
+        "checksum": zlib.crc32(reference.encode("ascii")),
+    }
+    for name, value in expected.items():
+        if index.get(name) != value:
+            raise ValueError(
+                f"index does not fit the reference: {name} is "
+                f"{index.get(name)}, expected {value}"
+            )
+
+
+def save_index(path, index):
+    """saves the index into a numpy .npz file
+
+    Args:
+        path (str): file path
+        index (dict): see build_index
+    """
+    np.savez(path, **index)
+
+
+def load_index(path, reference=None, k=KMER_SIZE, w=WINDOW_SIZE):
+    """loads an index saved by save_index
+
+    Args:
+        path (str): file path
+        reference (str, optional): reference the index has to
+        belong to, see check_index. Defaults to None (no check).
+        k (int, optional): expected k-mer length. Defaults to KMER_SIZE.
+        w (int, optional): expected k-mers per window. Defaults to WINDOW_SIZE.
+
+    Raises:
+        ValueError: index does not belong to the reference or parameters
+
+    Returns:
+        dict: see build_index
+    """
+    with np.load(path) as data:
+        index = {name: data[name] for name in data.files}
+    for name in ("k", "w", "length", "checksum"):
+        if name in index:
+            index[name] = int(index[name])
+    if reference is not None:
+        check_index(index, reference, k, w)
+    return index
+
+
+def find_hits(codes, index):
+    """finds the minimizers of the read in the index
+
+    Args:
+        codes (numpy array): codes of the read
+        index (dict): see build_index
+
+    Returns:
+        tuple: (read positions, reference positions) per hit
+    """
+    hashes, read_positions = find_minimizers(codes, index["k"], index["w"])
+    first = np.searchsorted(index["hashes"], hashes, side="left")
+    counts = np.searchsorted(index["hashes"], hashes, side="right") - first
+    counts[counts > MAX_OCCURRENCES] = 0
+    # offset of every hit inside its block of equal hashes
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    reference_positions = index["positions"][np.repeat(first, counts) + offsets]
+    return np.repeat(read_positions, counts), reference_positions
+
+
+def find_candidates(read_positions, reference_positions, bandwidth=BANDWIDTH):
+    """groups hits by diagonal (reference - read position).
+    Hits of one locus lie on neighboring diagonals.
+
+    Args:
+        read_positions (numpy array): see find_hits
+        reference_positions (numpy array): see find_hits
+        bandwidth (int, optional): max distance of two neighboring
+        diagonals in a group. Defaults to BANDWIDTH.
+
+    Returns:
+        list: (seeds, lowest diagonal, highest diagonal) per
+        group with at least MIN_SEEDS hits, most seeds first
+    """
+    diagonals = np.sort(reference_positions - read_positions)
+    if not len(diagonals):
+        return []
+    starts = np.flatnonzero(np.diff(diagonals) > bandwidth) + 1
+    starts = np.concatenate(([0], starts))
+    ends = np.concatenate((starts[1:], [len(diagonals)]))
+    candidates = [
+        (int(end - start), int(diagonals[start]), int(diagonals[end - 1]))
+        for start, end in zip(starts, ends)
+        if end - start >= MIN_SEEDS
+    ]
+    candidates.sort(key=lambda candidate: (-candidate[0], candidate[1]))
+    return candidates[:MAX_CANDIDATES]
+
+
+def find_start(read, reference, end, substitution_matrix=None):
+    """finds the start of a mapped read. The read is aligned
+    backwards from its end, so the span (end - start) differs
+    from the read length, if the read has insertions or deletions.
+
+    Args:
+        read (str): read (without sentinel)
+        reference (str): reference sequence (without sentinel)
+        end (int): reference position behind the last read base
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        int: reference position of the first read base
+    """
+    window_start = max(end - len(read) - BANDWIDTH, 0)
+    _, span = fsa.calculate_score_banded(
+        se.SENTINEL + reference[window_start:end][::-1],
+        se.SENTINEL + read[::-1],
+        -BANDWIDTH,
+        2 * BANDWIDTH + 1,
+        substitution_matrix,
+    )
+    return end - span
+
+
+def map_read(read, reference, index, substitution_matrix=None):
+    """maps one read against the reference - the read and
+    its reverse complement are seeded and verified, the
+    better locus wins (forward strand on equal scores)
+
+    Args:
+        read (str): read (without sentinel)
+        reference (str): reference sequence (without sentinel)
+        index (dict): minimizer index of the reference
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        tuple: (start, end, score, strand) of the best verified
+        locus, strand "-" -> the reverse complement of the read
+        maps there. end - start differs from the read length, if
+        the read has indels. None if the read could not be mapped
+    """
+    best = None
+    for strand, seq in (("+", read), ("-", reverse_complement(read))):
+        candidates = find_candidates(*find_hits(se.encode(seq), index))
+        for _, low, high in candidates:
+            window_start = max(low - BANDWIDTH, 0)
+            window_end = min(high + len(seq) + BANDWIDTH, len(reference))
+            if window_start >= window_end:
+                continue
+            score, end = fsa.calculate_score_banded(
+                se.SENTINEL + reference[window_start:window_end],
+                se.SENTINEL + seq,
+                low - BANDWIDTH - window_start,
+                high - low + 2 * BANDWIDTH + 1,
+                substitution_matrix,
+            )
+            if best is None or score > best[1]:
+                best = (end + window_start, score, strand, seq)
+    if best is None or best[1] < MIN_SCORE_FRACTION * len(read):
+        return None
+    end, score, strand, seq = best
+    return find_start(seq, reference, end, substitution_matrix), end, score, strand
+
+
+def map_reads(
+    reads, reference, index, batch_size=BATCH_SIZE, substitution_matrix=None
+):
+    """maps a stream of reads batch by batch - only one batch
+    is kept in memory
+
+    Args:
+        reads (iterable): (name, read) tuples, e.g. from sequence_io
+        reference (str): reference sequence (without sentinel)
+        index (dict): minimizer index of the reference
+        batch_size (int, optional): reads per batch. Defaults to BATCH_SIZE.
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Yields:
+        list: (name, mapping) per read of a batch, see map_read
+    """
+    batch = []
+    for name, read in reads:
+        batch.append((name, map_read(read, reference, index, substitution_matrix)))
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def main(reference="", reads=None, index_path=None):
+    # change sequences below for your needs!
+    if not reference:
+        rng = np.random.default_rng(1)
+        reference = "".join(rng.choice(list("ACGT"), 2000))
+        reads = [
+            (f"read_{start}", reference[start : start + 150])
+            for start in range(0, 1850, 370)
+        ]
+        reads.append(("read_900_rc", reverse_complement(reference[900:1050])))
+    if index_path is None:
+        index = build_index(reference)
+    else:
+        try:
+            index = load_index(index_path, reference)
+        except (FileNotFoundError, ValueError):
+            # missing or stale index -> build it again
+            index = build_index(reference)
+            save_index(index_path, index)
+    print(f"Minimizers: {len(index['hashes'])} of {len(reference)} positions")
+    for batch in map_reads(reads, reference, index):
+        for name, mapping in batch:
+            if mapping is None:
+                print(f"{name}: unmapped")
+            else:
+                start, end, score, strand = mapping
+                print(f"{name}: {start}-{end} {strand} (score {score})")
+
+
+if __name__ == "__main__":
+    main()
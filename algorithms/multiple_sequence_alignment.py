@@ -24,9 +24,51 @@ MISMATCH = -1
 GAP = -2
 
 
+def surface_scores(len_b, len_a):
+    """scores of one surface of the cube. Surface cells only
+    depend on gaps: the best path takes as many 2d steps (GAP)
+    instead of two 1d steps (2 * GAP) as possible, if GAP < 0.
+
+    Args:
+        len_b (int): rows of the surface
+        len_a (int): columns of the surface
+
+    Returns:
+        numpy matrix: (len_b, len_a) scores relative to the start cell
+    """
+    b, a = np.ogrid[:len_b, :len_a]
+    return 2 * GAP * (a + b) + np.minimum(a, b) * max(-3 * GAP, 0)
+
+
+def plane_cells(d, ls1, ls2, ls3):
+    """flat indices of all inner cube cells with x + y + z = d
+
+    Args:
+        d (int): plane number
+        ls1 (int): len first sequence to alignt
+        ls2 (int): len second sequence to alignt
+        ls3 (int): len third sequence to alignt
+
+    Returns:
+        x, y, z (numpy array): coordinates of the cells
+        cells (numpy array): flat indices of the cells
+    """
+    z = np.arange(max(1, d - (ls2 - 1) - (ls1 - 1)), min(ls3 - 1, d - 2) + 1)
+    y_first = np.maximum(1, d - z - (ls1 - 1))
+    y_counts = np.minimum(ls2 - 1, d - z - 1) - y_first + 1
+    # y runs from y_first to y_first + y_count - 1 for every z
+    z = np.repeat(z, y_counts)
+    run_starts = np.cumsum(y_counts) - y_counts
+    y = np.arange(len(z)) - np.repeat(run_starts - y_first, y_counts)
+    x = d - y - z
+    return x, y, z, (z * ls2 + y) * ls1 + x
+
+
 def calculate_scorematrix(score_matrix, ls1, ls2, ls3, seq1, seq2, seq3):
     """creates a scorematrix with help of the
-    substitution matrix and rewards/ penalties
+    substitution matrix and rewards/ penalties.
+    All cells of a plane x + y + z = d only depend on the
+    planes before, so every plane is calculated at once.
 
     Args:
         score_matrix (np matrix): substitution matrix inside
@@ -38,70 +80,39 @@ def calculate_scorematrix(score_matrix, ls1, ls2, ls3, seq1, seq2, seq3):
     Returns:
         numpy matrix: scorematrix
     """
-    # start at second row and column -> skips initialized cells
-    for z in range(ls3):
-        for y in range(ls2):
-            for x in range(ls1):
-                coords = (x, y, z)
-                if (seq1[x] == seq2[y]) or (seq1[x] == seq3[z]) or (seq2[y] == seq3[z]):
-                    match_value = MATCH
-                else:
-                    match_value = MISMATCH
-
-                # surfaces
-                if coords.count(0) == 1:
-                    # front surface
-                    if z == 0:
-                        score_matrix[z][y][x] = max(
-                            score_matrix[z][y - 1][x - 1] + GAP,
-                            score_matrix[z][y - 1][x] + 2 * GAP,
-                            score_matrix[z][y][x - 1] + 2 * GAP,
-                        )
-                    # top surface
-                    elif y == 0:
-                        score_matrix[z][y][x] = max(
-                            score_matrix[z - 1][y][x - 1] + GAP,
-                            score_matrix[z - 1][y][x] + 2 * GAP,
-                            score_matrix[z][y][x - 1] + 2 * GAP,
-                        )
-                    # left side surface
-                    else:
-                        score_matrix[z][y][x] = max(
-                            score_matrix[z - 1][y - 1][x] + GAP,
-                            score_matrix[z - 1][y][x] + 2 * GAP,
-                            score_matrix[z][y - 1][x] + 2 * GAP,
-                        )
-
-                # border behaviour / Initializing
-                elif coords.count(0) == 2:
-                    # front top border -> go to left
-                    if z == y == 0:
-                        score_matrix[z][y][x] = score_matrix[z][y][x - 1] + 2 * GAP
-                    # front left border -> go up
-                    elif z == x == 0:
-                        score_matrix[z][y][x] = score_matrix[z][y - 1][x] + 2 * GAP
-                    # top left border -> go to front
-                    elif y == x == 0:
-                        score_matrix[z][y][x] = score_matrix[z - 1][y][x] + 2 * GAP
-
-                # start corrdinates
-                elif coords.count(0) == 3:
-                    continue
-
-                # inside cube
-                else:
-                    score_matrix[z][y][x] = max(
-                        # diagonal (3d movement)
-                        score_matrix[z - 1][y - 1][x - 1] + match_value,
-                        # diagonal neighbors (2d movement)
-                        score_matrix[z - 1][y][x - 1] + GAP,
-                        score_matrix[z - 1][y - 1][x] + GAP,
-                        score_matrix[z][y - 1][x - 1] + GAP,
-                        # 1d movement
-                        score_matrix[z][y][x - 1] + 2 * GAP,
-                        score_matrix[z - 1][y][x] + 2 * GAP,
-                        score_matrix[z][y - 1][x] + 2 * GAP,
-                    )
+    # surfaces and borders, the start cell keeps its value
+    start = score_matrix[0, 0, 0]
+    score_matrix[0, :, :] = start + surface_scores(ls2, ls1)
+    score_matrix[:, 0, :] = start + surface_scores(ls3, ls1)
+    score_matrix[:, :, 0] = start + surface_scores(ls3, ls2)
+
+    # inside cube
+    codes1, codes2, codes3 = (np.array(list(seq)) for seq in (seq1, seq2, seq3))
+    flat = score_matrix.reshape(-1)
+    step_x, step_y, step_z = 1, ls1, ls1 * ls2
+    for d in range(3, ls1 + ls2 + ls3 - 2):
+        x, y, z, cells = plane_cells(d, ls1, ls2, ls3)
+        match_values = np.where(
+            (codes1[x] == codes2[y])
+            | (codes1[x] == codes3[z])
+            | (codes2[y] == codes3[z]),
+            MATCH,
+            MISMATCH,
+        )
+        flat[cells] = np.maximum.reduce(
+            [
+                # diagonal (3d movement)
+                flat[cells - step_x - step_y - step_z] + match_values,
+                # diagonal neighbors (2d movement)
+                flat[cells - step_x - step_z] + GAP,
+                flat[cells - step_y - step_z] + GAP,
+                flat[cells - step_x - step_y] + GAP,
+                # 1d movement
+                flat[cells - step_x] + 2 * GAP,
+                flat[cells - step_z] + 2 * GAP,
+                flat[cells - step_y] + 2 * GAP,
+            ]
+        )
 
     return score_matrix
 
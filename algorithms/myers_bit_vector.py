@@ -0,0 +1,147 @@
+# =============================================================================
+# Created By  : Dominique Zeise
+# GitHub      : https://github.com/CharliesCodes
+# Created Date: 2026/10/18
+# Version     : 1.0
+# © Copyright : 2026 Dominique Zeise
+# =============================================================================
+"""
+Myers Bit-Vector Algorithm
+Bit-Parallel Edit Distance
+
+
+This module packs one column of the dynamic programming
+matrix into the bits of a python integer. A whole column
+is computed with a handful of bit operations, instead of
+one operation per cell.
+Used as a prefilter before the free-shift alignment.
+"""
+# =============================================================================
+
+
+def build_match_masks(seq):
+    """creates one bitmask per character. Bit i is set,
+    if the character occurs at position i of the sequence
+
+    Args:
+        seq (str): sequence to encode
+
+    Returns:
+        dict: character -> bitmask (int)
+    """
+    match_masks = {}
+    for i, char in enumerate(seq):
+        match_masks[char] = match_masks.get(char, 0) | (1 << i)
+    return match_masks
+
+
+def edit_distance(pattern, text, semiglobal=False, max_distance=None):
+    """calculates the edit distance (Levenshtein) between
+    pattern and text with the Myers/ Hyyroe bit-vector algorithm
+
+    Args:
+        pattern (str): first sequence, packed into the bit-vectors
+        text (str): second sequence, processed character by character
+        semiglobal (bool, optional): pattern may start and end anywhere
+        in text (best occurence). Defaults to False.
+        max_distance (int, optional): stops early, as soon as the
+        distance can not be max_distance or less. Defaults to None.
+
+    Returns:
+        int: edit distance (max_distance + 1 on early stop)
+    """
+    m = len(pattern)
+    if m == 0:
+        return 0 if semiglobal else len(text)
+    match_masks = build_match_masks(pattern)
+    mask = (1 << m) - 1
+    high_bit = 1 << (m - 1)
+    # global alignment -> first row grows by one per text character
+    top_row = 0 if semiglobal else 1
+
+    plus_vertical = mask
+    minus_vertical = 0
+    score = best_score = m
+    for column, char in enumerate(text, 1):
+        eq = match_masks.get(char, 0)
+        x_vertical = eq | minus_vertical
+        x_horizontal = (((eq & plus_vertical) + plus_vertical) ^ plus_vertical) | eq
+        plus_horizontal = minus_vertical | (~(x_horizontal | plus_vertical) & mask)
+        minus_horizontal = plus_vertical & x_horizontal
+
+        if plus_horizontal & high_bit:
+            score += 1
+        elif minus_horizontal & high_bit:
+            score -= 1
+
+        plus_horizontal = ((plus_horizontal << 1) | top_row) & mask
+        minus_horizontal = (minus_horizontal << 1) & mask
+        plus_vertical = minus_horizontal | (~(x_vertical | plus_horizontal) & mask)
+        minus_vertical = plus_horizontal & x_vertical
+
+        best_score = min(best_score, score)
+        # score can only drop by one per remaining column
+        if max_distance is not None and not semiglobal:
+            if score - (len(text) - column) > max_distance:
+                return max_distance + 1
+    result = best_score if semiglobal else score
+    if max_distance is not None and result > max_distance:
+        return max_distance + 1
+    return result
+
+
+def within_k_edits(pattern, text, k, semiglobal=False):
+    """checks if pattern and text are k or less edits apart
+
+    Args:
+        pattern (str): first sequence
+        text (str): second sequence
+        k (int): max allowed edit distance
+        semiglobal (bool, optional): pattern may occur anywhere
+        in text. Defaults to False.
+
+    Returns:
+        bool: True if edit distance <= k
+    """
+    # length difference alone needs that many indels
+    if not semiglobal and abs(len(pattern) - len(text)) > k:
+        return False
+    return edit_distance(pattern, text, semiglobal, max_distance=k) <= k
+
+
+def lcs_length(seq1, seq2):
+    """calculates the length of the longest common subsequence
+    with the bit-parallel algorithm of Allison-Dix/ Hyyroe.
+    No alignment of the two sequences can contain more
+    matches than this value.
+
+    Args:
+        seq1 (str): first sequence, packed into the bit-vector
+        seq2 (str): second sequence, processed character by character
+
+    Returns:
+        int: length of the longest common subsequence
+    """
+    match_masks = build_match_masks(seq1)
+    mask = (1 << len(seq1)) - 1
+    vector = mask
+    for char in seq2:
+        u = vector & match_masks.get(char, 0)
+        vector = ((vector + u) | (vector - u)) & mask
+    return len(seq1) - bin(vector).count("1")
+
+
+def can_exceed_matches(seq1, seq2, min_matches):
+    """prefilter for the assembly algorithms. Checks with
+    the match upper bound (lcs_length), if any alignment of
+    both sequences can have more than min_matches matches.
+
+    Args:
+        seq1 (str): main sequence
+        seq2 (str): sequence part to align
+        min_matches (float): matches that have to be exceeded
+
+    Returns:
+        bool: False if the threshold can not be exceeded
+    """
+    return lcs_length(seq1, seq2) > min_matches
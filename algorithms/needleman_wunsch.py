@@ -18,9 +18,69 @@ Its the optimized version of the algorithm.
 
 import numpy as np
 
+try:
+    import sequence_encoding as se
+except ImportError:
+    print(
+        "Sequence Encoding not found!\nPlease copy file 'sequence_encoding.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import substitution_matrices as sm
+except ImportError:
+    print(
+        "Substitution Matrices not found!\nPlease copy file 'substitution_matrices.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
 MATCH = 1
 MISMATCH = -1
 GAP = -2
+BANDWIDTH = 16
+
+# traceback directions (2 bit codes)
+STOP = 0
+DIA = 1
+UP = 2
+LEFT = 3
+
+
+def get_substitution_matrix(substitution_matrix=None):
+    """returns the given substitution matrix or creates
+    one from the MATCH/ MISMATCH constants
+
+    Args:
+        substitution_matrix (numpy matrix, optional): (alphabet, alphabet)
+        scores, see substitution_matrices module. Defaults to None.
+
+    Returns:
+        numpy matrix: substitution matrix
+    """
+    if substitution_matrix is None:
+        return sm.create_matrix(MATCH, MISMATCH)
+    return substitution_matrix
+
+
+def get_score_dtype(ls1, ls2, substitution_matrix=None):
+    """chooses the smallest integer type, which can hold
+    every score of two sequences with the given lengths
+
+    Args:
+        ls1 (int): len first sequence to alignt
+        ls2 (int): len second sequence to alignt
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        str: numpy dtype name
+    """
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    max_substitution = int(np.abs(substitution_matrix).max())
+    # factor 2 -> room for the gap offsets of the row fill
+    max_score = 2 * max(max_substitution, abs(GAP)) * (ls1 + ls2)
+    for dtype in ("int16", "int32"):
+        if max_score <= np.iinfo(dtype).max:
+            return dtype
+    return "int64"
 
 
 def initialize_matrix(score_matrix, ls1, ls2):
@@ -70,10 +130,48 @@ def calculate_scorematrix(score_matrix, ls1, ls2, seq1, seq2):
     return score_matrix
 
 
-def traceback(score_matrix, ls1, ls2, seq1, seq2):
-    """traceback from bottom right corner to
-    upper left corner. Finds best scoring path
-    via greedy-algorithm.
+def calculate_scorematrix_wavefront(
+    score_matrix, ls1, ls2, seq1, seq2, substitution_matrix=None
+):
+    """creates the same scorematrix as calculate_scorematrix,
+    but fills it anti-diagonal by anti-diagonal. All cells of
+    one anti-diagonal only depend on the two previous ones,
+    so every diagonal is calculated in one numpy operation.
+
+    Args:
+        score_matrix (np matrix): substitution matrix inside
+        initialized matrix
+        ls1 (int): len first sequence to alignt
+        ls2 (int): len second sequence to alignt
+        seq1 (str): first sequence to alignt
+        seq2 (str): second sequence to alignt
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        numpy matrix: scorematrix
+    """
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    profile = sm.query_profile(substitution_matrix, seq1).astype(score_matrix.dtype)
+    codes2 = se.as_codes(seq2)
+    # flat view -> neighbors are fixed offsets of the cell index
+    flat_matrix = score_matrix.reshape(-1)
+    # start at second row and column -> skips initialized cells
+    for diagonal in range(2, ls1 + ls2 - 1):
+        y = np.arange(max(1, diagonal - ls1 + 1), min(ls2 - 1, diagonal - 1) + 1)
+        x = diagonal - y
+        cells = y * ls1 + x
+        flat_matrix[cells] = np.maximum(
+            flat_matrix[cells - ls1 - 1] + profile[codes2[y], x],
+            np.maximum(flat_matrix[cells - ls1], flat_matrix[cells - 1]) + GAP,
+        )
+    return score_matrix
+
+
+def traceback(score_matrix, ls1, ls2, seq1, seq2, substitution_matrix=None):
+    """traceback from the last cell of the alignment to
+    upper left corner. Every step goes to the neighbor the
+    cell value came from (order on ties: dia, up, left).
 
     Args:
         score_matrix numpy matrix: scorematrix
@@ -81,49 +179,501 @@ def traceback(score_matrix, ls1, ls2, seq1, seq2):
         ls2 (int): len second sequence to alignt
         seq1 (str): first sequence to alignt
         seq2 (str): second sequence to alignt
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
 
     Returns:
         seq1_new (str): redesigned first sequence
         seq2_new (str): redesigned second sequence
     """
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    codes1, codes2 = se.as_codes(seq1), se.as_codes(seq2)
     seq1_new, seq2_new = [], []
-    x = ls1 - 1
-    y = ls2 - 1
+    y, x = get_end_coords(seq1, seq2)
     while x > 0 and y > 0:
-        dia = score_matrix[y - 1][x - 1]
-        up = score_matrix[y - 1][x]
-        left = score_matrix[y][x - 1]
-        max_points = max(dia, up, left)
-
+        match_value = substitution_matrix[codes2[y], codes1[x]]
         # dia
-        if dia == max_points:
-            seq1_new.append(seq1[x - 1])
-            seq2_new.append(seq2[y - 1])
+        if score_matrix[y][x] == score_matrix[y - 1][x - 1] + match_value:
+            seq1_new.append(seq1[x])
+            seq2_new.append(seq2[y])
             x -= 1
             y -= 1
         # up
-        elif up == max_points:
+        elif score_matrix[y][x] == score_matrix[y - 1][x] + GAP:
             seq1_new.append("_")
-            seq2_new.append(seq2[y - 1])
+            seq2_new.append(seq2[y])
             y -= 1
         # left
         else:
             seq2_new.append("_")
-            seq1_new.append(seq1[x - 1])
+            seq1_new.append(seq1[x])
+            x -= 1
+    # left border
+    while y > 0:
+        seq1_new.append("_")
+        seq2_new.append(seq2[y])
+        y -= 1
+    # top border
+    while x > 0:
+        seq2_new.append("_")
+        seq1_new.append(seq1[x])
+        x -= 1
+    # leading sentinels -> dropped by output
+    seq1_new.append(seq1[0])
+    seq2_new.append(seq2[0])
+    return seq1_new, seq2_new
+
+
+def fill_rows(seq1, seq2, substitution_matrix=None):
+    """fills the scorematrix row by row and keeps only
+    the current row in memory. Gaps inside a row are resolved
+    with a cumulative maximum, so every row is one numpy operation.
+
+    Args:
+        seq1 (str): first sequence to alignt (leading sentinel)
+        seq2 (str): second sequence to alignt (leading sentinel)
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Yields:
+        tuple: (y, row) row index and row of the scorematrix
+    """
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    dtype = get_score_dtype(len(seq1), len(seq2), substitution_matrix)
+    # one score row per residue -> substitution scores of a row are one gather
+    profile = sm.query_profile(substitution_matrix, seq1).astype(dtype)
+    codes2 = se.as_codes(seq2)
+    gap_offsets = np.arange(len(seq1), dtype=dtype) * GAP
+    row = gap_offsets.copy()
+    yield 0, row
+    for y in range(1, len(seq2)):
+        match_values = profile[codes2[y], 1:]
+        candidates = np.empty_like(row)
+        candidates[0] = y * GAP
+        candidates[1:] = np.maximum(row[:-1] + match_values, row[1:] + GAP)
+        # cell = max(candidate, left cell + GAP) for the whole row
+        row = np.maximum.accumulate(candidates - gap_offsets) + gap_offsets
+        yield y, row
+
+
+def calculate_last_row(seq1, seq2, substitution_matrix=None):
+    """calculates only the last row of the scorematrix
+
+    Args:
+        seq1 (str): first sequence to alignt (leading sentinel)
+        seq2 (str): second sequence to alignt (leading sentinel)
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        numpy array: last row of the scorematrix
+    """
+    for _, row in fill_rows(seq1, seq2, substitution_matrix):
+        pass
+    return row.astype("int64")
+
+
+def get_end_coords(seq1, seq2):
+    """finds the last cell of the alignment. Trailing sentinels
+    on both sequences only close the scorematrix and are not
+    part of the alignment, so the alignment ends one cell
+    before the bottom right corner.
+
+    Args:
+        seq1 (str): first sequence to alignt
+        seq2 (str): second sequence to alignt
+
+    Returns:
+        tuple: (y, x) coordinates of the last cell of the alignment
+    """
+    y, x = len(seq2) - 1, len(seq1) - 1
+    if (
+        y > 0
+        and x > 0
+        and se.as_string(seq1[-1:]) == se.SENTINEL
+        and se.as_string(seq2[-1:]) == se.SENTINEL
+    ):
+        return y - 1, x - 1
+    return y, x
+
+
+def get_direction(pointer_matrix, y, x):
+    """reads the 2 bit direction code of one cell
+
+    Args:
+        pointer_matrix (numpy matrix): packed direction codes
+        y (int): row of the cell
+        x (int): column of the cell
+
+    Returns:
+        int: direction code
+    """
+    return (int(pointer_matrix[y][x >> 2]) >> ((x & 3) * 2)) & 3
+
+
+def calculate_pointermatrix(ls1, ls2, seq1, seq2, substitution_matrix=None):
+    """fills the scorematrix row by row and stores only the
+    traceback direction of every cell - 2 bits per cell.
+    The direction is the neighbor the cell value came from
+    (order on ties: dia, up, left).
+
+    Args:
+        ls1 (int): len first sequence to alignt
+        ls2 (int): len second sequence to alignt
+        seq1 (str): first sequence to alignt
+        seq2 (str): second sequence to alignt
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        pointer_matrix (numpy matrix): packed direction codes
+        score (int): score of the alignment (trailing sentinels not scored)
+        coords (tuple): (y, x) coordinates of the last cell of the alignment
+    """
+    end_y, end_x = get_end_coords(seq1, seq2)
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    profile = sm.query_profile(substitution_matrix, seq1)
+    codes2 = se.as_codes(seq2)
+    pointer_matrix = np.zeros((ls2, -(-ls1 // 4)), dtype="uint8")
+    for y, row in fill_rows(seq1, seq2, substitution_matrix):
+        if y > 0:
+            dia = previous[:-1] + profile[codes2[y], 1:]
+            directions = np.where(
+                row[1:] == dia, DIA, np.where(row[1:] == previous[1:] + GAP, UP, LEFT)
+            )
+            pointer_matrix[y] = se.pack_2bit(np.concatenate(([STOP], directions)))
+        if y == end_y:
+            score = int(row[end_x])
+        previous = row
+    return pointer_matrix, score, (end_y, end_x)
+
+
+def traceback_pointers(pointer_matrix, ls1, ls2, seq1, seq2):
+    """traceback from the last cell of the alignment to upper
+    left corner by following the stored directions
+
+    Args:
+        pointer_matrix (numpy matrix): packed direction codes
+        ls1 (int): len first sequence to alignt
+        ls2 (int): len second sequence to alignt
+        seq1 (str): first sequence to alignt
+        seq2 (str): second sequence to alignt
+
+    Returns:
+        seq1_new (str): redesigned first sequence
+        seq2_new (str): redesigned second sequence
+    """
+    seq1, seq2 = se.as_string(seq1), se.as_string(seq2)
+    seq1_new, seq2_new = [], []
+    y, x = get_end_coords(seq1, seq2)
+    while x > 0 and y > 0:
+        direction = get_direction(pointer_matrix, y, x)
+        if direction == DIA:
+            seq1_new.append(seq1[x])
+            seq2_new.append(seq2[y])
+            x -= 1
+            y -= 1
+        elif direction == UP:
+            seq1_new.append("_")
+            seq2_new.append(seq2[y])
+            y -= 1
+        else:
+            seq2_new.append("_")
+            seq1_new.append(seq1[x])
             x -= 1
     # left border
     while y > 0:
         seq1_new.append("_")
-        seq2_new.append(seq2[y - 1])
+        seq2_new.append(seq2[y])
         y -= 1
     # top border
     while x > 0:
         seq2_new.append("_")
-        seq1_new.append(seq1[x - 1])
+        seq1_new.append(seq1[x])
         x -= 1
+    # leading sentinels -> dropped by output
+    seq1_new.append(seq1[0])
+    seq2_new.append(seq2[0])
     return seq1_new, seq2_new
 
 
+def calculate_score(seq1, seq2, substitution_matrix=None):
+    """score only alignment for screening and ranking.
+    Never allocates the scorematrix. Trailing sentinels on
+    both sequences are not scored (see get_end_coords).
+
+    Args:
+        seq1 (str): first sequence to alignt
+        seq2 (str): second sequence to alignt
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        tuple: (score, (y, x)) optimal score and the
+        coordinates of the last cell of the alignment
+    """
+    y, x = get_end_coords(seq1, seq2)
+    last_row = calculate_last_row(seq1[: x + 1], seq2[: y + 1], substitution_matrix)
+    return int(last_row[-1]), (y, x)
+
+
+def hirschberg(seq1, seq2, substitution_matrix=None):
+    """aligns two sequences globally in linear memory.
+    Splits seq2 in the middle and finds the column, where
+    the optimal path crosses this row, from a forward and a
+    backward last row. Both halves are aligned recursively.
+
+    Args:
+        seq1 (str): first sequence to alignt (no sentinels)
+        seq2 (str): second sequence to alignt (no sentinels)
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        seq1_aligned (list): first sequence with gaps
+        seq2_aligned (list): second sequence with gaps
+    """
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    ls1 = len(seq1)
+    ls2 = len(seq2)
+    if ls1 == 0 or ls2 == 0:
+        return list(seq1) + ["_"] * ls2, ["_"] * ls1 + list(seq2)
+
+    # small problems -> full matrix + exact traceback
+    if ls2 == 1 or ls1 * ls2 <= 4096:
+        score_matrix = np.zeros((ls2 + 1, ls1 + 1), dtype="int64")
+        score_matrix = initialize_matrix(score_matrix, ls1 + 1, ls2 + 1)
+        score_matrix = calculate_scorematrix_wavefront(
+            score_matrix,
+            ls1 + 1,
+            ls2 + 1,
+            "," + seq1,
+            "," + seq2,
+            substitution_matrix,
+        )
+        codes1 = se.as_codes(seq1)
+        codes2 = se.as_codes(seq2)
+        seq1_aligned, seq2_aligned = [], []
+        x, y = ls1, ls2
+        while x > 0 or y > 0:
+            match_value = substitution_matrix[codes2[y - 1], codes1[x - 1]]
+            if (
+                x > 0
+                and y > 0
+                and score_matrix[y][x] == score_matrix[y - 1][x - 1] + match_value
+            ):
+                seq1_aligned.append(seq1[x - 1])
+                seq2_aligned.append(seq2[y - 1])
+                x -= 1
+                y -= 1
+            elif y > 0 and score_matrix[y][x] == score_matrix[y - 1][x] + GAP:
+                seq1_aligned.append("_")
+                seq2_aligned.append(seq2[y - 1])
+                y -= 1
+            else:
+                seq1_aligned.append(seq1[x - 1])
+                seq2_aligned.append("_")
+                x -= 1
+        return seq1_aligned[::-1], seq2_aligned[::-1]
+
+    mid = ls2 // 2
+    forward = calculate_last_row("," + seq1, "," + seq2[:mid], substitution_matrix)
+    backward = calculate_last_row(
+        "," + seq1[::-1], "," + seq2[mid:][::-1], substitution_matrix
+    )
+    split = int(np.argmax(forward + backward[::-1]))
+    left1, left2 = hirschberg(seq1[:split], seq2[:mid], substitution_matrix)
+    right1, right2 = hirschberg(seq1[split:], seq2[mid:], substitution_matrix)
+    return left1 + right1, left2 + right2
+
+
+def hirschberg_traceback(seq1, seq2, substitution_matrix=None):
+    """linear memory replacement for the scorematrix and
+    traceback steps. Returns the alignment in the same
+    format as traceback (reversed, sentinel at the end).
+    The alignment has the same optimal score, but the split
+    columns break ties differently than the traceback, so it
+    can be another optimal alignment with another similarity.
+
+    Args:
+        seq1 (str): first sequence to alignt
+        seq2 (str): second sequence to alignt
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        seq1_new (str): redesigned first sequence
+        seq2_new (str): redesigned second sequence
+    """
+    y, x = get_end_coords(seq1, seq2)
+    seq1_aligned, seq2_aligned = hirschberg(
+        seq1[1 : x + 1], seq2[1 : y + 1], substitution_matrix
+    )
+    seq1_new = seq1_aligned[::-1] + [seq1[0]]
+    seq2_new = seq2_aligned[::-1] + [seq2[0]]
+    return seq1_new, seq2_new
+
+
+def calculate_scorematrix_banded(
+    ls1, ls2, seq1, seq2, bandwidth, substitution_matrix=None
+):
+    """creates the scorematrix only inside a band of diagonals
+    around the main diagonal. Row y of the band matrix holds
+    the cells x = y + lowest_diagonal + j. Cells outside the
+    band get a very low score, so no path leaves the band.
+
+    Args:
+        ls1 (int): len first sequence to alignt
+        ls2 (int): len second sequence to alignt
+        seq1 (str): first sequence to alignt
+        seq2 (str): second sequence to alignt
+        bandwidth (int): diagonals added on each side of the band
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        band_matrix (numpy matrix): scorematrix inside the band
+        lowest_diagonal (int): diagonal (x - y) of the first band column
+    """
+    lowest_diagonal = min(0, ls1 - ls2) - bandwidth
+    highest_diagonal = max(0, ls1 - ls2) + bandwidth
+    width = highest_diagonal - lowest_diagonal + 1
+    outside = np.iinfo("int32").min // 2
+
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    profile = sm.query_profile(substitution_matrix, seq1)
+    codes2 = se.as_codes(seq2)
+    columns = np.arange(width)
+    gap_offsets = columns * GAP
+    band_matrix = np.full((ls2, width), outside, dtype="int32")
+    x = lowest_diagonal + columns
+    inside = (x >= 0) & (x < ls1)
+    band_matrix[0][inside] = x[inside] * GAP
+
+    for y in range(1, ls2):
+        x = y + lowest_diagonal + columns
+        previous = band_matrix[y - 1].astype("int64")
+        match_values = profile[codes2[y], np.clip(x, 0, ls1 - 1)]
+        # dia -> same band column, up -> next band column
+        candidates = previous + match_values
+        candidates[:-1] = np.maximum(candidates[:-1], previous[1:] + GAP)
+        candidates[x < 0] = outside
+        candidates[x == 0] = y * GAP
+        # cell = max(candidate, left cell + GAP) for the whole band row
+        row = np.maximum.accumulate(candidates - gap_offsets) + gap_offsets
+        row[(x < 0) | (x >= ls1)] = outside
+        band_matrix[y] = np.maximum(row, outside)
+    return band_matrix, lowest_diagonal
+
+
+def traceback_banded(
+    band_matrix, lowest_diagonal, ls1, ls2, seq1, seq2, substitution_matrix=None
+):
+    """traceback from the last cell of the alignment to upper left
+    corner inside the band. Same decisions as traceback.
+
+    Args:
+        band_matrix (numpy matrix): scorematrix inside the band
+        lowest_diagonal (int): diagonal (x - y) of the first band column
+        ls1 (int): len first sequence to alignt
+        ls2 (int): len second sequence to alignt
+        seq1 (str): first sequence to alignt
+        seq2 (str): second sequence to alignt
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        seq1_new (str): redesigned first sequence
+        seq2_new (str): redesigned second sequence
+        touches_edge (bool): path runs along the band edge
+    """
+    width = band_matrix.shape[1]
+    outside = np.iinfo("int32").min // 2
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    codes1, codes2 = se.as_codes(seq1), se.as_codes(seq2)
+
+    def score(y, x):
+        j = x - y - lowest_diagonal
+        return int(band_matrix[y][j]) if 0 <= j < width else outside
+
+    seq1_new, seq2_new = [], []
+    touches_edge = False
+    y, x = get_end_coords(seq1, seq2)
+    while x > 0 and y > 0:
+        j = x - y - lowest_diagonal
+        if j in (0, width - 1):
+            touches_edge = True
+        match_value = substitution_matrix[codes2[y], codes1[x]]
+        # dia
+        if score(y, x) == score(y - 1, x - 1) + match_value:
+            seq1_new.append(seq1[x])
+            seq2_new.append(seq2[y])
+            x -= 1
+            y -= 1
+        # up
+        elif score(y, x) == score(y - 1, x) + GAP:
+            seq1_new.append("_")
+            seq2_new.append(seq2[y])
+            y -= 1
+        # left
+        else:
+            seq2_new.append("_")
+            seq1_new.append(seq1[x])
+            x -= 1
+    # left border
+    while y > 0:
+        seq1_new.append("_")
+        seq2_new.append(seq2[y])
+        y -= 1
+    # top border
+    while x > 0:
+        seq2_new.append("_")
+        seq1_new.append(seq1[x])
+        x -= 1
+    # leading sentinels -> dropped by output
+    seq1_new.append(seq1[0])
+    seq2_new.append(seq2[0])
+    return seq1_new, seq2_new, touches_edge
+
+
+def banded_alignment(
+    seq1, seq2, bandwidth=BANDWIDTH, auto_widen=True, substitution_matrix=None
+):
+    """global alignment for near-identical sequences.
+    Only fills a band of diagonals. With auto_widen the band
+    is doubled and the alignment repeated as long as the
+    traceback runs along the band edge.
+
+    Args:
+        seq1 (str): first sequence to alignt
+        seq2 (str): second sequence to alignt
+        bandwidth (int, optional): diagonals added on each side
+        of the band. Defaults to BANDWIDTH.
+        auto_widen (bool, optional): widen band on edge contact.
+        Defaults to True.
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        seq1_new (str): redesigned first sequence
+        seq2_new (str): redesigned second sequence
+    """
+    ls1 = len(seq1)
+    ls2 = len(seq2)
+    while True:
+        band_matrix, lowest_diagonal = calculate_scorematrix_banded(
+            ls1, ls2, seq1, seq2, bandwidth, substitution_matrix
+        )
+        seq1_new, seq2_new, touches_edge = traceback_banded(
+            band_matrix, lowest_diagonal, ls1, ls2, seq1, seq2, substitution_matrix
+        )
+        # band already covers the whole matrix -> nothing to widen
+        covers_matrix = bandwidth >= max(ls1, ls2)
+        if not (auto_widen and touches_edge) or covers_matrix:
+            return seq1_new, seq2_new
+        bandwidth *= 2
+
+
 def output(seq1_new, seq2_new):
     """generates and prints an alignment output string
     which shows matches (|) and mismatches (*)
@@ -166,20 +716,55 @@ def calc_similarity(alignment_output):
     return (abs_count, rel_count)
 
 
-def main(seq1="", seq2=""):
+def main(
+    seq1="", seq2="", mode="pointer", bandwidth=BANDWIDTH, substitution_matrix=None
+):
     # change sequences below for your needs!
+    # mode: "pointer" (2 bit traceback directions), "classic" (cell by cell),
+    # "wavefront" (anti-diagonals), "hirschberg" (linear memory)
+    # or "banded" (near-identical sequences)
+    # substitution_matrix: e.g. sm.BLOSUM62 (all modes except "classic")
+    # encoded sequences come without sentinels
+    if se.is_encoded(seq1):
+        seq1 = se.as_string(se.with_sentinel(seq1, trailing=True))
+    if se.is_encoded(seq2):
+        seq2 = se.as_string(se.with_sentinel(seq2, trailing=True))
     if not (seq1 or seq2):
         seq1 = ",AATGC,"
         seq2 = ",ATGC,"
     ls1 = len(seq1)
     ls2 = len(seq2)
-    score_matrix = np.zeros((ls2, ls1), dtype="int16")
-    score_matrix = initialize_matrix(score_matrix, ls1, ls2)
-    score_matrix = calculate_scorematrix(score_matrix, ls1, ls2, seq1, seq2)
-    seq1_new, seq2_new = traceback(score_matrix, ls1, ls2, seq1, seq2)
+    if mode == "pointer":
+        pointer_matrix, _, _ = calculate_pointermatrix(
+            ls1, ls2, seq1, seq2, substitution_matrix
+        )
+        seq1_new, seq2_new = traceback_pointers(pointer_matrix, ls1, ls2, seq1, seq2)
+    elif mode == "hirschberg":
+        seq1_new, seq2_new = hirschberg_traceback(seq1, seq2, substitution_matrix)
+    elif mode == "banded":
+        seq1_new, seq2_new = banded_alignment(
+            seq1, seq2, bandwidth, substitution_matrix=substitution_matrix
+        )
+    else:
+        score_dtype = get_score_dtype(ls1, ls2, substitution_matrix)
+        score_matrix = np.zeros((ls2, ls1), dtype=score_dtype)
+        score_matrix = initialize_matrix(score_matrix, ls1, ls2)
+        if mode == "wavefront":
+            score_matrix = calculate_scorematrix_wavefront(
+                score_matrix, ls1, ls2, seq1, seq2, substitution_matrix
+            )
+        else:
+            # classic fill only knows MATCH/ MISMATCH
+            substitution_matrix = None
+            score_matrix = calculate_scorematrix(score_matrix, ls1, ls2, seq1, seq2)
+        seq1_new, seq2_new = traceback(
+            score_matrix, ls1, ls2, seq1, seq2, substitution_matrix
+        )
     alignment_output = output(seq1_new, seq2_new)
     sim_tup = calc_similarity(alignment_output)
     print(f"\nSimilarity: {round(sim_tup[1]*100, 2)}%")
+    if mode == "hirschberg":
+        print("(one of the optimal alignments - can differ from the other modes)")
 
 
 if __name__ == "__main__":
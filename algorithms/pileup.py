@@ -0,0 +1,267 @@
+# =============================================================================
+# Created By  : Dominique Zeise
+# GitHub      : https://github.com/CharliesCodes
+# Created Date: 2026/10/18
+# Version     : 1.0
+# © Copyright : 2026 Dominique Zeise
+# =============================================================================
+"""
+Pileup
+
+
+This module stacks mapped reads on top of a reference.
+For every reference position only the number of reads with
+each base is stored - a (length, alphabet) count array - so
+the memory does not grow with the number of reads.
+The consensus is the most frequent base of every position.
+Mapped reads with insertions or deletions are aligned end to
+end against their reference window first, so the bases behind
+an indel are counted at the right positions.
+"""
+# =============================================================================
+
+import numpy as np
+
+try:
+    import sequence_encoding as se
+except ImportError:
+    print(
+        "Sequence Encoding not found!\nPlease copy file 'sequence_encoding.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+
+# A, C, G, T - other codes (e.g. N) are not counted
+ALPHABET_SIZE = 4
+# positions covered by fewer reads keep the reference base
+MIN_COVERAGE = 1
+# extra reference positions on each side of an aligned read
+INDEL_MARGIN = 8
+# reads without gaps with more mismatches are aligned - an insertion
+# and a deletion of the same read do not change its span
+MAX_MISMATCH_RATE = 0.1
+# scores of the read alignment - a mismatch costs less than a gap,
+# so substitutions are never turned into indels
+MATCH = 1
+MISMATCH = -4
+GAP = -6
+
+# traceback directions
+DIA = 1
+UP = 2
+LEFT = 3
+
+
+def create_pileup(length, alphabet_size=ALPHABET_SIZE):
+    """creates an empty pileup
+
+    Args:
+        length (int): reference length
+        alphabet_size (int, optional): counted codes.
+        Defaults to ALPHABET_SIZE.
+
+    Returns:
+        numpy matrix: (length, alphabet_size) read counts
+    """
+    return np.zeros((length, alphabet_size), dtype="uint32")
+
+
+def add_bases(pileup, positions, codes):
+    """counts single bases - only the touched cells are updated
+
+    Args:
+        pileup (numpy matrix): see create_pileup
+        positions (numpy array): reference position per base
+        codes (numpy array): code per base
+    """
+    length, alphabet_size = pileup.shape
+    positions, codes = np.asarray(positions), np.asarray(codes, dtype="int64")
+    counted = (positions >= 0) & (positions < length) & (codes < alphabet_size)
+    cells, counts = np.unique(
+        positions[counted] * alphabet_size + codes[counted], return_counts=True
+    )
+    flat = pileup.reshape(-1)
+    flat[cells] += counts.astype(pileup.dtype)
+
+
+def add_reads(pileup, starts, reads):
+    """counts the bases of many reads at once, without gaps.
+    Read bases outside the reference are ignored.
+
+    Args:
+        pileup (numpy matrix): see create_pileup
+        starts (list): reference position of the first base per read
+        reads (list): strings or encoded reads (without sentinel)
+    """
+    if not len(reads):
+        return
+    codes = [se.as_codes(read) for read in reads]
+    read_lens = np.array([len(read) for read in codes])
+    # batch index of the first base per read -> reference position per base
+    read_offsets = np.cumsum(read_lens) - read_lens
+    positions = np.repeat(np.asarray(starts) - read_offsets, read_lens)
+    positions += np.arange(len(positions))
+    add_bases(pileup, positions, np.concatenate(codes))
+
+
+def align_read(read, reference, start, end):
+    """aligns the whole read against its reference window.
+    The read is aligned end to end, the window may be left
+    out at both ends (read global, window local).
+
+    Args:
+        read (str): read (without sentinel)
+        reference (str): reference sequence (without sentinel)
+        start (int): mapped start of the read
+        end (int): mapped end of the read
+
+    Returns:
+        positions (numpy array): reference position per aligned
+        read base - inserted bases are left out
+        codes (numpy array): code per aligned read base
+    """
+    window_start = max(start - INDEL_MARGIN, 0)
+    window = se.encode(reference[window_start : end + INDEL_MARGIN])
+    codes = se.encode(read)
+    gap_offsets = np.arange(len(window) + 1) * GAP
+    directions = np.zeros((len(codes) + 1, len(window) + 1), dtype="uint8")
+    directions[1:, 0] = UP
+    # the read may start anywhere in the window -> first row is 0
+    row = np.zeros(len(window) + 1, dtype="int64")
+    for y in range(1, len(codes) + 1):
+        dia = row[:-1] + np.where(window == codes[y - 1], MATCH, MISMATCH)
+        up = row[1:] + GAP
+        candidates = np.empty_like(row)
+        candidates[0] = y * GAP
+        candidates[1:] = np.maximum(dia, up)
+        # cell = max(candidate, left cell + GAP) for the whole row
+        row = np.maximum.accumulate(candidates - gap_offsets) + gap_offsets
+        directions[y, 1:] = np.where(
+            row[1:] == dia, DIA, np.where(row[1:] == up, UP, LEFT)
+        )
+
+    # the read may end anywhere in the window -> best cell of the last row
+    y, x = len(codes), int(np.argmax(row))
+    positions, bases = [], []
+    while y > 0:
+        direction = directions[y, x]
+        if direction == DIA:
+            positions.append(window_start + x - 1)
+            bases.append(codes[y - 1])
+            x -= 1
+            y -= 1
+        elif direction == UP:
+            y -= 1
+        else:
+            x -= 1
+    return (
+        np.array(positions[::-1], dtype="int64"),
+        np.array(bases[::-1], dtype="uint8"),
+    )
+
+
+def add_mapped_reads(pileup, reference, starts, ends, reads):
+    """counts mapped reads. Reads whose mapped span has their
+    length are counted without gaps - substitutions anywhere in
+    the read stay at their position. Reads with another span
+    (or too many mismatches without gaps) have indels and are
+    aligned first, an indel shifts every base behind it. Bases
+    inserted relative to the reference have no position and
+    are not counted.
+
+    Args:
+        pileup (numpy matrix): see create_pileup
+        reference (str): reference sequence (without sentinel)
+        starts (list): reference position of the first base per read
+        ends (list): reference position behind the last base per read
+        reads (list): strings or encoded reads (without sentinel)
+    """
+    reads = [se.as_string(read) for read in reads]
+    gapless_starts, gapless_reads = [], []
+    for start, end, read in zip(starts, ends, reads):
+        window = reference[max(start, 0) : end]
+        if end - start == len(read) and len(window) == len(read):
+            mismatches = np.count_nonzero(se.encode(window) != se.encode(read))
+            if mismatches <= MAX_MISMATCH_RATE * len(read):
+                gapless_starts.append(start)
+                gapless_reads.append(read)
+                continue
+        add_bases(pileup, *align_read(read, reference, start, end))
+    add_reads(pileup, gapless_starts, gapless_reads)
+
+
+def consensus(pileup, reference=None, min_coverage=MIN_COVERAGE):
+    """calls the majority base of every position
+
+    Args:
+        pileup (numpy matrix): see create_pileup
+        reference (str, optional): bases of positions with too
+        little coverage. Defaults to None ("N").
+        min_coverage (int, optional): reads needed for a call.
+        Defaults to MIN_COVERAGE.
+
+    Returns:
+        consensus (str): majority sequence
+        coverage (numpy array): reads per position
+    """
+    coverage = pileup.sum(axis=1)
+    codes = np.argmax(pileup, axis=1).astype("uint8")
+    if reference is None:
+        fallback = np.full(len(codes), se.CODE_TABLE[ord("N")], dtype="uint8")
+    else:
+        fallback = se.as_codes(reference)
+    codes = np.where(coverage >= min_coverage, codes, fallback)
+    return se.decode(codes), coverage
+
+
+def coverage_stats(pileup, coverage):
+    """summarizes coverage and agreement of the pileup
+
+    Args:
+        pileup (numpy matrix): see create_pileup
+        coverage (numpy array): see consensus
+
+    Returns:
+        dict: mean, min and max coverage, covered share of the
+        reference and share of read bases agreeing with the consensus
+    """
+    if not len(coverage):
+        return {"mean": 0.0, "min": 0, "max": 0, "covered": 0.0, "agreement": 0.0}
+    bases = int(coverage.sum())
+    return {
+        "mean": float(coverage.mean()),
+        "min": int(coverage.min()),
+        "max": int(coverage.max()),
+        "covered": float((coverage > 0).mean()),
+        "agreement": int(pileup.max(axis=1).sum()) / bases if bases else 0.0,
+    }
+
+
+def output(stats):
+    """prints the coverage statistics
+
+    Args:
+        stats (dict): see coverage_stats
+    """
+    print(
+        f"Coverage: {stats['mean']:.1f}x (min {stats['min']}, max {stats['max']}),"
+        f" covered {round(stats['covered'] * 100, 2)}%,"
+        f" agreement {round(stats['agreement'] * 100, 2)}%"
+    )
+
+
+def main():
+    # change sequences below for your needs!
+    reference = "GATTACAGATTACA"
+    # reads of an individual with C instead of A at position 6
+    reads = ["GATTACC", "TACCGAT", "CCGATTA", "GATTACA"]
+    starts = [0, 3, 5, 7]
+    pileup = create_pileup(len(reference))
+    add_reads(pileup, starts, reads)
+    seq, coverage = consensus(pileup, reference)
+    print(reference)
+    print(seq)
+    output(coverage_stats(pileup, coverage))
+
+
+if __name__ == "__main__":
+    main()
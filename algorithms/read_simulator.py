@@ -0,0 +1,323 @@
+# =============================================================================
+# Created By  : Dominique Zeise
+# GitHub      : https://github.com/CharliesCodes
+# Created Date: 2026/10/18
+# Version     : 1.0
+# © Copyright : 2026 Dominique Zeise
+# =============================================================================
+"""
+Read Simulator
+
+
+This module creates random references and sequencing reads
+with numpy - whole batches of reads per step instead of one
+base per step. A seeded random generator makes every dataset
+reproducible. Reads get substitution, insertion and deletion
+errors, fixed or variable lengths, or come as pairs from both
+ends of a fragment. The true origin of every read can be
+written to disk together with the reads.
+"""
+# =============================================================================
+
+import numpy as np
+
+try:
+    import sequence_encoding as se
+except ImportError:
+    print(
+        "Sequence Encoding not found!\nPlease copy file 'sequence_encoding.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import sequence_io as sio
+except ImportError:
+    print(
+        "Sequence IO not found!\nPlease copy file 'sequence_io.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+
+READ_LENGTH = 150
+COVERAGE = 30
+SUBSTITUTION_RATE = 0.001
+INSERTION_RATE = 0.0001
+DELETION_RATE = 0.0001
+# paired mode: fragment length (mean, standard deviation)
+FRAGMENT_LENGTH = 400
+FRAGMENT_SD = 40
+# reads per batch of simulate_reads
+BATCH_SIZE = 65536
+
+
+def random_sequence(length, rng):
+    """random DNA sequence
+
+    Args:
+        length (int): number of bases
+        rng (numpy Generator): random generator
+
+    Returns:
+        numpy array: uint8 codes (A, C, G, T)
+    """
+    return rng.integers(0, 4, length, dtype="uint8")
+
+
+def split_sequence(codes, lengths):
+    """cuts one code array into consecutive parts
+
+    Args:
+        codes (numpy array): codes
+        lengths (numpy array): length of every part
+
+    Returns:
+        list: code arrays (views)
+    """
+    return np.split(codes, np.cumsum(lengths)[:-1])
+
+
+def random_sequences(count, min_len, max_len, rng):
+    """unrelated random DNA sequences of random lengths
+
+    Args:
+        count (int): number of sequences
+        min_len (int): min length
+        max_len (int): max length
+        rng (numpy Generator): random generator
+
+    Returns:
+        list: uint8 code arrays
+    """
+    lengths = rng.integers(min_len, max_len + 1, count)
+    return split_sequence(random_sequence(int(lengths.sum()), rng), lengths)
+
+
+def tile(length, min_len, max_len, sets, rng):
+    """cuts a sequence into consecutive parts of random length,
+    sets times. A rest of at most min_len positions becomes
+    the last part of a set.
+
+    Args:
+        length (int): sequence length
+        min_len (int): min part length
+        max_len (int): max part length
+        sets (int): number of tilings
+        rng (numpy Generator): random generator
+
+    Returns:
+        tuple: (starts, ends) of all parts
+    """
+    if length <= 0:
+        return np.zeros(0, dtype="int64"), np.zeros(0, dtype="int64")
+    # enough parts to reach the end, even if all are min_len long
+    per_set = length // max(min_len, 1) + 1
+    part_lens = rng.integers(min_len, max_len + 1, (sets, per_set))
+    starts = np.cumsum(part_lens, axis=1) - part_lens
+    # the part reaching the rest takes all of it, later parts are dropped
+    is_rest = length - starts <= min_len
+    last = np.where(is_rest.any(axis=1), np.argmax(is_rest, axis=1), per_set - 1)
+    ends = np.minimum(starts + part_lens, length)
+    ends[np.arange(sets), last] = np.where(
+        is_rest[np.arange(sets), last], length, ends[np.arange(sets), last]
+    )
+    used = (np.arange(per_set) <= last[:, np.newaxis]) & (starts < length)
+    return starts[used], ends[used]
+
+
+def reverse_complement(codes):
+    """reverse complement of DNA codes (A <-> T, C <-> G)
+
+    Args:
+        codes (numpy array): codes (A, C, G, T)
+
+    Returns:
+        numpy array: reverse complement
+    """
+    return (3 - codes[::-1]).astype("uint8")
+
+
+def mutate(
+    codes,
+    lengths,
+    rng,
+    substitution_rate=SUBSTITUTION_RATE,
+    insertion_rate=INSERTION_RATE,
+    deletion_rate=DELETION_RATE,
+):
+    """adds sequencing errors to the concatenated codes of many reads
+
+    Args:
+        codes (numpy array): codes of all reads, one after another
+        lengths (numpy array): length of every read
+        rng (numpy Generator): random generator
+        substitution_rate (float, optional): per base.
+        Defaults to SUBSTITUTION_RATE.
+        insertion_rate (float, optional): per base. Defaults to INSERTION_RATE.
+        deletion_rate (float, optional): per base. Defaults to DELETION_RATE.
+
+    Returns:
+        tuple: (codes, lengths) with errors
+    """
+    codes = codes.copy()
+    events = rng.random(len(codes))
+    substituted = events < substitution_rate
+    # a substitution never gives the same base again
+    shifts = rng.integers(1, 4, substituted.sum(), dtype="uint8")
+    codes[substituted] = (codes[substituted] + shifts) % 4
+    deleted = (events >= substitution_rate) & (
+        events < substitution_rate + deletion_rate
+    )
+    inserted = (events >= substitution_rate + deletion_rate) & (
+        events < substitution_rate + deletion_rate + insertion_rate
+    )
+    # copies per base: 0 -> deleted, 2 -> random base inserted behind it
+    copies = 1 - deleted.astype("int64") + inserted
+    codes = np.repeat(codes, copies)
+    new_ends = np.concatenate(([0], np.cumsum(copies)))
+    codes[new_ends[1:][inserted] - 1] = random_sequence(inserted.sum(), rng)
+    return codes, np.diff(new_ends[np.cumsum(lengths)], prepend=0)
+
+
+def add_errors(reads, rng, **error_rates):
+    """adds sequencing errors to a batch of reads at once
+
+    Args:
+        reads (list): uint8 code arrays
+        rng (numpy Generator): random generator
+        error_rates: substitution_rate, insertion_rate, deletion_rate,
+        see mutate
+
+    Returns:
+        list: reads with errors
+    """
+    if not reads:
+        return []
+    lengths = np.array([len(read) for read in reads])
+    codes, lengths = mutate(np.concatenate(reads), lengths, rng, **error_rates)
+    return split_sequence(codes, lengths)
+
+
+def simulate_reads(
+    reference,
+    rng,
+    coverage=COVERAGE,
+    read_length=READ_LENGTH,
+    min_length=None,
+    paired=False,
+    fragment_length=FRAGMENT_LENGTH,
+    fragment_sd=FRAGMENT_SD,
+    batch_size=BATCH_SIZE,
+    **error_rates,
+):
+    """samples reads from random positions of the reference
+
+    Args:
+        reference (numpy array): uint8 codes of the reference
+        rng (numpy Generator): random generator
+        coverage (float, optional): mean reads per reference base.
+        Defaults to COVERAGE.
+        read_length (int, optional): (max) read length. Defaults to READ_LENGTH.
+        min_length (int, optional): min read length, None -> all
+        reads have read_length. Defaults to None.
+        paired (bool, optional): two reads per fragment, the second
+        one reverse complemented from the fragment end. Defaults to False.
+        fragment_length (int, optional): mean fragment length.
+        Defaults to FRAGMENT_LENGTH.
+        fragment_sd (int, optional): standard deviation of the
+        fragment length. Defaults to FRAGMENT_SD.
+        batch_size (int, optional): reads per batch. Defaults to BATCH_SIZE.
+        error_rates: substitution_rate, insertion_rate, deletion_rate,
+        see mutate
+
+    Yields:
+        tuple: (reads, truth) per batch - truth rows are
+        (name, start, end, strand) of the origin of every read
+    """
+    mean_length = read_length
+    if min_length is not None:
+        mean_length = (min_length + read_length) / 2
+    total = int(coverage * len(reference) / mean_length)
+    if paired:
+        total -= total % 2
+    produced = 0
+    while produced < total:
+        count = min(batch_size, total - produced)
+        if paired:
+            # whole pairs only, at least one per batch
+            pairs = max(count // 2, 1)
+            count = 2 * pairs
+            lengths = np.full(pairs, min(read_length, len(reference)))
+            fragments = rng.normal(fragment_length, fragment_sd, pairs).round()
+            # a fragment holds both reads and fits into the reference
+            fragments = np.clip(fragments, lengths[0], len(reference)).astype("int64")
+            fragment_starts = rng.integers(0, len(reference) - fragments + 1)
+            starts = np.stack((fragment_starts, fragment_starts + fragments - lengths))
+            starts, lengths = starts.T.reshape(-1), np.repeat(lengths, 2)
+            strands = np.tile(["+", "-"], pairs)
+        else:
+            if min_length is None:
+                lengths = np.full(count, read_length)
+            else:
+                lengths = rng.integers(min_length, read_length + 1, count)
+            lengths = np.minimum(lengths, len(reference))
+            starts = rng.integers(0, len(reference) - lengths + 1)
+            strands = np.full(count, "+")
+        # gathers all reads with one index array
+        read_starts = np.cumsum(lengths) - lengths
+        within = np.arange(lengths.sum()) - np.repeat(read_starts, lengths)
+        reverse = np.repeat(strands == "-", lengths)
+        within[reverse] = np.repeat(lengths, lengths)[reverse] - 1 - within[reverse]
+        codes = reference[np.repeat(starts, lengths) + within]
+        codes[reverse] = 3 - codes[reverse]
+        codes, read_lengths = mutate(codes, lengths, rng, **error_rates)
+        reads = split_sequence(codes, read_lengths)
+        if paired:
+            names = [f"read_{(produced + i) // 2}/{i % 2 + 1}" for i in range(count)]
+        else:
+            names = [f"read_{produced + i}" for i in range(count)]
+        ends = (starts + lengths).tolist()
+        truth = list(zip(names, starts.tolist(), ends, strands.tolist()))
+        produced += count
+        yield reads, truth
+
+
+def write_dataset(prefix, reference, batches):
+    """writes reference, reads and the true read origins
+
+    Args:
+        prefix (str): path prefix of the files
+        prefix_reference.fa, prefix_reads.fa and prefix_truth.tsv
+        reference (numpy array): uint8 codes of the reference
+        batches (iterable): see simulate_reads
+
+    Returns:
+        int: number of reads written
+    """
+    sio.write_fasta(f"{prefix}_reference.fa", [("reference", se.decode(reference))])
+    count = 0
+    with open(f"{prefix}_reads.fa", "w") as reads_file, open(
+        f"{prefix}_truth.tsv", "w"
+    ) as truth_file:
+        truth_file.write("name\tstart\tend\tstrand\n")
+        for reads, truth in batches:
+            # one decode per batch, then slices of the decoded string
+            batch_seq = se.decode(np.concatenate(reads)) if reads else ""
+            ends = np.cumsum([len(read) for read in reads]).tolist()
+            for (name, start, end, strand), read_start, read_end in zip(
+                truth, [0] + ends[:-1], ends
+            ):
+                reads_file.write(f">{name}\n{batch_seq[read_start:read_end]}\n")
+                truth_file.write(f"{name}\t{start}\t{end}\t{strand}\n")
+            count += len(reads)
+    return count
+
+
+def main(prefix="simulated", length=100000, seed=1, paired=False):
+    # change parameters below for your needs!
+    rng = np.random.default_rng(seed)
+    reference = random_sequence(length, rng)
+    batches = simulate_reads(reference, rng, paired=paired)
+    count = write_dataset(prefix, reference, batches)
+    print(f"{count} reads of a {length} bp reference written to {prefix}_*")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+# =============================================================================
+# Created By  : Dominique Zeise
+# GitHub      : https://github.com/CharliesCodes
+# Created Date: 2026/10/18
+# Version     : 1.0
+# © Copyright : 2026 Dominique Zeise
+# =============================================================================
+"""
+Seed and Extend
+Heuristic Local Alignment (BLAST like)
+
+
+This module finds local alignments of a short query in a long
+target without filling the whole scorematrix.
+Every k-mer of the target is stored in a sorted index. Exact k-mer
+hits of the query (seeds) are extended along their diagonal
+without gaps, promising ones with gaps - both stop as soon as
+the score drops x_drop below the best score so far.
+Only the small window around such an extension is aligned
+with the Smith-Waterman algorithm.
+Alignments without an exact k-mer hit are missed - bigger k is
+faster, smaller k is more sensitive.
+"""
+# =============================================================================
+
+import numpy as np
+
+try:
+    import sequence_encoding as se
+except ImportError:
+    print(
+        "Sequence Encoding not found!\nPlease copy file 'sequence_encoding.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import smith_waterman as sw
+except ImportError:
+    print(
+        "Smith-Waterman not found!\nPlease copy file 'smith_waterman.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+
+WORD_SIZE = 11
+X_DROP = 10
+# ungapped score that starts a gapped extension
+GAPPED_TRIGGER = 15
+# gapped score of a reported alignment
+MIN_SCORE = 20
+# positions per numpy step of the ungapped extension
+UNGAPPED_CHUNK = 64
+# stands for -infinity in the gapped extension
+NEGATIVE_INFINITY = -(1 << 40)
+
+
+def kmer_ids(codes, k, base):
+    """numbers every k-mer of a code array
+
+    Args:
+        codes (numpy array): codes of the sequence
+        k (int): k-mer length
+        base (int): 4 for DNA (2 bits per base), else the
+        size of the alphabet
+
+    Raises:
+        ValueError: k-mers too long for 64 bit numbers
+
+    Returns:
+        numpy array: id of the k-mer at every start position
+    """
+    if base**k >= 2**63:
+        raise ValueError(f"k-mer length {k} too long for this alphabet")
+    count = max(len(codes) - k + 1, 0)
+    ids = np.zeros(count, dtype="int64")
+    for j in range(k):
+        ids = ids * base + codes[j : j + count]
+    return ids
+
+
+def build_kmer_index(codes, k, base):
+    """stores the start positions of every k-mer, sorted
+    by k-mer id - all positions of one k-mer are neighbors
+
+    Args:
+        codes (numpy array): codes of the target
+        k (int): k-mer length
+        base (int): see kmer_ids
+
+    Returns:
+        tuple: (sorted k-mer ids, start positions, base)
+    """
+    ids = kmer_ids(codes, k, base)
+    order = np.argsort(ids, kind="stable")
+    return ids[order], order, base
+
+
+def find_seeds(codes, index, k):
+    """finds exact k-mer hits of the query in the index
+
+    Args:
+        codes (numpy array): codes of the query
+        index (tuple): k-mer index of the target
+        k (int): k-mer length
+
+    Returns:
+        list: (query position, target position) per hit
+    """
+    sorted_ids, positions, base = index
+    query_ids = kmer_ids(codes, k, base)
+    first = np.searchsorted(sorted_ids, query_ids, side="left")
+    counts = np.searchsorted(sorted_ids, query_ids, side="right") - first
+    query_positions = np.repeat(np.arange(len(query_ids)), counts)
+    # offset of every hit inside its block of equal ids
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    target_positions = positions[np.repeat(first, counts) + offsets]
+    return list(zip(query_positions.tolist(), target_positions.tolist()))
+
+
+def extend_ungapped(codes1, codes2, substitution_matrix, x_drop):
+    """extends along the diagonal, starting at position 0 of
+    both sequences, until the score drops x_drop below the best
+
+    Args:
+        codes1 (numpy array): codes of the first sequence
+        codes2 (numpy array): codes of the second sequence
+        substitution_matrix (numpy matrix): substitution scores
+        x_drop (int): allowed drop below the best score
+
+    Returns:
+        tuple: (best score, length of the extension)
+    """
+    best, best_length = 0, 0
+    score, pos = 0, 0
+    length = min(len(codes1), len(codes2))
+    while pos < length:
+        end = min(pos + UNGAPPED_CHUNK, length)
+        scores = substitution_matrix[codes1[pos:end], codes2[pos:end]]
+        cumulative = score + np.cumsum(scores, dtype="int64")
+        running_best = np.maximum(np.maximum.accumulate(cumulative), best)
+        dropped = np.flatnonzero(cumulative < running_best - x_drop)
+        stop = dropped[0] if len(dropped) else len(cumulative)
+        if stop:
+            i = int(np.argmax(cumulative[:stop]))
+            if cumulative[i] > best:
+                best, best_length = int(cumulative[i]), pos + i + 1
+        if len(dropped):
+            break
+        score, pos = int(cumulative[-1]), end
+    return best, best_length
+
+
+def extend_gapped(codes1, codes2, substitution_matrix, x_drop):
+    """extends with gaps, starting at position 0 of both
+    sequences. Calculated row by row like the scorematrix, but
+    cells x_drop below the best score are dropped - only the
+    columns between the first and last remaining cell are
+    calculated in the next row.
+
+    Args:
+        codes1 (numpy array): codes of the first sequence (rows)
+        codes2 (numpy array): codes of the second sequence (columns)
+        substitution_matrix (numpy matrix): substitution scores
+        x_drop (int): allowed drop below the best score
+
+    Returns:
+        tuple: (best score, rows, columns) - end of the extension
+    """
+    gap = sw.GAP
+    # horizontal gaps can run this far behind the last cell
+    gap_reach = x_drop // abs(gap)
+    first_row = np.arange(min(len(codes2), gap_reach) + 1, dtype="int64") * gap
+    row, row_start = first_row, 0
+    best, best_y, best_x = 0, 0, 0
+    for y in range(1, len(codes1) + 1):
+        end = min(len(codes2), row_start + len(row) + gap_reach)
+        columns = end - row_start + 1
+        previous = np.full(columns, NEGATIVE_INFINITY, dtype="int64")
+        previous[: len(row)] = row
+
+        candidates = previous + gap
+        # column x uses character x - 1 of codes2
+        match_values = substitution_matrix[codes1[y - 1], codes2[row_start:end]]
+        candidates[1:] = np.maximum(candidates[1:], previous[:-1] + match_values)
+        gap_offsets = np.arange(columns, dtype="int64") * gap
+        candidates = np.maximum.accumulate(candidates - gap_offsets) + gap_offsets
+
+        x = int(np.argmax(candidates))
+        if candidates[x] > best:
+            best, best_y, best_x = int(candidates[x]), y, row_start + x
+        keep = np.flatnonzero(candidates >= best - x_drop)
+        if not len(keep):
+            break
+        row = candidates[keep[0] : keep[-1] + 1]
+        row[row < best - x_drop] = NEGATIVE_INFINITY
+        row_start += int(keep[0])
+    return best, best_y, best_x
+
+
+def search(
+    query,
+    target,
+    word_size=WORD_SIZE,
+    x_drop=X_DROP,
+    gapped_trigger=GAPPED_TRIGGER,
+    min_score=MIN_SCORE,
+    substitution_matrix=None,
+):
+    """finds local alignments of query in target with
+    seed and extend
+
+    Args:
+        query (str): query sequence (without sentinel)
+        target (str): target sequence (without sentinel)
+        word_size (int, optional): seed length. Defaults to WORD_SIZE.
+        x_drop (int, optional): allowed drop below the best score
+        while extending. Defaults to X_DROP.
+        gapped_trigger (int, optional): ungapped score that starts
+        a gapped extension. Defaults to GAPPED_TRIGGER.
+        min_score (int, optional): gapped score of a reported
+        alignment. Defaults to MIN_SCORE.
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        list: (score, seq1_new, seq2_new, (query, target) window start)
+        per alignment, best first
+    """
+    substitution_matrix = sw.get_substitution_matrix(substitution_matrix)
+    codes1, codes2 = se.encode(query), se.encode(target)
+    # 2 bit k-mer ids, if both sequences are DNA
+    is_dna = codes1.max(initial=0) < 4 and codes2.max(initial=0) < 4
+    base = 4 if is_dna else len(se.ALPHABET)
+    index = build_kmer_index(codes2, word_size, base)
+
+    hits = []
+    windows = []
+    # diagonal -> target position reached by its ungapped extension
+    extended = {}
+    for q, t in find_seeds(codes1, index, word_size):
+        if t < extended.get(t - q, -1):
+            continue
+        if any(qs <= q < qe and ts <= t < te for qs, qe, ts, te in windows):
+            continue
+        seed_score = int(
+            substitution_matrix[
+                codes1[q : q + word_size], codes2[t : t + word_size]
+            ].sum()
+        )
+        right, right_length = extend_ungapped(
+            codes1[q + word_size :],
+            codes2[t + word_size :],
+            substitution_matrix,
+            x_drop,
+        )
+        left, _ = extend_ungapped(
+            codes1[:q][::-1], codes2[:t][::-1], substitution_matrix, x_drop
+        )
+        extended[t - q] = t + word_size + right_length
+        if seed_score + left + right < gapped_trigger:
+            continue
+
+        right, right_y, right_x = extend_gapped(
+            codes1[q:], codes2[t:], substitution_matrix, x_drop
+        )
+        left, left_y, left_x = extend_gapped(
+            codes1[:q][::-1], codes2[:t][::-1], substitution_matrix, x_drop
+        )
+        if left + right < min_score:
+            continue
+        window = (q - left_y, q + right_y, t - left_x, t + right_x)
+        windows.append(window)
+
+        # Smith-Waterman inside the window for the alignment
+        qs, qe, ts, te = window
+        seq1 = se.SENTINEL + query[qs:qe]
+        seq2 = se.SENTINEL + target[ts:te]
+        score, max_coords, checkpoints = sw.scan_query_profile(
+            seq1, seq2, substitution_matrix
+        )
+        seq1_new, seq2_new = sw.traceback_region(
+            seq1, seq2, max_coords, checkpoints, substitution_matrix
+        )
+        hits.append((score, seq1_new, seq2_new, (qs, ts)))
+    hits.sort(key=lambda hit: (-hit[0], hit[3]))
+    return hits
+
+
+def main(query="", target="", word_size=WORD_SIZE, substitution_matrix=None):
+    # change sequences below for your needs!
+    if not (query or target):
+        query = "GATTACAGATTACACCGTAGCTAGGCTAAGCT"
+        target = (
+            "TTGACCGTAGGCTTACGGATCGGATTACAGATTACACCGTAGCTAGGCTAAGCTCCATG"
+            "GACTTAGCGATCGGCTAGCTAGCTAAGGCTAGCTTACG"
+        )
+    for score, seq1_new, seq2_new, (qs, ts) in search(
+        query, target, word_size, substitution_matrix=substitution_matrix
+    ):
+        print(f"\nScore: {score} (query {qs}, target {ts})")
+        sw.output(seq1_new, seq2_new)
+
+
+if __name__ == "__main__":
+    main()
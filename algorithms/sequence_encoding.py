@@ -0,0 +1,194 @@
+# =============================================================================
+# Created By  : Dominique Zeise
+# GitHub      : https://github.com/CharliesCodes
+# Created Date: 2026/10/18
+# Version     : 1.0
+# © Copyright : 2026 Dominique Zeise
+# =============================================================================
+"""
+Sequence Encoding
+
+
+This module turns nucleotide and protein strings into
+uint8 code arrays. One code table is shared by all modules:
+A, C, G and T get the codes 0-3, so DNA can be packed
+with 2 bits per base. The sentinel "," and the gap "_"
+have codes too, so encoded sequences can be decoded
+without knowing their alphabet.
+"""
+# =============================================================================
+
+import numpy as np
+
+SENTINEL = ","
+GAP = "_"
+# DNA first -> codes 0-3, then the remaining amino acids and extras
+ALPHABET = "ACGTDEFHIKLMNPQRSVWYBZXJUO*" + SENTINEL + GAP
+SENTINEL_CODE = ALPHABET.index(SENTINEL)
+GAP_CODE = ALPHABET.index(GAP)
+UNKNOWN_CODE = 255
+
+CODE_TABLE = np.full(256, UNKNOWN_CODE, dtype="uint8")
+for code, char in enumerate(ALPHABET):
+    CODE_TABLE[ord(char)] = code
+    CODE_TABLE[ord(char.lower())] = code
+CHAR_TABLE = np.frombuffer(ALPHABET.encode("ascii"), dtype="uint8")
+
+
+def encode(seq):
+    """turns a sequence string into a code array
+
+    Args:
+        seq (str or bytes): nucleotide or protein sequence
+
+    Raises:
+        ValueError: sequence contains an unknown character
+
+    Returns:
+        numpy array: uint8 codes
+    """
+    if isinstance(seq, str):
+        seq = seq.encode("ascii")
+    codes = CODE_TABLE[np.frombuffer(seq, dtype="uint8")]
+    if np.any(codes == UNKNOWN_CODE):
+        unknown = chr(seq[int(np.argmax(codes == UNKNOWN_CODE))])
+        raise ValueError(f"Unknown character in sequence: {unknown!r}")
+    return codes
+
+
+def decode(codes):
+    """turns a code array back into a sequence string
+
+    Args:
+        codes (numpy array): uint8 codes
+
+    Returns:
+        str: sequence
+    """
+    return CHAR_TABLE[codes].tobytes().decode("ascii")
+
+
+def as_codes(seq):
+    """accepts strings, code arrays and packed sequences
+
+    Args:
+        seq (str, numpy array or tuple): sequence, tuple for
+        packed sequences (see pack_sequence)
+
+    Returns:
+        numpy array: uint8 codes
+    """
+    if isinstance(seq, str):
+        return encode(seq)
+    if isinstance(seq, tuple):
+        return unpack_sequence(*seq)
+    return np.asarray(seq, dtype="uint8")
+
+
+def as_string(seq):
+    """accepts strings, code arrays and packed sequences
+
+    Args:
+        seq (str, numpy array or tuple): sequence, tuple for
+        packed sequences (see pack_sequence)
+
+    Returns:
+        str: sequence
+    """
+    if isinstance(seq, str):
+        return seq
+    return decode(as_codes(seq))
+
+
+def is_encoded(seq):
+    """checks if a sequence is a code array or packed
+
+    Args:
+        seq (str, numpy array or tuple): sequence
+
+    Returns:
+        bool: True for code arrays and packed sequences
+    """
+    return isinstance(seq, (np.ndarray, tuple))
+
+
+def with_sentinel(seq, trailing=False):
+    """adds the sentinel in front of (and behind) a sequence.
+    The sentinel is the first row/ column of every scorematrix.
+
+    Args:
+        seq (str, numpy array or tuple): sequence
+        trailing (bool, optional): add a second sentinel at the end.
+        Defaults to False.
+
+    Returns:
+        str or numpy array: sequence with sentinel(s), str for strings
+    """
+    if isinstance(seq, str):
+        return SENTINEL + seq + (SENTINEL if trailing else "")
+    parts = [[SENTINEL_CODE], as_codes(seq)]
+    if trailing:
+        parts.append([SENTINEL_CODE])
+    return np.concatenate(parts).astype("uint8")
+
+
+def pack_2bit(values):
+    """packs four 2 bit values (DNA codes or traceback
+    directions) into one byte
+
+    Args:
+        values (numpy array): values 0-3
+
+    Returns:
+        numpy array: uint8 array with a quarter of the length
+    """
+    padded = np.zeros(-(-len(values) // 4) * 4, dtype="uint8")
+    padded[: len(values)] = values
+    quads = padded.reshape(-1, 4)
+    return quads[:, 0] | (quads[:, 1] << 2) | (quads[:, 2] << 4) | (quads[:, 3] << 6)
+
+
+def unpack_2bit(packed, length):
+    """reverses pack_2bit
+
+    Args:
+        packed (numpy array): packed uint8 array
+        length (int): number of values
+
+    Returns:
+        numpy array: values 0-3 (uint8)
+    """
+    shifts = np.array([0, 2, 4, 6], dtype="uint8")
+    values = (packed[:, np.newaxis] >> shifts) & 3
+    return values.reshape(-1)[:length]
+
+
+def pack_sequence(seq):
+    """packs a DNA sequence with 2 bits per base
+
+    Args:
+        seq (str or numpy array): DNA sequence (A, C, G, T only)
+
+    Raises:
+        ValueError: sequence contains non ACGT characters
+
+    Returns:
+        tuple: (packed uint8 array, sequence length)
+    """
+    codes = as_codes(seq)
+    if np.any(codes > 3):
+        raise ValueError("Only A, C, G and T can be packed with 2 bits")
+    return pack_2bit(codes), len(codes)
+
+
+def unpack_sequence(packed, length):
+    """reverses pack_sequence
+
+    Args:
+        packed (numpy array): packed uint8 array
+        length (int): sequence length
+
+    Returns:
+        numpy array: uint8 codes
+    """
+    return unpack_2bit(packed, length)
@@ -0,0 +1,241 @@
+# =============================================================================
+# Created By  : Dominique Zeise
+# GitHub      : https://github.com/CharliesCodes
+# Created Date: 2026/10/18
+# Version     : 1.0
+# © Copyright : 2026 Dominique Zeise
+# =============================================================================
+"""
+Sequence IO
+
+
+This module reads sequence files record by record.
+Only the current record is kept in memory, so files with
+tens of thousands of sequences can be streamed through
+the alignment algorithms.
+FASTA and FASTQ files are detected by their first character,
+gzip files by their magic number. Plain files are memory
+mapped - the operating system pages them in and out, so
+even files bigger than the RAM can be read. Reads can be
+yielded as batches of code arrays without building strings.
+"""
+# =============================================================================
+
+import gzip
+import mmap
+
+import numpy as np
+
+try:
+    import sequence_encoding as se
+except ImportError:
+    print(
+        "Sequence Encoding not found!\nPlease copy file 'sequence_encoding.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+
+GZIP_MAGIC = b"\x1f\x8b"
+# reads per batch of read_batches
+BATCH_SIZE = 4096
+
+
+def read_lines(path):
+    """reads a plain or gzip file line by line as bytes
+
+    Args:
+        path (str): file path
+
+    Yields:
+        bytes: line without line break and surrounding whitespace
+    """
+    with open(path, "rb") as raw_file:
+        is_gzip = raw_file.read(2) == GZIP_MAGIC
+        raw_file.seek(0)
+        if is_gzip:
+            with gzip.open(raw_file) as gzip_file:
+                for line in gzip_file:
+                    yield line.strip()
+            return
+        try:
+            mapped = mmap.mmap(raw_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files can not be mapped
+            return
+        with mapped:
+            for line in iter(mapped.readline, b""):
+                yield line.strip()
+
+
+def read_raw_fasta(lines):
+    """groups FASTA lines into records
+
+    Args:
+        lines (iterable): lines as bytes, see read_lines
+
+    Yields:
+        tuple: (header without ">", sequence) as bytes
+    """
+    header, parts = None, []
+    for line in lines:
+        if not line:
+            continue
+        if line.startswith(b">"):
+            if header is not None:
+                yield header, b"".join(parts)
+            header, parts = line[1:], []
+        else:
+            parts.append(line)
+    if header is not None:
+        yield header, b"".join(parts)
+
+
+def read_raw_fastq(lines):
+    """groups FASTQ lines into records (4 lines each,
+    the sequence on a single line)
+
+    Args:
+        lines (iterable): lines as bytes, see read_lines
+
+    Raises:
+        ValueError: record does not start with "@"
+
+    Yields:
+        tuple: (header without "@", sequence) as bytes
+    """
+    lines = (line for line in lines if line)
+    for header in lines:
+        if not header.startswith(b"@"):
+            raise ValueError(f"FASTQ record expected, found: {header[:20]!r}")
+        seq = next(lines, b"")
+        # separator "+" and qualities
+        next(lines, None)
+        next(lines, None)
+        yield header[1:], seq
+
+
+def prepend(first, lines):
+    """puts an already read line back in front of the others
+
+    Args:
+        first (bytes): line
+        lines (iterator): remaining lines
+
+    Yields:
+        bytes: all lines
+    """
+    yield first
+    yield from lines
+
+
+def read_raw_records(path):
+    """reads a FASTA or FASTQ file, plain or gzip
+
+    Args:
+        path (str): file path
+
+    Yields:
+        tuple: (header, sequence) as bytes
+    """
+    lines = read_lines(path)
+    for first in lines:
+        if not first:
+            continue
+        restored = prepend(first, lines)
+        if first.startswith(b"@"):
+            yield from read_raw_fastq(restored)
+        else:
+            yield from read_raw_fasta(restored)
+        return
+
+
+def read_records(path):
+    """reads a FASTA or FASTQ file, plain or gzip,
+    record by record
+
+    Args:
+        path (str): file path
+
+    Yields:
+        tuple: (header, sequence)
+    """
+    for header, seq in read_raw_records(path):
+        yield header.decode("ascii"), seq.decode("ascii")
+
+
+def read_fasta(path):
+    """reads a FASTA file record by record
+
+    Args:
+        path (str): path to the FASTA file (plain or gzip)
+
+    Yields:
+        tuple: (header without ">", sequence)
+    """
+    for header, seq in read_raw_fasta(read_lines(path)):
+        yield header.decode("ascii"), seq.decode("ascii")
+
+
+def encode_batch(seqs):
+    """encodes many sequences with one lookup - the code
+    arrays are views into one shared array
+
+    Args:
+        seqs (list): sequences as bytes
+
+    Returns:
+        list: uint8 code arrays
+    """
+    codes = se.encode(b"".join(seqs))
+    ends = np.cumsum([len(seq) for seq in seqs])
+    return np.split(codes, ends[:-1])
+
+
+def read_batches(path, batch_size=BATCH_SIZE):
+    """reads the sequences of a FASTA or FASTQ file as
+    batches of code arrays - only one batch is in memory
+
+    Args:
+        path (str): file path (plain or gzip)
+        batch_size (int, optional): reads per batch. Defaults to BATCH_SIZE.
+
+    Yields:
+        list: uint8 code arrays (without sentinel)
+    """
+    batch = []
+    for _, seq in read_raw_records(path):
+        batch.append(seq)
+        if len(batch) == batch_size:
+            yield encode_batch(batch)
+            batch = []
+    if batch:
+        yield encode_batch(batch)
+
+
+def read_sequences(path, batch_size=BATCH_SIZE):
+    """reads the sequences of a file one by one, batch by batch
+
+    Args:
+        path (str): file path (plain or gzip)
+        batch_size (int, optional): reads per batch. Defaults to BATCH_SIZE.
+
+    Yields:
+        numpy array: uint8 codes of one sequence
+    """
+    for batch in read_batches(path, batch_size):
+        yield from batch
+
+
+def write_fasta(path, records, line_length=60):
+    """writes records into a FASTA file
+
+    Args:
+        path (str): path to the FASTA file
+        records (iterable): (header, sequence) tuples
+        line_length (int, optional): max sequence characters
+        per line. Defaults to 60.
+    """
+    with open(path, "w") as fasta_file:
+        for header, seq in records:
+            fasta_file.write(f">{header}\n")
+            for i in range(0, len(seq), line_length):
+                fasta_file.write(seq[i : i + line_length] + "\n")
@@ -16,11 +16,87 @@ Its the optimized version of the algorithm.
 """
 # =============================================================================
 
+import bisect
+import heapq
+import time
+
 import numpy as np
 
+try:
+    import sequence_encoding as se
+except ImportError:
+    print(
+        "Sequence Encoding not found!\nPlease copy file 'sequence_encoding.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import substitution_matrices as sm
+except ImportError:
+    print(
+        "Substitution Matrices not found!\nPlease copy file 'substitution_matrices.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import sequence_io as sio
+except ImportError:
+    print(
+        "Sequence IO not found!\nPlease copy file 'sequence_io.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
 MATCH = 1
 MISMATCH = -1
 GAP = -2
+# every CHECKPOINT_INTERVAL-th row is kept by scan_query_profile
+CHECKPOINT_INTERVAL = 256
+# number of hits kept by search_database
+TOP_N = 10
+# targets scored at once by search_database
+BATCH_SIZE = 256
+
+# traceback directions (2 bit codes)
+STOP = 0
+DIA = 1
+UP = 2
+LEFT = 3
+
+
+def get_substitution_matrix(substitution_matrix=None):
+    """returns the given substitution matrix or creates
+    one from the MATCH/ MISMATCH constants
+
+    Args:
+        substitution_matrix (numpy matrix, optional): (alphabet, alphabet)
+        scores, see substitution_matrices module. Defaults to None.
+
+    Returns:
+        numpy matrix: substitution matrix
+    """
+    if substitution_matrix is None:
+        return sm.create_matrix(MATCH, MISMATCH)
+    return substitution_matrix
+
+
+def get_score_dtype(ls1, ls2, substitution_matrix=None):
+    """chooses the smallest integer type, which can hold
+    every score of two sequences with the given lengths
+
+    Args:
+        ls1 (int): len first sequence to alignt
+        ls2 (int): len second sequence to alignt
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        str: numpy dtype name
+    """
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    max_substitution = int(np.abs(substitution_matrix).max())
+    # factor 2 -> room for the gap offsets of the row fill
+    max_score = 2 * max(max_substitution, abs(GAP)) * (ls1 + ls2)
+    for dtype in ("int16", "int32"):
+        if max_score <= np.iinfo(dtype).max:
+            return dtype
+    return "int64"
 
 
 def calculate_scorematrix(score_matrix, ls1, ls2, seq1, seq2):
@@ -51,6 +127,376 @@ def calculate_scorematrix(score_matrix, ls1, ls2, seq1, seq2):
     return score_matrix
 
 
+def fill_rows(seq1, seq2, substitution_matrix=None, first_row=None, first_y=0):
+    """fills the scorematrix row by row and keeps only
+    the current row in memory. Gaps inside a row are resolved
+    with a cumulative maximum, so every row is one numpy operation.
+
+    Args:
+        seq1 (str): first sequence to alignt (leading sentinel)
+        seq2 (str): second sequence to alignt (leading sentinel)
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+        first_row (numpy array, optional): known row to continue
+        from (e.g. a checkpoint). Defaults to None (zero row).
+        first_y (int, optional): index of first_row. Defaults to 0.
+
+    Yields:
+        tuple: (y, row) row index and row of the scorematrix
+    """
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    dtype = get_score_dtype(len(seq1), len(seq2), substitution_matrix)
+    # one score row per residue -> substitution scores of a row are one gather
+    profile = sm.query_profile(substitution_matrix, seq1).astype(dtype)
+    codes2 = se.as_codes(seq2)
+    gap_offsets = np.arange(len(seq1), dtype=dtype) * GAP
+    if first_row is None:
+        row = np.zeros(len(seq1), dtype=dtype)
+    else:
+        row = first_row.astype(dtype)
+    yield first_y, row
+    for y in range(first_y + 1, len(seq2)):
+        match_values = profile[codes2[y], 1:]
+        candidates = np.zeros_like(row)
+        candidates[1:] = np.maximum(
+            np.maximum(row[:-1] + match_values, row[1:] + GAP), 0
+        )
+        # cell = max(candidate, left cell + GAP) for the whole row
+        row = np.maximum.accumulate(candidates - gap_offsets) + gap_offsets
+        yield y, row
+
+
+def calculate_score(seq1, seq2, substitution_matrix=None):
+    """score only alignment for screening and ranking.
+    Keeps two rows instead of the whole scorematrix and
+    tracks the highest score while filling.
+
+    Args:
+        seq1 (str): first sequence to alignt
+        seq2 (str): second sequence to alignt
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        tuple: (score, (y, x)) highest score and its coordinates
+        returns the first occuring if score occures multiple times
+    """
+    max_score, max_coords = 0, (0, 0)
+    for y, row in fill_rows(seq1, seq2, substitution_matrix):
+        x = int(np.argmax(row))
+        if row[x] > max_score:
+            max_score, max_coords = int(row[x]), (y, x)
+    return max_score, max_coords
+
+
+def get_direction(pointer_matrix, y, x):
+    """reads the 2 bit direction code of one cell
+
+    Args:
+        pointer_matrix (numpy matrix): packed direction codes
+        y (int): row of the cell
+        x (int): column of the cell
+
+    Returns:
+        int: direction code
+    """
+    return (int(pointer_matrix[y][x >> 2]) >> ((x & 3) * 2)) & 3
+
+
+def get_directions(previous, row, match_values):
+    """calculates the traceback directions of one row.
+    Cells with score 0 end the traceback (STOP), all others
+    point to the neighbor the cell value came from
+    (order on ties: dia, up, left).
+
+    Args:
+        previous (numpy array): previous row of the scorematrix
+        row (numpy array): current row of the scorematrix
+        match_values (numpy array): substitution scores of the row
+        (without first column)
+
+    Returns:
+        numpy array: direction codes of the row (first column STOP)
+    """
+    dia = previous[:-1] + match_values
+    directions = np.where(
+        row[1:] == dia, DIA, np.where(row[1:] == previous[1:] + GAP, UP, LEFT)
+    )
+    directions = np.where(row[1:] == 0, STOP, directions)
+    return np.concatenate(([STOP], directions)).astype("uint8")
+
+
+def calculate_pointermatrix(ls1, ls2, seq1, seq2, substitution_matrix=None):
+    """fills the scorematrix row by row and stores only the
+    traceback direction of every cell - 2 bits per cell.
+    Cells with score 0 end the traceback (STOP), all others
+    point to the neighbor the cell value came from
+    (order on ties: dia, up, left).
+
+    Args:
+        ls1 (int): len first sequence to alignt
+        ls2 (int): len second sequence to alignt
+        seq1 (str): first sequence to alignt
+        seq2 (str): second sequence to alignt
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        pointer_matrix (numpy matrix): packed direction codes
+        max_score (int): highest score
+        max_coords (tuple): (y, x) Coordinates of max score
+    """
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    profile = sm.query_profile(substitution_matrix, seq1)
+    codes2 = se.as_codes(seq2)
+    pointer_matrix = np.zeros((ls2, -(-ls1 // 4)), dtype="uint8")
+    max_score, max_coords = 0, (0, 0)
+    for y, row in fill_rows(seq1, seq2, substitution_matrix):
+        if y > 0:
+            directions = get_directions(previous, row, profile[codes2[y], 1:])
+            pointer_matrix[y] = se.pack_2bit(directions)
+            x = int(np.argmax(row))
+            if row[x] > max_score:
+                max_score, max_coords = int(row[x]), (y, x)
+        previous = row
+    return pointer_matrix, max_score, max_coords
+
+
+def scan_query_profile(
+    seq1, seq2, substitution_matrix=None, interval=CHECKPOINT_INTERVAL
+):
+    """score only local alignment for long targets. The query
+    profile of seq1 gives the substitution scores of a whole row
+    with one gather, vertical gaps are resolved with a cumulative
+    maximum. All operations work in preallocated vectors.
+    The highest score and its coordinates are tracked while
+    filling, every interval-th row is kept as checkpoint for
+    traceback_region.
+
+    Args:
+        seq1 (str): query, columns of the scorematrix (leading sentinel)
+        seq2 (str): target, rows of the scorematrix (leading sentinel)
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+        interval (int, optional): rows between two checkpoints.
+        Defaults to CHECKPOINT_INTERVAL.
+
+    Returns:
+        max_score (int): highest score
+        max_coords (tuple): (y, x) Coordinates of max score
+        checkpoints (dict): row index -> row of the scorematrix
+    """
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    ls1 = len(seq1)
+    dtype = get_score_dtype(ls1, len(seq2), substitution_matrix)
+    profile = sm.query_profile(substitution_matrix, seq1).astype(dtype)
+    codes2 = se.as_codes(seq2)
+    gap_offsets = np.arange(ls1, dtype=dtype) * GAP
+
+    row = np.zeros(ls1, dtype=dtype)
+    candidates = np.zeros(ls1, dtype=dtype)
+    up = np.empty(ls1 - 1, dtype=dtype)
+    checkpoints = {0: row.copy()}
+    max_score, max_coords = 0, (0, 0)
+    for y in range(1, len(seq2)):
+        np.add(row[:-1], profile[codes2[y], 1:], out=candidates[1:])
+        np.add(row[1:], GAP, out=up)
+        np.maximum(candidates[1:], up, out=candidates[1:])
+        np.maximum(candidates[1:], 0, out=candidates[1:])
+        # cell = max(candidate, left cell + GAP) for the whole row
+        np.subtract(candidates, gap_offsets, out=candidates)
+        np.maximum.accumulate(candidates, out=row)
+        np.add(row, gap_offsets, out=row)
+
+        row_max = row.max()
+        if row_max > max_score:
+            max_score, max_coords = int(row_max), (y, int(np.argmax(row)))
+        if y % interval == 0:
+            checkpoints[y] = row.copy()
+    return max_score, max_coords, checkpoints
+
+
+def score_batch(seq1, targets, substitution_matrix=None):
+    """score only kernel for many targets at once. All targets
+    are padded to the same length and filled side by side:
+    rows are the positions of seq1, so one numpy operation
+    calculates a row of every target matrix. Padding cells
+    score at most their neighbors and do not change the max.
+
+    Args:
+        seq1 (str): query (leading sentinel)
+        targets (list): target sequences (leading sentinel)
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        numpy array: highest score per target
+    """
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    width = max(len(target) for target in targets)
+    dtype = get_score_dtype(len(seq1), width, substitution_matrix)
+    # extra padding code with the lowest score
+    pad_code = substitution_matrix.shape[0]
+    padded_matrix = np.full(
+        (pad_code, pad_code + 1), min(substitution_matrix.min(), 0), dtype=dtype
+    )
+    padded_matrix[:, :pad_code] = substitution_matrix
+    batch_codes = np.full((len(targets), width), pad_code, dtype="int64")
+    for i, target in enumerate(targets):
+        batch_codes[i, : len(target)] = se.as_codes(target)
+    batch_codes = batch_codes[:, 1:]
+    codes1 = se.as_codes(seq1)
+    gap_offsets = np.arange(width, dtype=dtype) * GAP
+
+    rows = np.zeros((len(targets), width), dtype=dtype)
+    candidates = np.zeros_like(rows)
+    up = np.empty((len(targets), width - 1), dtype=dtype)
+    max_scores = np.zeros(len(targets), dtype=dtype)
+    for y in range(1, len(codes1)):
+        np.add(
+            rows[:, :-1], padded_matrix[codes1[y]][batch_codes], out=candidates[:, 1:]
+        )
+        np.add(rows[:, 1:], GAP, out=up)
+        np.maximum(candidates[:, 1:], up, out=candidates[:, 1:])
+        np.maximum(candidates[:, 1:], 0, out=candidates[:, 1:])
+        # cell = max(candidate, left cell + GAP) for all rows
+        np.subtract(candidates, gap_offsets, out=candidates)
+        np.maximum.accumulate(candidates, axis=1, out=rows)
+        np.add(rows, gap_offsets, out=rows)
+        np.maximum(max_scores, rows.max(axis=1), out=max_scores)
+    return max_scores
+
+
+def search_database(
+    query, path, top_n=TOP_N, substitution_matrix=None, batch_size=BATCH_SIZE
+):
+    """aligns one query against every target of a FASTA file.
+    Targets are streamed from disk in batches and scored without
+    traceback, a heap keeps the top_n best targets. Only those
+    get a traceback at the end.
+
+    Args:
+        query (str): query sequence (without sentinel)
+        path (str): path to the FASTA file of the targets
+        top_n (int, optional): number of hits. Defaults to TOP_N.
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+        batch_size (int, optional): targets scored at once.
+        Defaults to BATCH_SIZE.
+
+    Returns:
+        hits (list): (score, header, seq1_new, seq2_new) per hit,
+        best first (same score -> earlier target first)
+        targets (int): number of scanned targets
+        seconds (float): duration of the search
+    """
+    query = se.with_sentinel(query)
+    start = time.perf_counter()
+    # min heap (score, -index, ...) -> worst kept hit on top
+    heap = []
+    batch = []
+    targets = 0
+    records = sio.read_fasta(path)
+    while True:
+        record = next(records, None)
+        if record is not None:
+            batch.append((targets, record[0], se.with_sentinel(record[1])))
+            targets += 1
+        if batch and (record is None or len(batch) == batch_size):
+            scores = score_batch(
+                query, [target for _, _, target in batch], substitution_matrix
+            )
+            for score, (index, header, target) in zip(scores, batch):
+                entry = (int(score), -index, header, target)
+                if len(heap) < top_n:
+                    heapq.heappush(heap, entry)
+                elif entry[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, entry)
+            batch = []
+        if record is None:
+            break
+
+    hits = []
+    for score, _, header, target in sorted(heap, reverse=True):
+        _, max_coords, checkpoints = scan_query_profile(
+            query, target, substitution_matrix
+        )
+        seq1_new, seq2_new = traceback_region(
+            query, target, max_coords, checkpoints, substitution_matrix
+        )
+        hits.append((score, header, seq1_new, seq2_new))
+    return hits, targets, time.perf_counter() - start
+
+
+def traceback_region(seq1, seq2, max_coords, checkpoints, substitution_matrix=None):
+    """traceback for scan_query_profile. Recomputes only the
+    block between the next checkpoint above and the current cell
+    (columns up to the current cell), follows the directions
+    and continues with the block above, until a cell with
+    score 0 is reached. Same result as traceback.
+
+    Args:
+        seq1 (str): first sequence to alignt
+        seq2 (str): second sequence to alignt
+        max_coords (tuple): (y, x) Coordinates of max score
+        checkpoints (dict): row index -> row of the scorematrix
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        seq1_new (str): redesigned first sequence
+        seq2_new (str): redesigned second sequence
+    """
+    seq1, seq2 = se.as_string(seq1), se.as_string(seq2)
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    profile = sm.query_profile(substitution_matrix, seq1)
+    codes2 = se.as_codes(seq2)
+    checkpoint_rows = sorted(checkpoints)
+    seq1_new, seq2_new = [], []
+    y, x = max_coords
+
+    direction = DIA
+    while direction != STOP and y > 0:
+        first_y = checkpoint_rows[bisect.bisect_left(checkpoint_rows, y) - 1]
+        block = []
+        previous = None
+        for row_y, row in fill_rows(
+            seq1[: x + 1],
+            seq2[: y + 1],
+            substitution_matrix,
+            checkpoints[first_y][: x + 1],
+            first_y,
+        ):
+            if previous is not None:
+                match_values = profile[codes2[row_y], 1 : x + 1]
+                block.append(get_directions(previous, row, match_values))
+            previous = row
+
+        direction = block[y - first_y - 1][x]
+        while direction != STOP:
+            if direction == DIA:
+                seq1_new.append(seq1[x])
+                seq2_new.append(seq2[y])
+                x -= 1
+                y -= 1
+            elif direction == UP:
+                seq1_new.append("_")
+                seq2_new.append(seq2[y])
+                y -= 1
+            else:
+                seq2_new.append("_")
+                seq1_new.append(seq1[x])
+                x -= 1
+            # checkpoint row reached -> continue with the block above
+            if y == first_y:
+                break
+            direction = block[y - first_y - 1][x]
+    # cell with score 0 -> dropped by output
+    seq1_new.append(seq1[x])
+    seq2_new.append(seq2[y])
+    return seq1_new, seq2_new
+
+
 def find_max_coordinates(score_matrix):
     """find coordinates of highest score in the matrix
 
@@ -66,48 +512,215 @@ def find_max_coordinates(score_matrix):
     return max_coords
 
 
-def traceback(score_matrix, seq1, seq2, max_coords):
-    """traceback from coordinates of highest score in
-    last row or last column to upper left corner.
-    Finds best scoring path via greedy-algorithm.
+def traceback(score_matrix, seq1, seq2, max_coords, substitution_matrix=None):
+    """traceback from coordinates of highest score until
+    a cell with score 0 is reached. Every step goes to the
+    neighbor the cell value came from (order on ties: dia, up, left).
 
     Args:
         score_matrix numpy matrix: scorematrix
         seq1 (str): first sequence to alignt
         seq2 (str): second sequence to alignt
         max_coords (tuple): (y, x) Coordinates of max score
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
 
     Returns:
         seq1_new (str): redesigned first sequence
         seq2_new (str): redesigned second sequence
     """
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    codes1, codes2 = se.as_codes(seq1), se.as_codes(seq2)
     seq1_new, seq2_new = [], []
     y, x = max_coords
-    seq1_new.append(seq1[x])
-    seq2_new.append(seq2[y])
 
     while score_matrix[y][x] != 0:
-        dia = score_matrix[y - 1][x - 1]
-        up = score_matrix[y - 1][x]
-        left = score_matrix[y][x - 1]
-        max_points = max(dia, up, left)
-        score_matrix[y][x] = 0
+        match_value = substitution_matrix[codes2[y], codes1[x]]
         # dia
-        if x > 0 and y > 0 and dia == max_points:
-            seq1_new.append(seq1[x - 1])
-            seq2_new.append(seq2[y - 1])
+        if score_matrix[y][x] == score_matrix[y - 1][x - 1] + match_value:
+            seq1_new.append(seq1[x])
+            seq2_new.append(seq2[y])
             x -= 1
             y -= 1
         # up
-        elif y > 0 and up == max_points:
+        elif score_matrix[y][x] == score_matrix[y - 1][x] + GAP:
             seq1_new.append("_")
-            seq2_new.append(seq2[y - 1])
+            seq2_new.append(seq2[y])
             y -= 1
         # left
         else:
             seq2_new.append("_")
-            seq1_new.append(seq1[x - 1])
+            seq1_new.append(seq1[x])
             x -= 1
+    # cell with score 0 -> dropped by output
+    seq1_new.append(seq1[x])
+    seq2_new.append(seq2[y])
+    return seq1_new, seq2_new
+
+
+def get_path_cells(seq1_new, seq2_new, max_coords):
+    """calculates the matrix cells of a traceback result.
+    The last cell (score 0) is not part of the alignment.
+
+    Args:
+        seq1_new (list): redesigned first sequence (reversed)
+        seq2_new (list): redesigned second sequence (reversed)
+        max_coords (tuple): (y, x) Coordinates of max score
+
+    Returns:
+        list: (y, x) cells of the alignment
+    """
+    y, x = max_coords
+    cells = []
+    for n1, n2 in zip(seq1_new[:-1], seq2_new[:-1]):
+        cells.append((y, x))
+        if n1 != "_":
+            x -= 1
+        if n2 != "_":
+            y -= 1
+    return cells
+
+
+def fill_row_masked(previous, match_values, forbidden):
+    """calculates one row of the scorematrix, in which
+    forbidden cells are fixed to 0. Cells right of a forbidden
+    cell can not be reached by horizontal gaps through it,
+    so every forbidden cell starts a new cumulative maximum.
+
+    Args:
+        previous (numpy array): previous row of the scorematrix
+        match_values (numpy array): substitution scores of the row
+        (without first column)
+        forbidden (numpy array): bool mask of forbidden cells
+
+    Returns:
+        numpy array: row of the scorematrix
+    """
+    candidates = np.zeros(len(previous), dtype="int64")
+    candidates[1:] = np.maximum(
+        np.maximum(previous[:-1] + match_values, previous[1:] + GAP), 0
+    )
+    candidates[forbidden] = 0
+    gap_offsets = np.arange(len(previous), dtype="int64") * GAP
+    # lifts every segment above all previous ones
+    segment_offsets = np.cumsum(forbidden, dtype="int64") * (
+        int(candidates.max()) + len(previous) * abs(GAP) + 1
+    )
+    row = (
+        np.maximum.accumulate(candidates - gap_offsets + segment_offsets)
+        - segment_offsets
+        + gap_offsets
+    )
+    return row.astype(previous.dtype)
+
+
+def find_top_alignments(seq1, seq2, k, substitution_matrix=None):
+    """finds the k best non overlapping local alignments
+    (Waterman-Eggert). Cells of a found alignment are fixed to 0,
+    only the rows below them are recalculated - until a row does
+    not change anymore. The next alignment ends at the highest
+    cell, taken from a heap of the row maxima.
+
+    Args:
+        seq1 (str): first sequence to alignt (leading sentinel)
+        seq2 (str): second sequence to alignt (leading sentinel)
+        k (int): max number of alignments
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        list: (score, seq1_new, seq2_new, max_coords) per alignment,
+        best first
+    """
+    substitution_matrix = get_substitution_matrix(substitution_matrix)
+    seq1_str, seq2_str = se.as_string(seq1), se.as_string(seq2)
+    ls1, ls2 = len(seq1_str), len(seq2_str)
+    dtype = get_score_dtype(ls1, ls2, substitution_matrix)
+    profile = sm.query_profile(substitution_matrix, seq1).astype(dtype)
+    codes2 = se.as_codes(seq2)
+
+    score_matrix = np.zeros((ls2, ls1), dtype=dtype)
+    for y, row in fill_rows(seq1, seq2, substitution_matrix):
+        score_matrix[y] = row
+    forbidden = np.zeros((ls2, ls1), dtype=bool)
+
+    # (-score, y, x) -> highest score, then first occurence
+    heap = []
+    for y in range(1, ls2):
+        x = int(np.argmax(score_matrix[y]))
+        if score_matrix[y][x] > 0:
+            heap.append((-int(score_matrix[y][x]), y, x))
+    heapq.heapify(heap)
+
+    alignments = []
+    while heap and len(alignments) < k:
+        score, y, x = heapq.heappop(heap)
+        # skip outdated row maxima
+        if score_matrix[y][x] != -score or np.argmax(score_matrix[y]) != x:
+            continue
+        seq1_new, seq2_new = traceback(
+            score_matrix, seq1_str, seq2_str, (y, x), substitution_matrix
+        )
+        alignments.append((-score, seq1_new, seq2_new, (y, x)))
+
+        cells = get_path_cells(seq1_new, seq2_new, (y, x))
+        for cell_y, cell_x in cells:
+            forbidden[cell_y][cell_x] = True
+        last_y = max(cell_y for cell_y, _ in cells)
+        for row_y in range(min(cell_y for cell_y, _ in cells), ls2):
+            row = fill_row_masked(
+                score_matrix[row_y - 1],
+                profile[codes2[row_y], 1:],
+                forbidden[row_y],
+            )
+            # rows below the alignment only change by propagation
+            if row_y > last_y and np.array_equal(row, score_matrix[row_y]):
+                break
+            score_matrix[row_y] = row
+            row_x = int(np.argmax(row))
+            if row[row_x] > 0:
+                heapq.heappush(heap, (-int(row[row_x]), row_y, row_x))
+    return alignments
+
+
+def traceback_pointers(pointer_matrix, seq1, seq2, max_coords):
+    """traceback from coordinates of highest score
+    by following the stored directions until a cell
+    with score 0 is reached
+
+    Args:
+        pointer_matrix (numpy matrix): packed direction codes
+        seq1 (str): first sequence to alignt
+        seq2 (str): second sequence to alignt
+        max_coords (tuple): (y, x) Coordinates of max score
+
+    Returns:
+        seq1_new (str): redesigned first sequence
+        seq2_new (str): redesigned second sequence
+    """
+    seq1, seq2 = se.as_string(seq1), se.as_string(seq2)
+    seq1_new, seq2_new = [], []
+    y, x = max_coords
+
+    direction = get_direction(pointer_matrix, y, x)
+    while direction != STOP:
+        if direction == DIA:
+            seq1_new.append(seq1[x])
+            seq2_new.append(seq2[y])
+            x -= 1
+            y -= 1
+        elif direction == UP:
+            seq1_new.append("_")
+            seq2_new.append(seq2[y])
+            y -= 1
+        else:
+            seq2_new.append("_")
+            seq1_new.append(seq1[x])
+            x -= 1
+        direction = get_direction(pointer_matrix, y, x)
+    # cell with score 0 -> dropped by output
+    seq1_new.append(seq1[x])
+    seq2_new.append(seq2[y])
     return seq1_new, seq2_new
 
 
@@ -153,17 +766,54 @@ def calc_similarity(alignment_output):
     return (abs_count, rel_count)
 
 
-def main(seq1="", seq2=""):
+def main(
+    seq1="", seq2="", substitution_matrix=None, mode="pointer", k=3, database=None
+):
     # change sequences below for your needs!
+    # substitution_matrix: e.g. sm.BLOSUM62 for proteins
+    # mode: "pointer" (2 bit traceback directions),
+    # "scan" (query profile scan, long targets) or
+    # "top" (k best non overlapping alignments)
+    # database: path to a FASTA file -> k best targets for seq1
+    # encoded sequences come without sentinels
+    if se.is_encoded(seq1):
+        seq1 = se.as_string(se.with_sentinel(seq1))
+    if se.is_encoded(seq2):
+        seq2 = se.as_string(se.with_sentinel(seq2))
+    if database is not None:
+        hits, targets, seconds = search_database(
+            seq1[1:], database, k, substitution_matrix
+        )
+        for score, header, seq1_new, seq2_new in hits:
+            print(f"\n>{header}\nScore: {score}")
+            output(seq1_new, seq2_new)
+        print(f"\n{targets} targets in {round(seconds, 2)}s", end=" ")
+        print(f"({round(targets / max(seconds, 1e-9))} targets/sec)")
+        return
     if not (seq1 or seq2):
         seq1 = ",TACGA"
         seq2 = ",CG"
     ls1 = len(seq1)
     ls2 = len(seq2)
-    score_matrix = np.zeros((ls2, ls1), dtype="int16")
-    score_matrix = calculate_scorematrix(score_matrix, ls1, ls2, seq1, seq2)
-    max_coords = find_max_coordinates(score_matrix)
-    seq1_new, seq2_new = traceback(score_matrix, seq1, seq2, max_coords)
+    if mode == "top":
+        for score, seq1_new, seq2_new, _ in find_top_alignments(
+            seq1, seq2, k, substitution_matrix
+        ):
+            print(f"\nScore: {score}")
+            output(seq1_new, seq2_new)
+        return
+    if mode == "scan":
+        _, max_coords, checkpoints = scan_query_profile(seq1, seq2, substitution_matrix)
+        seq1_new, seq2_new = traceback_region(
+            seq1, seq2, max_coords, checkpoints, substitution_matrix
+        )
+    else:
+        pointer_matrix, _, max_coords = calculate_pointermatrix(
+            ls1, ls2, seq1, seq2, substitution_matrix
+        )
+        seq1_new, seq2_new = traceback_pointers(
+            pointer_matrix, seq1, seq2, max_coords
+        )
     alignment_output = output(seq1_new, seq2_new)
     sim_tup = calc_similarity(alignment_output)
     print(f"\nSimilarity: {round(sim_tup[1]*100, 2)}%")
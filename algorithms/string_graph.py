@@ -0,0 +1,306 @@
+# =============================================================================
+# Created By  : Dominique Zeise
+# GitHub      : https://github.com/CharliesCodes
+# Created Date: 2026/10/18
+# Version     : 1.0
+# © Copyright : 2026 Dominique Zeise
+# =============================================================================
+"""
+String Graph Assembly
+Overlap - Layout - Consensus
+
+
+This module assembles longer reads with a string graph.
+Overlap: reads sharing a k-mer are aligned once per pair with
+the free-shift alignment. Layout: every overlap is an edge from
+the left to the right read. An edge a -> c is transitive, if
+a path a -> b -> c with the same shift exists - these edges
+add no information and are removed. Consensus: paths without
+branches are joined to contigs.
+Reads contained in other reads are removed first.
+"""
+# =============================================================================
+
+import numpy as np
+
+try:
+    import free_shift_alignment as fsa
+except ImportError:
+    print(
+        "Free-Shift Alignment not found!\nPlease copy file 'free_shift_alignment.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import sequence_encoding as se
+except ImportError:
+    print(
+        "Sequence Encoding not found!\nPlease copy file 'sequence_encoding.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import exact_overlap as eo
+except ImportError:
+    print(
+        "Exact Overlap not found!\nPlease copy file 'exact_overlap.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import suffix_automaton as sa
+except ImportError:
+    print(
+        "Suffix Automaton not found!\nPlease copy file 'suffix_automaton.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+try:
+    import read_simulator as rs
+except ImportError:
+    print(
+        "Read Simulator not found!\nPlease copy file 'read_simulator.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+
+KMER_SIZE = 12
+# k-mers of more reads are skipped (repeats)
+MAX_OCCURRENCES = 64
+MIN_OVERLAP = 20
+# matches per aligned position of a verified overlap
+MIN_IDENTITY = 0.9
+# allowed shift difference of a transitive edge (indels)
+FUZZ = 4
+
+
+def remove_contained(reads):
+    """removes duplicates and reads contained in other reads
+
+    Args:
+        reads (iterable): strings or encoded reads
+
+    Returns:
+        list: remaining reads, longest first
+    """
+    reads = sorted(set(se.as_string(read) for read in reads), key=len, reverse=True)
+    contained = sa.find_contained(reads)
+    return [read for read, is_contained in zip(reads, contained) if not is_contained]
+
+
+def find_candidate_pairs(reads, k=KMER_SIZE):
+    """finds read pairs sharing at least one k-mer
+
+    Args:
+        reads (list): reads (without sentinel)
+        k (int, optional): k-mer length. Defaults to KMER_SIZE.
+
+    Returns:
+        set: (i, j) read indices with i < j
+    """
+    kmer_index = {}
+    for read_index, read in enumerate(reads):
+        for kmer in eo.kmer_set(read, k):
+            kmer_index.setdefault(kmer, []).append(read_index)
+    pairs = set()
+    for read_indices in kmer_index.values():
+        if len(read_indices) > MAX_OCCURRENCES:
+            continue
+        for a, i in enumerate(read_indices):
+            for j in read_indices[a + 1 :]:
+                pairs.add((i, j))
+    return pairs
+
+
+def verify_overlap(seq1, seq2, substitution_matrix=None):
+    """aligns two reads once and returns the shift of seq2
+    relative to seq1
+
+    Args:
+        seq1 (str): first read (without sentinel)
+        seq2 (str): second read (without sentinel)
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        int: start of seq2 relative to seq1 (negative -> seq2
+        starts in front), None without a valid overlap
+    """
+    exact = eo.find_exact_overlap(seq1, seq2, MIN_OVERLAP)
+    if exact is not None:
+        return exact[1]
+    overlap_len, _, offset, matches = fsa.calculate_overlap(
+        se.SENTINEL + seq1, se.SENTINEL + seq2, substitution_matrix
+    )
+    if overlap_len < MIN_OVERLAP or matches < MIN_IDENTITY * overlap_len:
+        return None
+    return offset
+
+
+def build_graph(reads, k=KMER_SIZE, substitution_matrix=None, fuzz=FUZZ):
+    """aligns every candidate pair once. Reads sticking out of
+    another read by at most fuzz positions on both sides are
+    contained up to errors - they get no edges.
+
+    Args:
+        reads (list): reads without contained ones (without sentinel)
+        k (int, optional): k-mer length. Defaults to KMER_SIZE.
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+        fuzz (int, optional): allowed overhang of a contained
+        read. Defaults to FUZZ.
+
+    Returns:
+        edges (list): per read a dict: right neighbor -> shift
+        contained (set): indices of contained reads
+    """
+    overlaps = []
+    contained = set()
+    for i, j in sorted(find_candidate_pairs(reads, k)):
+        offset = verify_overlap(reads[i], reads[j], substitution_matrix)
+        if offset is None:
+            continue
+        # left read, right read, shift
+        left, right, shift = (i, j, offset) if offset >= 0 else (j, i, -offset)
+        overhang = shift + len(reads[right]) - len(reads[left])
+        if overhang <= fuzz:
+            contained.add(right)
+        elif shift <= fuzz:
+            contained.add(left)
+        else:
+            overlaps.append((left, right, shift))
+
+    edges = [{} for _ in reads]
+    for left, right, shift in overlaps:
+        if left not in contained and right not in contained:
+            edges[left][right] = shift
+    return edges, contained
+
+
+def reduce_transitive(edges, fuzz=FUZZ):
+    """removes edges a -> c with a path a -> b -> c of the same
+    shift (Myers 2005)
+
+    Args:
+        edges (list): see build_graph
+        fuzz (int, optional): allowed shift difference. Defaults to FUZZ.
+
+    Returns:
+        list: reduced edges
+    """
+    reduced = []
+    for neighbors in edges:
+        transitive = set()
+        for b, shift_ab in neighbors.items():
+            for c, shift_bc in edges[b].items():
+                if c in neighbors and abs(shift_ab + shift_bc - neighbors[c]) <= fuzz:
+                    transitive.add(c)
+        reduced.append(
+            {c: shift for c, shift in neighbors.items() if c not in transitive}
+        )
+    return reduced
+
+
+def find_paths(edges):
+    """splits the graph into paths without branches
+
+    Args:
+        edges (list): see build_graph
+
+    Returns:
+        list: paths as lists of (read index, shift to the previous read)
+    """
+    in_degree = [0] * len(edges)
+    for neighbors in edges:
+        for c in neighbors:
+            in_degree[c] += 1
+
+    def successor(a):
+        if len(edges[a]) != 1:
+            return None
+        (b, shift), = edges[a].items()
+        return (b, shift) if in_degree[b] == 1 else None
+
+    # a read continues a path, if it is the only successor of its only predecessor
+    continues = [False] * len(edges)
+    for a in range(len(edges)):
+        following = successor(a)
+        if following is not None:
+            continues[following[0]] = True
+
+    paths = []
+    visited = [False] * len(edges)
+    # path starts first, then the remaining cycles
+    starts = [a for a in range(len(edges)) if not continues[a]]
+    starts += [a for a in range(len(edges)) if continues[a]]
+    for start in starts:
+        if visited[start]:
+            continue
+        visited[start] = True
+        path = [(start, 0)]
+        following = successor(start)
+        while following is not None and not visited[following[0]]:
+            visited[following[0]] = True
+            path.append(following)
+            following = successor(following[0])
+        paths.append(path)
+    return paths
+
+
+def join_path(reads, path):
+    """joins the reads of a path to one contig. Every read adds
+    the positions behind the end of the contig so far.
+
+    Args:
+        reads (list): reads (without sentinel)
+        path (list): see find_paths
+
+    Returns:
+        str: contig
+    """
+    first, _ = path[0]
+    contig = [reads[first]]
+    contig_len, start = len(reads[first]), 0
+    for read_index, shift in path[1:]:
+        start += shift
+        read = reads[read_index]
+        if start + len(read) > contig_len:
+            contig.append(read[max(contig_len - start, 0) :])
+            contig_len = start + len(read)
+    return "".join(contig)
+
+
+def assemble(reads, k=KMER_SIZE, substitution_matrix=None):
+    """assembles the reads into contigs
+
+    Args:
+        reads (iterable): strings or encoded reads (without sentinel)
+        k (int, optional): k-mer length. Defaults to KMER_SIZE.
+        substitution_matrix (numpy matrix, optional): scores used
+        instead of MATCH/ MISMATCH. Defaults to None.
+
+    Returns:
+        list: contigs, longest first
+    """
+    reads = remove_contained(reads)
+    edges, contained = build_graph(reads, k, substitution_matrix)
+    edges = reduce_transitive(edges)
+    contigs = [
+        join_path(reads, path)
+        for path in find_paths(edges)
+        if path[0][0] not in contained
+    ]
+    contigs.sort(key=len, reverse=True)
+    return contigs
+
+
+def main(reads=None, k=KMER_SIZE):
+    # change sequences below for your needs!
+    if reads is None:
+        rng = np.random.default_rng(1)
+        origin = se.decode(rs.random_sequence(2000, rng))
+        starts = rng.integers(0, len(origin) - 150, 60)
+        reads = [origin[start : start + 150] for start in starts]
+    contigs = assemble(reads, k)
+    print(f"{len(contigs)} contigs, longest {len(contigs[0]) if contigs else 0}")
+    for contig in contigs[:5]:
+        print(contig)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# =============================================================================
+# Created By  : Dominique Zeise
+# GitHub      : https://github.com/CharliesCodes
+# Created Date: 2026/10/18
+# Version     : 1.0
+# © Copyright : 2026 Dominique Zeise
+# =============================================================================
+"""
+Substitution Matrices
+
+
+This module creates substitution matrices for the code table
+of the sequence encoding module (BLOSUM62, simple match/
+mismatch matrices, DNA transition/ transversion matrices or
+any matrix file in NCBI format).
+A query profile holds one score row per residue of the
+alphabet, so a whole row of the scorematrix gets its
+substitution scores with one numpy gather.
+"""
+# =============================================================================
+
+import numpy as np
+
+try:
+    import sequence_encoding as se
+except ImportError:
+    print(
+        "Sequence Encoding not found!\nPlease copy file 'sequence_encoding.py' into the same directory!\nVisit my GitHub page to download it."
+    )
+
+
+BLOSUM62_TEXT = """
+   A  R  N  D  C  Q  E  G  H  I  L  K  M  F  P  S  T  W  Y  V  B  Z  X  *
+A  4 -1 -2 -2  0 -1 -1  0 -2 -1 -1 -1 -1 -2 -1  1  0 -3 -2  0 -2 -1  0 -4
+R -1  5  0 -2 -3  1  0 -2  0 -3 -2  2 -1 -3 -2 -1 -1 -3 -2 -3 -1  0 -1 -4
+N -2  0  6  1 -3  0  0  0  1 -3 -3  0 -2 -3 -2  1  0 -4 -2 -3  3  0 -1 -4
+D -2 -2  1  6 -3  0  2 -1 -1 -3 -4 -1 -3 -3 -1  0 -1 -4 -3 -3  4  1 -1 -4
+C  0 -3 -3 -3  9 -3 -4 -3 -3 -1 -1 -3 -1 -2 -3 -1 -1 -2 -2 -1 -3 -3 -2 -4
+Q -1  1  0  0 -3  5  2 -2  0 -3 -2  1  0 -3 -1  0 -1 -2 -1 -2  0  3 -1 -4
+E -1  0  0  2 -4  2  5 -2  0 -3 -3  1 -2 -3 -1  0 -1 -3 -2 -2  1  4 -1 -4
+G  0 -2  0 -1 -3 -2 -2  6 -2 -4 -4 -2 -3 -3 -2  0 -2 -2 -3 -3 -1 -2 -1 -4
+H -2  0  1 -1 -3  0  0 -2  8 -3 -3 -1 -2 -1 -2 -1 -2 -2  2 -3  0  0 -1 -4
+I -1 -3 -3 -3 -1 -3 -3 -4 -3  4  2 -3  1  0 -3 -2 -1 -3 -1  3 -3 -3 -1 -4
+L -1 -2 -3 -4 -1 -2 -3 -4 -3  2  4 -2  2  0 -3 -2 -1 -2 -1  1 -4 -3 -1 -4
+K -1  2  0 -1 -3  1  1 -2 -1 -3 -2  5 -1 -3 -1  0 -1 -3 -2 -2  0  1 -1 -4
+M -1 -1 -2 -3 -1  0 -2 -3 -2  1  2 -1  5  0 -2 -1 -1 -1 -1  1 -3 -1 -1 -4
+F -2 -3 -3 -3 -2 -3 -3 -3 -1  0  0 -3  0  6 -4 -2 -2  1  3 -1 -3 -3 -1 -4
+P -1 -2 -2 -1 -3 -1 -1 -2 -2 -3 -3 -1 -2 -4  7 -1 -1 -4 -3 -2 -2 -1 -2 -4
+S  1 -1  1  0 -1  0  0  0 -1 -2 -2  0 -1 -2 -1  4  1 -3 -2 -2  0  0  0 -4
+T  0 -1  0 -1 -1 -1 -1 -2 -2 -1 -1 -1 -1 -2 -1  1  5 -2 -2  0 -1 -1  0 -4
+W -3 -3 -4 -4 -2 -2 -3 -2 -2 -3 -2 -3 -1  1 -4 -3 -2 11  2 -3 -4 -3 -2 -4
+Y -2 -2 -2 -3 -2 -1 -2 -3  2 -1 -1 -2 -1  3 -3 -2 -2  2  7 -1 -3 -2 -1 -4
+V  0 -3 -3 -3 -1 -2 -2 -3 -3  3  1 -2  1 -1 -2 -2  0 -3 -1  4 -3 -2 -1 -4
+B -2 -1  3  4 -3  0  1 -1  0 -3 -4  0 -3 -3 -2  0 -1 -4 -3 -3  4  1 -1 -4
+Z -1  0  0  1 -3  3  4 -2  0 -3 -3  1 -1 -3 -1  0 -1 -3 -2 -2  1  4 -1 -4
+X  0 -1 -1 -1 -2 -1 -1 -1 -1 -1 -1 -1 -1 -1 -2  0  0 -2 -1 -1 -1 -1 -1 -4
+* -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4  1
+"""
+
+
+def create_matrix(match, mismatch):
+    """creates a substitution matrix with one score for
+    identical and one score for different characters -
+    same behaviour as the MATCH/ MISMATCH constants
+
+    Args:
+        match (int): reward for identical characters
+        mismatch (int): penalty for different characters
+
+    Returns:
+        numpy matrix: (alphabet, alphabet) substitution matrix
+    """
+    size = len(se.ALPHABET)
+    substitution_matrix = np.full((size, size), mismatch, dtype="int64")
+    np.fill_diagonal(substitution_matrix, match)
+    return substitution_matrix
+
+
+def create_dna_matrix(match, transition, transversion):
+    """creates a DNA substitution matrix, which penalizes
+    transitions (A<->G, C<->T) less than transversions
+
+    Args:
+        match (int): reward for identical bases
+        transition (int): penalty for purine/ purine and
+        pyrimidine/ pyrimidine substitutions
+        transversion (int): penalty for all other substitutions
+
+    Returns:
+        numpy matrix: (alphabet, alphabet) substitution matrix
+    """
+    substitution_matrix = create_matrix(match, transversion)
+    for base1, base2 in ("AG", "GA", "CT", "TC"):
+        substitution_matrix[se.encode(base1)[0], se.encode(base2)[0]] = transition
+    return substitution_matrix
+
+
+def parse_matrix(text):
+    """reads a substitution matrix in NCBI format (header line
+    with the residues, then one line per residue). Pairs missing
+    in the text get the lowest score of the matrix, the sentinel
+    scores 0 against itself.
+
+    Args:
+        text (str): matrix text, lines starting with # are ignored
+
+    Returns:
+        numpy matrix: (alphabet, alphabet) substitution matrix
+    """
+    lines = [
+        line.split()
+        for line in text.splitlines()
+        if line.strip() and not line.startswith("#")
+    ]
+    residues = lines[0]
+    scores = np.array([line[1:] for line in lines[1:]], dtype="int64")
+    codes = se.encode("".join(residues))
+    row_codes = se.encode("".join(line[0] for line in lines[1:]))
+
+    size = len(se.ALPHABET)
+    substitution_matrix = np.full((size, size), scores.min(), dtype="int64")
+    substitution_matrix[np.ix_(row_codes, codes)] = scores
+    substitution_matrix[se.SENTINEL_CODE, se.SENTINEL_CODE] = 0
+    return substitution_matrix
+
+
+def load_matrix(path):
+    """reads a substitution matrix file in NCBI format
+
+    Args:
+        path (str): path to the matrix file
+
+    Returns:
+        numpy matrix: (alphabet, alphabet) substitution matrix
+    """
+    with open(path) as matrix_file:
+        return parse_matrix(matrix_file.read())
+
+
+def query_profile(substitution_matrix, seq):
+    """precomputes the substitution scores of every residue
+    of the alphabet against every position of seq
+
+    Args:
+        substitution_matrix (numpy matrix): (alphabet, alphabet) scores
+        seq (str or numpy array): sequence of the scorematrix columns
+
+    Returns:
+        numpy matrix: (alphabet, len(seq)) - row c holds the scores
+        of residue c against seq
+    """
+    return substitution_matrix[:, se.as_codes(seq)]
+
+
+BLOSUM62 = parse_matrix(BLOSUM62_TEXT)
@@ -0,0 +1,178 @@
+# =============================================================================
+# Created By  : Dominique Zeise
+# GitHub      : https://github.com/CharliesCodes
+# Created Date: 2026/10/18
+# Version     : 1.0
+# © Copyright : 2026 Dominique Zeise
+# =============================================================================
+"""
+Generalized Suffix Automaton
+
+
+This module builds one suffix automaton for many sequences.
+Every substring of every sequence is a path from the root,
+all substrings ending in the same state occur in the same
+sequences. So it is enough to store once per state, which
+sequence contains its substrings - this finds all sequences
+that are part of another sequence in near linear time.
+"""
+# =============================================================================
+
+# owner of states with substrings of more than one sequence
+MULTIPLE = -2
+
+
+def create_automaton():
+    """creates an automaton with the root state only
+
+    Returns:
+        tuple: (transitions, links, lengths) - one entry per state:
+        char -> next state, suffix link, length of longest substring
+    """
+    return [{}], [-1], [0]
+
+
+def add_state(automaton, length, transitions=None, link=-1):
+    """appends a state to the automaton
+
+    Args:
+        automaton (tuple): see create_automaton
+        length (int): length of the longest substring of the state
+        transitions (dict, optional): outgoing transitions.
+        Defaults to None (no transitions).
+        link (int, optional): suffix link. Defaults to -1.
+
+    Returns:
+        int: index of the new state
+    """
+    all_transitions, links, lengths = automaton
+    all_transitions.append(dict(transitions or {}))
+    links.append(link)
+    lengths.append(length)
+    return len(lengths) - 1
+
+
+def split_state(automaton, p, q, char):
+    """clones state q for the shorter substrings reaching it
+    over char - needed, when a new sequence ends there
+
+    Args:
+        automaton (tuple): see create_automaton
+        p (int): state with the transition char -> q
+        q (int): state to clone
+        char (str): character of the transition
+
+    Returns:
+        int: index of the clone
+    """
+    transitions, links, lengths = automaton
+    clone = add_state(automaton, lengths[p] + 1, transitions[q], links[q])
+    while p != -1 and transitions[p].get(char) == q:
+        transitions[p][char] = clone
+        p = links[p]
+    links[q] = clone
+    return clone
+
+
+def extend(automaton, last, char):
+    """appends one character behind state last
+
+    Args:
+        automaton (tuple): see create_automaton
+        last (int): state of the sequence read so far
+        char (str): next character
+
+    Returns:
+        int: state of the extended sequence
+    """
+    transitions, links, lengths = automaton
+    # prefix already known from another sequence
+    if char in transitions[last]:
+        q = transitions[last][char]
+        if lengths[q] == lengths[last] + 1:
+            return q
+        return split_state(automaton, last, q, char)
+
+    current = add_state(automaton, lengths[last] + 1)
+    p = last
+    while p != -1 and char not in transitions[p]:
+        transitions[p][char] = current
+        p = links[p]
+    if p == -1:
+        links[current] = 0
+    else:
+        q = transitions[p][char]
+        if lengths[p] + 1 == lengths[q]:
+            links[current] = q
+        else:
+            links[current] = split_state(automaton, p, q, char)
+    return current
+
+
+def build_automaton(seqs):
+    """builds the generalized suffix automaton of all sequences
+
+    Args:
+        seqs (list): sequences
+
+    Returns:
+        tuple: automaton, see create_automaton
+    """
+    automaton = create_automaton()
+    for seq in seqs:
+        last = 0
+        for char in seq:
+            last = extend(automaton, last, char)
+    return automaton
+
+
+def find_owners(automaton, seqs):
+    """finds for every state, which sequence contains its
+    substrings. A state belongs to the sequences of its prefix
+    states (a sequence is read from the root) and the sequences
+    of all states linking to it - states are processed from
+    the longest to the shortest, so links are complete.
+
+    Args:
+        automaton (tuple): see create_automaton
+        seqs (list): sequences of the automaton
+
+    Returns:
+        owners (list): per state: index of the only sequence,
+        MULTIPLE or -1 (root)
+        end_states (list): state of every whole sequence
+    """
+    transitions, links, lengths = automaton
+    owners = [-1] * len(links)
+    end_states = []
+    for seq_index, seq in enumerate(seqs):
+        state = 0
+        for char in seq:
+            state = transitions[state][char]
+            if owners[state] == -1:
+                owners[state] = seq_index
+            elif owners[state] != seq_index:
+                owners[state] = MULTIPLE
+        end_states.append(state)
+
+    for state in sorted(range(1, len(links)), key=lengths.__getitem__, reverse=True):
+        owner, link = owners[state], links[state]
+        if owners[link] == -1:
+            owners[link] = owner
+        elif owners[link] != owner:
+            owners[link] = MULTIPLE
+    return owners, end_states
+
+
+def find_contained(seqs):
+    """checks for every sequence, if it is part of another one
+
+    Args:
+        seqs (list): unique sequences
+
+    Returns:
+        list: True for sequences contained in another sequence
+    """
+    automaton = build_automaton(seqs)
+    owners, end_states = find_owners(automaton, seqs)
+    return [owners[state] == MULTIPLE for state in end_states]
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# the modules import each other by file name
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "algorithms"))
@@ -0,0 +1,50 @@
+import needleman_wunsch as nw
+import sequence_encoding as se
+import smith_waterman as sw
+import substitution_matrices as sm
+
+
+def alignment_score(seq1_new, seq2_new, substitution_matrix, gap):
+    # traceback format: reversed, last column is dropped by output
+    score = 0
+    for char1, char2 in zip(seq1_new[:-1], seq2_new[:-1]):
+        if "_" in (char1, char2):
+            score += gap
+        else:
+            score += int(substitution_matrix[se.encode(char2)[0], se.encode(char1)[0]])
+    return score
+
+
+def test_needleman_wunsch_alignment_has_the_optimal_score():
+    seq1, seq2 = ",HEAGAWGHEE,", ",PAWHEAE,"
+    ls1, ls2 = len(seq1), len(seq2)
+    score, _ = nw.calculate_score(seq1, seq2, sm.BLOSUM62)
+    assert score == 22
+    pointer_matrix, _, _ = nw.calculate_pointermatrix(
+        ls1, ls2, seq1, seq2, sm.BLOSUM62
+    )
+    alignments = [
+        nw.traceback_pointers(pointer_matrix, ls1, ls2, seq1, seq2),
+        nw.banded_alignment(seq1, seq2, substitution_matrix=sm.BLOSUM62),
+        nw.hirschberg_traceback(seq1, seq2, sm.BLOSUM62),
+    ]
+    for seq1_new, seq2_new in alignments:
+        assert alignment_score(seq1_new, seq2_new, sm.BLOSUM62, nw.GAP) == score
+        # sentinels are never aligned against residues
+        assert "," not in seq1_new[:-1] + seq2_new[:-1]
+
+
+def test_smith_waterman_alignment_has_the_optimal_score():
+    seq1, seq2 = ",HEAGAWGHEE", ",PAWHEAE"
+    score, _ = sw.calculate_score(seq1, seq2, sm.BLOSUM62)
+    assert score == 29
+    pointer_matrix, _, max_coords = sw.calculate_pointermatrix(
+        len(seq1), len(seq2), seq1, seq2, sm.BLOSUM62
+    )
+    _, _, checkpoints = sw.scan_query_profile(seq1, seq2, sm.BLOSUM62, interval=2)
+    alignments = [
+        sw.traceback_pointers(pointer_matrix, seq1, seq2, max_coords),
+        sw.traceback_region(seq1, seq2, max_coords, checkpoints, sm.BLOSUM62),
+    ]
+    for seq1_new, seq2_new in alignments:
+        assert alignment_score(seq1_new, seq2_new, sm.BLOSUM62, sw.GAP) == score
@@ -0,0 +1,41 @@
+import numpy as np
+
+import de_bruijn as db
+import kmer_sketch as ks
+import read_simulator as rs
+
+
+def error_free_reads(seed=0, length=3000, coverage=4):
+    rng = np.random.default_rng(seed)
+    reference = rs.random_sequence(length, rng)
+    batches = rs.simulate_reads(
+        reference,
+        rng,
+        coverage=coverage,
+        read_length=100,
+        substitution_rate=0,
+        insertion_rate=0,
+        deletion_rate=0,
+    )
+    return [read for reads, _ in batches for read in reads]
+
+
+def test_sketch_counts_do_not_depend_on_batch_size():
+    reads = error_free_reads()
+    exact_kmers, exact_counts, _ = db.count_kmers(reads, 21)
+    solid = exact_counts >= 2
+    for batch_size in (4096, 50, 7):
+        sketch = ks.create_sketch(64 * 1024**2)
+        kmers, counts, _ = db.count_kmers(
+            reads, 21, batch_size, sketch=sketch, min_count=2
+        )
+        assert np.array_equal(kmers, exact_kmers[solid])
+        assert np.array_equal(counts, exact_counts[solid])
+
+
+def test_sketch_assembly_matches_exact_assembly():
+    reads = error_free_reads()
+    exact_contigs, _ = db.assemble(reads, 21, 2)
+    contigs, stats = db.assemble(reads, 21, 2, sketch_memory=64 * 1024**2)
+    assert contigs == exact_contigs
+    assert stats["false_positive_rate"] < 1e-6
@@ -0,0 +1,19 @@
+import greedy_assembly as ga
+
+PART = ",GATCATTAGTTGTGCCGCAGCGAAGTAGTGCTTGAGACCAAATATGCGACCCCTAAGTAG"
+# ends with the first 40 positions of PART, one substitution (C -> T)
+# 3 positions before the end -> by chance also ends with "GATCA"
+WINDOW = ",GAGCGTATGCGCCCAGTAACCAATGATCATTAGTTGTGCCGCAGCGAAGTAGTGCTTGAGATCA"
+
+
+def test_short_exact_overlap_does_not_hide_longer_overlap():
+    matches, exact = ga.end_overlap(WINDOW, PART, True)
+    assert (matches, exact) == (39, False)
+    merged = ga.merge_part(WINDOW, WINDOW, PART, True)
+    assert merged == WINDOW + PART[41:]
+
+
+def test_exact_overlap_skips_alignment_if_nothing_can_beat_it():
+    window = ",ACGTTGCA" + PART[1:56]
+    assert ga.end_overlap(window, PART, True) == (55, True)
+    assert ga.merge_part(window, window, PART, True) == window + PART[56:]
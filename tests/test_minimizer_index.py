@@ -0,0 +1,39 @@
+import numpy as np
+
+import mapping_assembly as ma
+import minimizer_index as mi
+import read_simulator as rs
+import sequence_encoding as se
+
+
+def simulated_reads(seed=0, length=5000, **error_rates):
+    rng = np.random.default_rng(seed)
+    reference = rs.random_sequence(length, rng)
+    batches = rs.simulate_reads(
+        reference, rng, coverage=6, read_length=150, paired=True, **error_rates
+    )
+    reads, truth = [], []
+    for batch_reads, batch_truth in batches:
+        reads.extend(se.decode(read) for read in batch_reads)
+        truth.extend(batch_truth)
+    return se.decode(reference), reads, truth
+
+
+def test_reads_of_both_strands_are_mapped():
+    reference, reads, truth = simulated_reads(
+        substitution_rate=0, insertion_rate=0, deletion_rate=0
+    )
+    index = mi.build_index(reference)
+    for read, (_, start, end, strand) in zip(reads, truth):
+        assert mi.map_read(read, reference, index) == (start, end, len(read), strand)
+
+
+def test_reference_mapping_uses_reverse_strand_reads(capsys):
+    reference, reads, truth = simulated_reads(
+        seed=1, substitution_rate=0, insertion_rate=0, deletion_rate=0
+    )
+    # second read of every pair only -> all from the reverse strand
+    reverse_reads = [read for read, row in zip(reads, truth) if row[3] == "-"]
+    assembly_sequence = ma.reference_mapping(reverse_reads, reference)
+    assert assembly_sequence[1:] == reference
+    assert "could not be mapped" not in capsys.readouterr().out
@@ -0,0 +1,44 @@
+import numpy as np
+
+import minimizer_index as mi
+import pileup
+import sequence_encoding as se
+
+RNG = np.random.default_rng(7)
+REFERENCE = "".join(RNG.choice(list("ACGT"), 400))
+# read offsets of the substitutions - two at each read end
+SNP_OFFSETS = [0, 2, 60, 117, 119]
+
+
+def substitute(read, offsets):
+    read = list(read)
+    for offset in offsets:
+        read[offset] = "A" if read[offset] != "A" else "C"
+    return "".join(read)
+
+
+def counted_bases(counts):
+    # position -> counted base of a pileup with one read
+    positions, codes = np.nonzero(counts)
+    return dict(zip(positions.tolist(), se.decode(codes.astype("uint8"))))
+
+
+def test_substitutions_near_read_ends_are_counted_in_place():
+    read = substitute(REFERENCE[100:220], SNP_OFFSETS)
+    index = mi.build_index(REFERENCE)
+    start, end, _, strand = mi.map_read(read, REFERENCE, index)
+    assert (start, end, strand) == (100, 220, "+")
+    counts = pileup.create_pileup(len(REFERENCE))
+    pileup.add_mapped_reads(counts, REFERENCE, [start], [end], [read])
+    assert counted_bases(counts) == dict(zip(range(100, 220), read))
+
+
+def test_substitutions_next_to_a_deletion_are_counted_in_place():
+    # deletion of reference position 175 (unlike both neighbors)
+    read = substitute(REFERENCE[100:175] + REFERENCE[176:220], SNP_OFFSETS[:4])
+    index = mi.build_index(REFERENCE)
+    start, end, _, _ = mi.map_read(read, REFERENCE, index)
+    counts = pileup.create_pileup(len(REFERENCE))
+    pileup.add_mapped_reads(counts, REFERENCE, [start], [end], [read])
+    positions = list(range(100, 175)) + list(range(176, 220))
+    assert counted_bases(counts) == dict(zip(positions, read))
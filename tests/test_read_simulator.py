@@ -0,0 +1,63 @@
+import numpy as np
+
+import read_simulator as rs
+
+NO_ERRORS = {"substitution_rate": 0, "insertion_rate": 0, "deletion_rate": 0}
+
+
+def simulate(reference, rng, **options):
+    reads, truth = [], []
+    for batch_reads, batch_truth in rs.simulate_reads(reference, rng, **options):
+        reads += batch_reads
+        truth += batch_truth
+    return reads, truth
+
+
+def test_variable_lengths_reach_the_coverage():
+    rng = np.random.default_rng(0)
+    reference = rs.random_sequence(100000, rng)
+    reads, _ = simulate(reference, rng, coverage=10, read_length=150, min_length=50)
+    coverage = sum(len(read) for read in reads) / len(reference)
+    assert abs(coverage - 10) < 0.2
+
+
+def test_paired_reads_come_from_the_fragment_ends():
+    rng = np.random.default_rng(1)
+    reference = rs.random_sequence(5000, rng)
+    reads, truth = simulate(
+        reference, rng, coverage=5, paired=True, batch_size=101, **NO_ERRORS
+    )
+    assert len(reads) % 2 == 0
+    for read, (name, start, end, strand) in zip(reads, truth):
+        expected = reference[start:end]
+        if strand == "-":
+            expected = rs.reverse_complement(expected)
+        assert np.array_equal(read, expected), name
+    for (name1, start1, _, _), (name2, _, end2, _) in zip(truth[::2], truth[1::2]):
+        assert name1[:-2] == name2[:-2]
+        assert end2 - start1 >= 150
+
+
+def test_paired_fragments_are_clipped_to_the_reference():
+    rng = np.random.default_rng(2)
+    # fragments of about 400 bp never fit into 300 bp
+    reference = rs.random_sequence(300, rng)
+    reads, truth = simulate(reference, rng, coverage=20, paired=True, **NO_ERRORS)
+    assert reads
+    for read, (_, start, end, strand) in zip(reads, truth):
+        assert 0 <= start < end <= len(reference)
+        assert len(read) == 150
+    # a pair spans at most the whole reference
+    for (_, start1, _, _), (_, _, end2, _) in zip(truth[::2], truth[1::2]):
+        assert end2 - start1 <= len(reference)
+
+
+def test_paired_reads_of_a_short_reference():
+    rng = np.random.default_rng(3)
+    reference = rs.random_sequence(100, rng)
+    reads, truth = simulate(
+        reference, rng, coverage=4, paired=True, batch_size=1, **NO_ERRORS
+    )
+    assert reads
+    assert all(len(read) == 100 for read in reads)
+    assert all((start, end) == (0, 100) for _, start, end, _ in truth)